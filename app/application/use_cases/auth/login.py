@@ -6,6 +6,7 @@ from uuid_extensions import uuid7
 
 from app.domain.entities.auth import AuthSession, Token
 from app.domain.exceptions import AuthenticationException
+from app.domain.interfaces.password_hasher import IPasswordHasher
 from app.domain.interfaces.token_service import ITokenService
 from app.domain.interfaces.uow import IUOW
 
@@ -13,19 +14,35 @@ from app.domain.interfaces.uow import IUOW
 class LoginUseCase:
     """Use case для логина пользователя."""
 
-    def __init__(self, uow: IUOW, token_service: ITokenService):
+    def __init__(
+        self,
+        uow: IUOW,
+        token_service: ITokenService,
+        password_hasher: IPasswordHasher,
+    ):
         """Инициализирует use case для логина."""
         self.uow = uow
         self.token_service = token_service
+        self.password_hasher = password_hasher
 
     async def execute(self, email: str, password: str) -> Token:
         """Авторизует пользователя и возвращает токены."""
         async with self.uow:
-            user = await self.uow.users.find_by_email(email)
-            if not user or not user.verify_password(password):
+            # Хэш пароля читаем в обход кэша: он мог смениться в другом процессе
+            user = await self.uow.users.find_by_email(email, use_cache=False)
+            if not user or not await self.password_hasher.verify(
+                password, user.hashed_password
+            ):
                 raise AuthenticationException(message="Неверный email или пароль")
 
-            access_token = self.token_service.generate_access_token(user.email)
+            # Перехэшируем пароль, если он создан с устаревшей стоимостью
+            if self.password_hasher.needs_update(user.hashed_password):
+                user.hashed_password = await self.password_hasher.hash(password)
+                await self.uow.users.update_password(user.email, user.hashed_password)
+
+            access_token = self.token_service.generate_access_token(
+                user.email, user=user
+            )
             refresh_token = self.token_service.generate_refresh_token()
             expires_at = self.token_service.get_refresh_token_expires_at()
 
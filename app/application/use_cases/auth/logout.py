@@ -16,10 +16,8 @@ class LogoutUseCase:
     async def execute(self) -> None:
         """Выполняет выход пользователя из системы."""
         async with self.uow:
-            auth_session = await self.uow.auth_sessions.find_by_refresh_token(
+            auth_session = await self.uow.auth_sessions.pop_by_refresh_token(
                 self.refresh_token
             )
             if not auth_session:
                 raise RefreshTokenException(message="Сессия не найдена")
-
-            await self.uow.auth_sessions.delete_by_refresh_token(self.refresh_token)
@@ -0,0 +1,54 @@
+"""Use Case для удаления истекших авторизационных сессий."""
+
+import asyncio
+import itertools
+from collections.abc import Callable
+
+from app.domain.interfaces.uow import IUOW
+from app.infrastructure.logging.logger import log_info
+
+
+class PurgeExpiredSessionsUseCase:
+    """Удаляет истекшие авторизационные сессии ограниченными пачками.
+
+    Каждая пачка удаляется в своей транзакции, чтобы не держать долгие
+    блокировки. Между пачками делается пауза; если is_busy() сообщает о
+    нагрузке, удаление откладывается до следующего запуска.
+    """
+
+    def __init__(
+        self,
+        uow_factory: Callable[[], IUOW],
+        batch_size: int = 1000,
+        max_batches: int | None = None,
+        batch_pause: float = 0.0,
+        is_busy: Callable[[], bool] | None = None,
+    ):
+        self.uow_factory = uow_factory
+        self.batch_size = batch_size
+        self.max_batches = max_batches
+        self.batch_pause = batch_pause
+        self.is_busy = is_busy
+
+    async def execute(self) -> int:
+        """Удаляет истекшие сессии и возвращает их количество."""
+        batches = (
+            range(self.max_batches)
+            if self.max_batches is not None
+            else itertools.count()
+        )
+        purged = 0
+        for batch in batches:
+            if self.is_busy is not None and self.is_busy():
+                log_info("Удаление истекших сессий отложено из-за нагрузки")
+                break
+            if batch and self.batch_pause:
+                await asyncio.sleep(self.batch_pause)
+
+            async with self.uow_factory() as uow:
+                deleted = await uow.auth_sessions.delete_expired(self.batch_size)
+            purged += deleted
+            if deleted < self.batch_size:
+                break
+
+        return purged
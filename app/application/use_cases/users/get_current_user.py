@@ -2,24 +2,41 @@
 
 from app.domain.entities.user import User
 from app.domain.exceptions import AuthenticationException
+from app.domain.interfaces.token_cache import ITokenCache
 from app.domain.interfaces.token_service import ITokenService
 from app.domain.interfaces.uow import IUOW
 
 
 class GetCurrentUserUseCase:
-    """Получение текущего пользователя."""
+    """Получение текущего пользователя.
 
-    def __init__(self, uow: IUOW, token_service: ITokenService, token: str):
+    При trust_token_claims=True пользователь собирается из claims access-токена
+    без запроса к БД. Если нужны актуальные данные, вызывайте execute(fresh=True).
+    """
+
+    def __init__(
+        self,
+        uow: IUOW,
+        token_service: ITokenService,
+        token: str,
+        token_cache: ITokenCache,
+        trust_token_claims: bool = False,
+    ):
         self.uow = uow
         self.token_service = token_service
         self.token = token
+        self.token_cache = token_cache
+        self.trust_token_claims = trust_token_claims
 
-    async def execute(self) -> User:
+    async def execute(self, fresh: bool = False) -> User:
         """Возвращает текущего пользователя."""
         try:
             if not self.token or self.token == "":
                 raise AuthenticationException("Access токен не найден")
-            payload = self.token_service.decode_access_token(self.token)
+            payload = self.token_cache.get(self.token)
+            if payload is None:
+                payload = self.token_service.decode_access_token(self.token)
+                self.token_cache.put(self.token, payload)
             email = payload.get("sub")
             if not email:
                 raise AuthenticationException("Не удалось извлечь email из токена")
@@ -27,7 +44,18 @@ class GetCurrentUserUseCase:
             error_msg = f"Ошибка при декодировании токена: {str(e)}"
             raise AuthenticationException(error_msg) from e
 
-        current_user = await self.uow.users.find_by_email(email=email)
+        if self.trust_token_claims and not fresh:
+            user = self.token_service.user_from_claims(payload)
+            if user:
+                return user
+
+        try:
+            current_user = await self.uow.users.find_by_email(
+                email=email, use_cache=not fresh
+            )
+        finally:
+            # Дальше запрос к БД не обращается - соединение больше не нужно
+            await self.uow.release()
         if not current_user:
             raise AuthenticationException("Пользователь не найден")
 
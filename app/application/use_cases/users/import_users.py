@@ -0,0 +1,150 @@
+"""Use case для массового импорта пользователей."""
+
+import asyncio
+import re
+import time
+from collections.abc import AsyncIterable, Callable
+from datetime import UTC, datetime
+
+from app.application.use_cases.base import UseCase
+from app.domain.entities.user import User
+from app.domain.entities.user_import import UserImportReport, UserImportRow
+from app.domain.interfaces.password_hasher import IPasswordHasher
+from app.domain.interfaces.user_bulk_loader import IUserBulkLoader
+from app.infrastructure.logging.logger import log_info
+from app.infrastructure.monitoring.metrics import metrics
+
+BCRYPT_HASH = re.compile(r"^\$2[abxy]?\$\d{2}\$[./A-Za-z0-9]{53}$")
+EMAIL = re.compile(r"^[^@\s]+@[^@\s]+\.[^@\s]+$")
+# Как в UserCreate
+MIN_PASSWORD_LENGTH = 8
+MAX_PASSWORD_LENGTH = 100
+
+
+def validate_row(row: UserImportRow) -> str | None:
+    """Проверяет строку импорта и возвращает описание ошибки."""
+    if row.error:
+        return row.error
+    if not EMAIL.match(row.email) or len(row.email) > 100:
+        return f"некорректный email {row.email!r}"
+    if row.hashed_password is not None:
+        if not BCRYPT_HASH.match(row.hashed_password):
+            return "hashed_password не является bcrypt-хэшем"
+        return None
+    if row.password is None:
+        return "не задан password или hashed_password"
+    if not MIN_PASSWORD_LENGTH <= len(row.password) <= MAX_PASSWORD_LENGTH:
+        return (
+            f"длина пароля должна быть от {MIN_PASSWORD_LENGTH} "
+            f"до {MAX_PASSWORD_LENGTH} символов"
+        )
+    return None
+
+
+class ImportUsersUseCase(UseCase[UserImportReport]):
+    """Массовый импорт пользователей из потока строк.
+
+    Строки собираются в пачки по batch_size. Пароли пачки хэшируются в
+    пуле процессов, пока предыдущая пачка загружается в базу, так что
+    хэширование и COPY идут параллельно. Некорректные строки и уже
+    существующие email не прерывают импорт, а попадают в отчет.
+    """
+
+    def __init__(
+        self,
+        loader: IUserBulkLoader,
+        password_hasher: IPasswordHasher,
+        batch_size: int = 1000,
+        max_reported: int = 100,
+    ):
+        """Инициализирует use case импорта."""
+        self.loader = loader
+        self.password_hasher = password_hasher
+        self.batch_size = batch_size
+        self.max_reported = max_reported
+
+    async def execute(
+        self,
+        rows: AsyncIterable[UserImportRow],
+        on_progress: Callable[[UserImportReport], None] | None = None,
+    ) -> UserImportReport:
+        """Импортирует пользователей и возвращает отчет."""
+        report = UserImportReport()
+        started = time.perf_counter()
+        loading: asyncio.Task | None = None
+        batch: list[UserImportRow] = []
+
+        async def flush() -> None:
+            nonlocal loading
+            users = await self._prepare(batch)
+            if loading is not None:
+                await loading
+            loading = asyncio.create_task(
+                self._load(users, report, started, on_progress)
+            )
+
+        try:
+            async for row in rows:
+                report.processed += 1
+                error = validate_row(row)
+                if error is not None:
+                    report.invalid += 1
+                    if len(report.errors) < self.max_reported:
+                        report.errors.append(f"строка {row.line}: {error}")
+                    continue
+
+                batch.append(row)
+                if len(batch) >= self.batch_size:
+                    await flush()
+                    batch = []
+
+            if batch:
+                await flush()
+            if loading is not None:
+                await loading
+        except BaseException:
+            if loading is not None:
+                loading.cancel()
+            raise
+
+        report.elapsed = time.perf_counter() - started
+        metrics.inc("user_import_rows", report.invalid, result="invalid")
+        log_info("Импорт пользователей завершен", **report.progress())
+        return report
+
+    async def _prepare(self, batch: list[UserImportRow]) -> list[User]:
+        """Хэширует открытые пароли пачки и строит пользователей."""
+        passwords = [row.password for row in batch if row.hashed_password is None]
+        hashes = iter(await self.password_hasher.hash_many(passwords))
+        now = datetime.now(UTC)
+        return [
+            User(
+                email=row.email,
+                hashed_password=row.hashed_password or next(hashes),
+                is_active=row.is_active,
+                is_verified=row.is_verified,
+                created_at=now,
+            )
+            for row in batch
+        ]
+
+    async def _load(
+        self,
+        users: list[User],
+        report: UserImportReport,
+        started: float,
+        on_progress: Callable[[UserImportReport], None] | None,
+    ) -> None:
+        """Загружает пачку и обновляет отчет."""
+        conflicts = await self.loader.load(users)
+        imported = len(users) - len(conflicts)
+        report.imported += imported
+        report.conflicts += len(conflicts)
+        room = self.max_reported - len(report.conflict_emails)
+        report.conflict_emails.extend(conflicts[: max(room, 0)])
+        report.elapsed = time.perf_counter() - started
+
+        metrics.inc("user_import_rows", imported, result="imported")
+        metrics.inc("user_import_rows", len(conflicts), result="conflict")
+        if on_progress is not None:
+            on_progress(report)
@@ -19,14 +19,13 @@ class RegisterUserUseCase(UseCase[User]):
         log_info(f"Регистрация нового пользователя с email: {user.email}")
 
         async with self.uow:
-            existing_user = await self.uow.users.find_by_email(user.email)
-            if existing_user:
+            user_email = await self.uow.users.create_if_not_exists(user=user)
+            if user_email is None:
                 log_warning(f"Пользователь с email {user.email} уже существует")
                 raise ValidationException(
                     message=f"Пользователь с email {user.email} уже существует"
                 )
 
-            user_email = await self.uow.users.create_user(user=user)
             log_info(f"Пользователь с email {user_email} успешно зарегистрирован")
 
             return user_email
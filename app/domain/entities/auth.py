@@ -3,7 +3,7 @@ from datetime import datetime
 from uuid import UUID
 
 
-@dataclass
+@dataclass(slots=True)
 class AuthSession:
     """Доменная модель авторизационной сессии."""
 
@@ -15,7 +15,7 @@ class AuthSession:
     updated_at: datetime | None = None
 
 
-@dataclass
+@dataclass(slots=True)
 class Token:
     """Доменная модель токена."""
 
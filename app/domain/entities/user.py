@@ -3,12 +3,8 @@
 from dataclasses import dataclass
 from datetime import UTC, datetime
 
-from passlib.context import CryptContext
 
-pwd_context = CryptContext(schemes=["bcrypt"], deprecated="auto")
-
-
-@dataclass
+@dataclass(slots=True)
 class User:
     """Доменная модель пользователя."""
 
@@ -18,7 +14,3 @@ class User:
     is_verified: bool = False
     created_at: datetime | None = datetime.now(UTC)
     updated_at: datetime | None = None
-
-    def verify_password(self, plain_password: str) -> bool:
-        """Проверяет, совпадает ли переданный пароль с хэшированным паролем."""
-        return pwd_context.verify(plain_password, self.hashed_password)
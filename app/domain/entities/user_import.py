@@ -0,0 +1,58 @@
+"""Доменные модели массового импорта пользователей."""
+
+from dataclasses import dataclass, field
+
+
+@dataclass(slots=True)
+class UserImportRow:
+    """Строка файла импорта.
+
+    Пароль задается открытым текстом (password) или готовым bcrypt-хэшем
+    (hashed_password). error заполняется, если строку не удалось разобрать.
+    """
+
+    line: int
+    email: str
+    password: str | None = None
+    hashed_password: str | None = None
+    is_active: bool = True
+    is_verified: bool = False
+    error: str | None = None
+
+
+@dataclass(slots=True)
+class UserImportReport:
+    """Ход и результат импорта."""
+
+    processed: int = 0
+    imported: int = 0
+    conflicts: int = 0
+    invalid: int = 0
+    elapsed: float = 0.0
+    # Первые конфликтующие email и ошибки разбора, не более max_reported
+    conflict_emails: list[str] = field(default_factory=list)
+    errors: list[str] = field(default_factory=list)
+
+    @property
+    def rows_per_second(self) -> float:
+        """Скорость обработки строк."""
+        return self.processed / self.elapsed if self.elapsed else 0.0
+
+    def progress(self) -> dict:
+        """Счетчики хода импорта."""
+        return {
+            "processed": self.processed,
+            "imported": self.imported,
+            "conflicts": self.conflicts,
+            "invalid": self.invalid,
+            "elapsed": round(self.elapsed, 3),
+            "rows_per_second": round(self.rows_per_second, 1),
+        }
+
+    def as_dict(self) -> dict:
+        """Итог импорта с примерами конфликтов и ошибок."""
+        return {
+            **self.progress(),
+            "conflict_emails": self.conflict_emails,
+            "errors": self.errors,
+        }
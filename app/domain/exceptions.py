@@ -90,3 +90,27 @@ class RefreshTokenException(TokenException):
         details: dict[str, Any] | None = None,
     ):
         super().__init__(message, details)
+
+
+class ServiceUnavailableException(DomainException):
+    """Исключение для случаев, когда сервис временно перегружен."""
+
+    def __init__(
+        self,
+        message: str = "Сервис временно недоступен, повторите попытку позже",
+        details: dict[str, Any] | None = None,
+    ):
+        super().__init__(message, details)
+
+
+class RateLimitException(DomainException):
+    """Исключение для превышения лимита частоты запросов."""
+
+    def __init__(
+        self,
+        retry_after: float,
+        message: str = "Слишком много запросов, повторите попытку позже",
+        details: dict[str, Any] | None = None,
+    ):
+        self.retry_after = retry_after
+        super().__init__(message, details)
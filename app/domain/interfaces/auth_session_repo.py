@@ -5,6 +5,7 @@ from datetime import datetime
 from uuid import UUID
 
 from app.domain.entities.auth import AuthSession
+from app.domain.entities.user import User
 
 
 class IAuthSessionRepository(ABC):
@@ -31,3 +32,24 @@ class IAuthSessionRepository(ABC):
     async def delete_by_refresh_token(self, refresh_token: UUID) -> None:
         """Удаляет авторизационную сессию по refresh token."""
         pass
+
+    @abstractmethod
+    async def pop_by_refresh_token(self, refresh_token: UUID) -> AuthSession | None:
+        """Удаляет сессию по refresh token и возвращает ее (None - не найдена)."""
+        pass
+
+    @abstractmethod
+    async def rotate_refresh_token(
+        self, refresh_token: UUID, new_refresh_token: UUID, expires_at: datetime
+    ) -> User | None:
+        """Заменяет действующий refresh token новым одним запросом.
+
+        Возвращает владельца сессии или None, если сессии с таким токеном
+        нет или ее срок истек.
+        """
+        pass
+
+    @abstractmethod
+    async def delete_expired(self, batch_size: int) -> int:
+        """Удаляет не более batch_size истекших сессий и возвращает их число."""
+        pass
@@ -0,0 +1,28 @@
+"""Интерфейс для сервиса хэширования паролей."""
+
+from abc import ABC, abstractmethod
+from collections.abc import Sequence
+
+
+class IPasswordHasher(ABC):
+    """Интерфейс для сервиса хэширования паролей."""
+
+    @abstractmethod
+    async def hash(self, password: str) -> str:
+        """Хэширует пароль."""
+        pass
+
+    @abstractmethod
+    async def hash_many(self, passwords: Sequence[str]) -> list[str]:
+        """Хэширует пачку паролей."""
+        pass
+
+    @abstractmethod
+    async def verify(self, password: str, hashed_password: str) -> bool:
+        """Проверяет, совпадает ли пароль с хэшированным паролем."""
+        pass
+
+    @abstractmethod
+    def needs_update(self, hashed_password: str) -> bool:
+        """Проверяет, нужно ли перехэшировать пароль с текущими параметрами."""
+        pass
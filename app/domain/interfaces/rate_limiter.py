@@ -0,0 +1,16 @@
+"""Интерфейс для хранилища состояния ограничителя частоты запросов."""
+
+from abc import ABC, abstractmethod
+
+
+class IRateLimitBackend(ABC):
+    """Интерфейс для хранилища счетчиков ограничителя частоты запросов."""
+
+    @abstractmethod
+    async def hit(self, key: str, limit: int, window: float) -> float:
+        """Учитывает запрос по ключу.
+
+        Возвращает 0, если лимит не превышен, иначе количество секунд,
+        через которое можно повторить попытку.
+        """
+        pass
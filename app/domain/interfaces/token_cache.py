@@ -0,0 +1,17 @@
+"""Интерфейс для кэша проверенных access-токенов."""
+
+from abc import ABC, abstractmethod
+
+
+class ITokenCache(ABC):
+    """Интерфейс для кэша раскодированных access-токенов."""
+
+    @abstractmethod
+    def get(self, token: str) -> dict | None:
+        """Возвращает раскодированные claims токена, если они есть в кэше."""
+        pass
+
+    @abstractmethod
+    def put(self, token: str, claims: dict) -> None:
+        """Сохраняет раскодированные claims токена до истечения его срока."""
+        pass
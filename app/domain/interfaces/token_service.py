@@ -4,12 +4,14 @@ from abc import ABC, abstractmethod
 from datetime import datetime
 from uuid import UUID
 
+from app.domain.entities.user import User
+
 
 class ITokenService(ABC):
     """Интерфейс для сервиса работы с токенами."""
 
     @abstractmethod
-    def generate_access_token(self, email: str) -> str:
+    def generate_access_token(self, email: str, user: User | None = None) -> str:
         """Генерирует access token."""
         pass
 
@@ -18,6 +20,11 @@ class ITokenService(ABC):
         """Декодирует access token."""
         pass
 
+    @abstractmethod
+    def user_from_claims(self, claims: dict) -> User | None:
+        """Собирает пользователя из claims токена, если они там есть."""
+        pass
+
     @abstractmethod
     def generate_refresh_token(self) -> UUID:
         """Генерирует refresh token."""
@@ -15,6 +15,15 @@ class IUOW(ABC):
         """Откатывает все изменения."""
         raise NotImplementedError
 
+    @abstractmethod
+    async def release(self) -> None:
+        """Возвращает соединение в пул, не дожидаясь конца запроса.
+
+        Незафиксированные изменения откатываются. UOW остается пригодным:
+        следующий запрос снова возьмет соединение из пула.
+        """
+        raise NotImplementedError
+
     @abstractmethod
     async def __aenter__(self):
         """Вход в контекстный менеджер."""
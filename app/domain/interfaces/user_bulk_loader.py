@@ -0,0 +1,15 @@
+"""Интерфейс массовой загрузки пользователей."""
+
+from abc import ABC, abstractmethod
+from collections.abc import Sequence
+
+from app.domain.entities.user import User
+
+
+class IUserBulkLoader(ABC):
+    """Интерфейс массовой загрузки пользователей."""
+
+    @abstractmethod
+    async def load(self, users: Sequence[User]) -> list[str]:
+        """Создает пользователей и возвращает email тех, что уже существовали."""
+        pass
@@ -9,11 +9,28 @@ class IUserRepository(ABC):
     """Интерфейс репозитория для работы с пользователями."""
 
     @abstractmethod
-    async def find_by_email(self, email: str) -> User | None:
-        """Ищет пользователя по email."""
+    async def find_by_email(self, email: str, use_cache: bool = True) -> User | None:
+        """Ищет пользователя по email.
+
+        use_cache=False - прочитать актуальные данные в обход кэша, если он есть.
+        """
         pass
 
     @abstractmethod
     async def create_user(self, user: User) -> str:
         """Создает нового пользователя."""
         pass
+
+    @abstractmethod
+    async def create_if_not_exists(self, user: User) -> str | None:
+        """Создает пользователя одним запросом.
+
+        Возвращает email созданного пользователя или None, если пользователь
+        с таким email уже существует.
+        """
+        pass
+
+    @abstractmethod
+    async def update_password(self, email: str, hashed_password: str) -> None:
+        """Обновляет хэш пароля пользователя."""
+        pass
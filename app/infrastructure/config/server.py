@@ -0,0 +1,103 @@
+"""Параметры запуска HTTP-сервера uvicorn (cli.py serve)."""
+
+import math
+import os
+from importlib.util import find_spec
+from pathlib import Path
+
+from app.infrastructure.config.settings import Settings
+from app.infrastructure.services.password_hasher import PasswordHasher
+
+APP_MODULE = "app.main:app"
+CGROUP_CPU_MAX = Path("/sys/fs/cgroup/cpu.max")
+
+# Реализация -> модуль, без которого она недоступна
+LOOP_IMPLEMENTATIONS = {"uvloop": "uvloop", "asyncio": None}
+HTTP_IMPLEMENTATIONS = {"httptools": "httptools", "h11": "h11"}
+
+
+def available_cpus(cpu_max: Path = CGROUP_CPU_MAX) -> int:
+    """Число CPU, доступных процессу, с учетом affinity и квоты cgroup v2.
+
+    В контейнере os.cpu_count() возвращает все CPU хоста, а реальный
+    лимит задан квотой в cpu.max ("<quota> <period>" или "max <period>").
+    """
+    cpus = os.process_cpu_count() or 1
+    try:
+        quota, period = cpu_max.read_text().split()
+    except (OSError, ValueError):
+        return cpus
+    if quota == "max":
+        return cpus
+    return max(1, min(cpus, math.ceil(int(quota) / int(period))))
+
+
+def _resolve(value: str, implementations: dict[str, str | None]) -> str:
+    """Выбирает первую установленную реализацию или проверяет заданную."""
+    candidates = implementations if value == "auto" else [value]
+    for name in candidates:
+        module = implementations[name]
+        if module is None or find_spec(module) is not None:
+            return name
+    raise RuntimeError(f"{value} не установлен, выполните: uv pip install {value}")
+
+
+def resolve_loop(value: str) -> str:
+    """Цикл событий: uvloop, если установлен, иначе asyncio."""
+    return _resolve(value, LOOP_IMPLEMENTATIONS)
+
+
+def resolve_http(value: str) -> str:
+    """HTTP-парсер: httptools, если установлен, иначе h11."""
+    return _resolve(value, HTTP_IMPLEMENTATIONS)
+
+
+def resolve_workers(settings: Settings) -> int:
+    """Число воркеров: из настроек или по числу доступных CPU."""
+    return settings.SERVER_WORKERS or available_cpus()
+
+
+def worker_environment(settings: Settings, workers: int) -> dict[str, str]:
+    """Переменные окружения, которые нужно передать воркерам.
+
+    Пул хэширования паролей по умолчанию занимает все CPU в каждом
+    воркере; при нескольких воркерах CPU делятся между ними.
+    """
+    if settings.PASSWORD_HASHER_WORKERS is not None or workers <= 1:
+        return {}
+    return {"PASSWORD_HASHER_WORKERS": str(max(1, available_cpus() // workers))}
+
+
+async def calibrate_password_hash(settings: Settings) -> int:
+    """Калибрует стоимость bcrypt один раз для всех воркеров.
+
+    Каждый воркер, откалиброванный отдельно, мог бы выбрать свою
+    стоимость, и вход через разные воркеры перехэшировал бы пароль.
+    """
+    hasher = PasswordHasher(max_workers=1)
+    try:
+        return await hasher.calibrate(
+            budget_ms=settings.PASSWORD_HASH_BUDGET_MS,
+            min_rounds=settings.PASSWORD_HASH_MIN_ROUNDS,
+            max_rounds=settings.PASSWORD_HASH_MAX_ROUNDS,
+        )
+    finally:
+        hasher.shutdown()
+
+
+def uvicorn_options(settings: Settings, workers: int) -> dict:
+    """Параметры uvicorn.Config из настроек сервера."""
+    return {
+        "host": settings.SERVER_HOST,
+        "port": settings.SERVER_PORT,
+        "workers": workers,
+        "loop": resolve_loop(settings.SERVER_LOOP),
+        "http": resolve_http(settings.SERVER_HTTP),
+        "backlog": settings.SERVER_BACKLOG,
+        "timeout_keep_alive": settings.SERVER_KEEP_ALIVE_SECONDS,
+        "timeout_graceful_shutdown": settings.SERVER_GRACEFUL_TIMEOUT_SECONDS,
+        "limit_max_requests": settings.SERVER_MAX_REQUESTS,
+        "limit_max_requests_jitter": settings.SERVER_MAX_REQUESTS_JITTER,
+        "forwarded_allow_ips": settings.SERVER_FORWARDED_ALLOW_IPS,
+        "access_log": settings.SERVER_ACCESS_LOG,
+    }
@@ -1,6 +1,13 @@
-from pydantic import Field, field_validator
+from collections.abc import Callable
+from dataclasses import dataclass
+
+from pydantic import Field, ValidationInfo, field_validator
 from pydantic_settings import BaseSettings
 
+# Стоимость bcrypt, с которой созданы существующие хэши (по умолчанию
+# passlib): калибровка не опускается ниже, чтобы не ослаблять их при входе
+MIN_PASSWORD_HASH_ROUNDS = 12
+
 
 class Settings(BaseSettings):
     """Настройки приложения, загружаемые из переменных окружения."""
@@ -17,6 +24,60 @@ class Settings(BaseSettings):
     POSTGRES_PASSWORD: str = Field(default="postgres")
     POSTGRES_DB: str = Field(default="template")
 
+    # Настройки пула соединений и драйвера asyncpg
+    DB_POOL_SIZE: int = 5
+    DB_MAX_OVERFLOW: int = 10
+    DB_POOL_TIMEOUT: float = 30.0
+    DB_POOL_RECYCLE: int = -1  # секунды, -1 - не пересоздавать соединения
+    DB_POOL_PRE_PING: bool = False
+    DB_STATEMENT_CACHE_SIZE: int = 100  # кэш prepared statements asyncpg
+    DB_QUERY_CACHE_SIZE: int = 500  # кэш скомпилированных запросов SQLAlchemy
+    DB_APPLICATION_NAME: str = "fastapi-template"
+    DB_SERVER_SETTINGS: dict[str, str] = {"jit": "off"}
+    # Подключение через PgBouncer в режиме transaction pooling
+    DB_PGBOUNCER_MODE: bool = False
+    DB_PGBOUNCER_POOL_SIZE: int = 0  # 0 - NullPool, соединения пулит PgBouncer
+    # Проверка ревизии Alembic при старте: fail, warn или off
+    DB_SCHEMA_CHECK: str = "fail"
+    # Создавать таблицы через create_all вместо миграций (только для разработки)
+    DB_CREATE_ALL: bool = False
+
+    # Реплика для чтения (учетные данные и имя базы как у primary)
+    DB_REPLICA_HOST: str | None = None  # None - все запросы идут на primary
+    DB_REPLICA_PORT: int = 5432
+    DB_REPLICA_MAX_LAG_SECONDS: float = 5.0
+    DB_REPLICA_CHECK_INTERVAL: float = 5.0
+    DB_REPLICA_FALLBACK: bool = True  # False - 503, если реплика недоступна
+
+    # Кэш пользователей перед find_by_email
+    USER_CACHE_SIZE: int = 10_000  # 0 - кэш отключен
+    USER_CACHE_TTL_SECONDS: float = 30.0
+
+    # Фоновое удаление истекших авторизационных сессий
+    SESSION_REAPER_ENABLED: bool = True
+    SESSION_REAPER_INTERVAL_SECONDS: float = 300.0
+    SESSION_REAPER_JITTER_SECONDS: float = 60.0
+    SESSION_REAPER_BATCH_SIZE: int = 1000
+    SESSION_REAPER_MAX_BATCHES: int = 100  # за один запуск
+    SESSION_REAPER_BATCH_PAUSE_SECONDS: float = 0.1
+    # Запуск откладывается, если занято больше этой доли пула соединений
+    SESSION_REAPER_MAX_POOL_USAGE: float = 0.8
+    # Секции auth_sessions по expires_at: ширина и запас вперед в днях
+    AUTH_SESSIONS_PARTITION_DAYS: int = 7
+    AUTH_SESSIONS_PARTITION_PREMAKE_DAYS: int = 35
+
+    # Прогрев воркера после старта; /ready отвечает 503 до его завершения
+    WARMUP_ENABLED: bool = True
+    WARMUP_POOL_CONNECTIONS: int | None = None  # None - по размеру пула
+
+    # Массовый импорт пользователей
+    USER_IMPORT_BATCH_SIZE: int = 1000
+    USER_IMPORT_MAX_REPORTED: int = 100  # примеров конфликтов и ошибок в отчете
+    # Email пользователей с доступом к /api/private/admin
+    ADMIN_EMAILS: list[str] = []
+    # Доступ к /metrics: admin (только ADMIN_EMAILS), public или off
+    METRICS_ENDPOINT: str = "admin"
+
     # Настройки безопасности
     SECRET_KEY: str
     ALGORITHM: str
@@ -31,7 +92,52 @@ class Settings(BaseSettings):
     ACCESS_TOKEN_EXPIRE_MINUTES: int = 30
     REFRESH_TOKEN_EXPIRE_DAYS: int = 7
     SECRET_KEY: str = "secret"
-    JWT_ALGORITHM: str = "HS256"
+    JWT_ALGORITHM: str = "HS256"  # HS256, EdDSA или ES256
+    # Ключи для EdDSA/ES256: kid -> путь к PEM-файлу
+    JWT_PRIVATE_KEYS: dict[str, str] = {}
+    JWT_PUBLIC_KEYS: dict[str, str] = {}  # ключи, оставленные только для проверки
+    JWT_ACTIVE_KID: str | None = None
+    JWKS_CACHE_MAX_AGE: int = 3600
+    TOKEN_CACHE_SIZE: int = 10_000  # 0 - кэш проверенных токенов отключен
+    # Собирать текущего пользователя из claims access-токена без запроса к БД
+    AUTH_TRUST_TOKEN_CLAIMS: bool = False
+
+    # Настройки хэширования паролей
+    PASSWORD_HASHER_WORKERS: int | None = None  # None - по числу CPU
+    PASSWORD_HASHER_MAX_QUEUE: int = 64
+    PASSWORD_HASH_CALIBRATE: bool = True
+    PASSWORD_HASH_BUDGET_MS: int = 250
+    PASSWORD_HASH_MIN_ROUNDS: int = MIN_PASSWORD_HASH_ROUNDS
+    PASSWORD_HASH_MAX_ROUNDS: int = 14
+    # Задана - калибровка не выполняется (cli.py serve передает воркерам
+    # стоимость, откалиброванную один раз в мастер-процессе)
+    PASSWORD_HASH_ROUNDS: int | None = None
+
+    # Настройки ограничения частоты запросов ("<запросов>/<секунд>")
+    RATE_LIMIT_ENABLED: bool = True
+    RATE_LIMITS: dict[str, str] = {
+        "login:ip": "20/60",
+        "login:email": "5/60",
+        "refresh:ip": "30/60",
+        "register:ip": "10/3600",
+    }
+
+    # HTTP-сервер (cli.py serve)
+    SERVER_HOST: str = "0.0.0.0"
+    SERVER_PORT: int = 8000
+    SERVER_WORKERS: int | None = None  # None - по числу доступных CPU
+    SERVER_LOOP: str = "auto"  # auto (uvloop, если установлен), uvloop, asyncio
+    SERVER_HTTP: str = "auto"  # auto (httptools, если установлен), httptools, h11
+    SERVER_BACKLOG: int = 2048
+    SERVER_KEEP_ALIVE_SECONDS: int = 5
+    SERVER_GRACEFUL_TIMEOUT_SECONDS: int | None = 30
+    # Импортировать приложение до запуска воркеров, чтобы сразу увидеть ошибки
+    SERVER_PRELOAD: bool = True
+    # Перезапуск воркера после N запросов (ограничивает рост памяти)
+    SERVER_MAX_REQUESTS: int | None = None
+    SERVER_MAX_REQUESTS_JITTER: int = 0
+    SERVER_FORWARDED_ALLOW_IPS: str | None = None  # None - 127.0.0.1
+    SERVER_ACCESS_LOG: bool = True
 
     @property
     def pg_db_creds(self) -> str:
@@ -49,6 +155,17 @@ class Settings(BaseSettings):
 
         return url
 
+    @property
+    def replica_db_url(self) -> str | None:
+        """DSN реплики для чтения"""
+        if not self.DB_REPLICA_HOST:
+            return None
+        return (
+            f"postgresql+asyncpg://"
+            f"{self.pg_db_creds}@"
+            f"{self.DB_REPLICA_HOST}:{self.DB_REPLICA_PORT}/{self.POSTGRES_DB}"
+        )
+
     @field_validator("ENVIRONMENT")
     @classmethod
     def validate_environment(cls, v: str) -> str:
@@ -57,13 +174,137 @@ class Settings(BaseSettings):
             raise ValueError(f"ENVIRONMENT должен быть одним из {allowed}")
         return v.lower()
 
+    @field_validator("DB_SCHEMA_CHECK")
+    @classmethod
+    def validate_schema_check(cls, v: str) -> str:
+        allowed = ["fail", "warn", "off"]
+        if v.lower() not in allowed:
+            raise ValueError(f"DB_SCHEMA_CHECK должен быть одним из {allowed}")
+        return v.lower()
+
+    @field_validator("METRICS_ENDPOINT")
+    @classmethod
+    def validate_metrics_endpoint(cls, v: str) -> str:
+        allowed = ["admin", "public", "off"]
+        if v.lower() not in allowed:
+            raise ValueError(f"METRICS_ENDPOINT должен быть одним из {allowed}")
+        return v.lower()
+
+    @field_validator("SERVER_LOOP")
+    @classmethod
+    def validate_server_loop(cls, v: str) -> str:
+        allowed = ["auto", "uvloop", "asyncio"]
+        if v.lower() not in allowed:
+            raise ValueError(f"SERVER_LOOP должен быть одним из {allowed}")
+        return v.lower()
+
+    @field_validator("SERVER_HTTP")
+    @classmethod
+    def validate_server_http(cls, v: str) -> str:
+        allowed = ["auto", "httptools", "h11"]
+        if v.lower() not in allowed:
+            raise ValueError(f"SERVER_HTTP должен быть одним из {allowed}")
+        return v.lower()
+
+    @field_validator("PASSWORD_HASH_MIN_ROUNDS", "PASSWORD_HASH_ROUNDS")
+    @classmethod
+    def validate_password_hash_rounds(cls, v: int | None) -> int | None:
+        if v is not None and v < MIN_PASSWORD_HASH_ROUNDS:
+            raise ValueError(
+                f"Стоимость bcrypt не может быть ниже {MIN_PASSWORD_HASH_ROUNDS}"
+            )
+        return v
+
+    @field_validator("DB_CREATE_ALL")
+    @classmethod
+    def validate_create_all(cls, v: bool, info: ValidationInfo) -> bool:
+        if v and info.data.get("ENVIRONMENT") == "production":
+            raise ValueError("DB_CREATE_ALL недоступен в production")
+        return v
+
     model_config = {
         "env_file": ".env",
         "env_file_encoding": "utf-8",
         "case_sensitive": True,
+        "frozen": True,
     }
 
 
+# Поля, изменение которых применяется без перезапуска (reload_settings)
+RELOADABLE_FIELDS = frozenset(
+    {
+        "LOG_LEVEL",
+        "ADMIN_EMAILS",
+        "RATE_LIMIT_ENABLED",
+        "RATE_LIMITS",
+        "JWKS_CACHE_MAX_AGE",
+        "USER_IMPORT_BATCH_SIZE",
+        "USER_IMPORT_MAX_REPORTED",
+    }
+)
+
+_snapshot: Settings | None = None
+_reload_listeners: list[Callable[[Settings], None]] = []
+
+
+@dataclass(frozen=True, slots=True)
+class SettingsReload:
+    """Результат перечитывания настроек."""
+
+    applied: list[str]
+    restart_required: list[str]
+
+
 def get_settings() -> Settings:
-    """Возвращает экземпляр настроек приложения."""
-    return Settings()
+    """Возвращает общий для процесса неизменяемый снимок настроек.
+
+    Окружение и .env разбираются при первом вызове, новый снимок
+    создает только reload_settings.
+    """
+    global _snapshot
+    if _snapshot is None:
+        _snapshot = Settings()
+    return _snapshot
+
+
+def on_settings_reload(listener: Callable[[Settings], None]) -> Callable[[], None]:
+    """Регистрирует функцию, применяющую новый снимок настроек.
+
+    Возвращает функцию отписки: владелец подписчика вызывает ее при
+    остановке, чтобы перезапуск контейнера не оставлял старых подписчиков.
+    """
+    _reload_listeners.append(listener)
+
+    def unsubscribe() -> None:
+        if listener in _reload_listeners:
+            _reload_listeners.remove(listener)
+
+    return unsubscribe
+
+
+def reload_settings() -> SettingsReload:
+    """Перечитывает окружение и .env и применяет поля из RELOADABLE_FIELDS.
+
+    Остальные поля (пул соединений, ключи, параметры сервера) читаются
+    при старте, их изменения возвращаются в restart_required и вступают
+    в силу после перезапуска. При ошибке валидации снимок не меняется.
+    """
+    global _snapshot
+    current = get_settings()
+    fresh = Settings()
+    changed = [
+        name
+        for name in Settings.model_fields
+        if getattr(fresh, name) != getattr(current, name)
+    ]
+    applied = [name for name in changed if name in RELOADABLE_FIELDS]
+    if applied:
+        _snapshot = current.model_copy(
+            update={name: getattr(fresh, name) for name in applied}
+        )
+        for listener in _reload_listeners:
+            listener(_snapshot)
+    return SettingsReload(
+        applied=applied,
+        restart_required=[name for name in changed if name not in RELOADABLE_FIELDS],
+    )
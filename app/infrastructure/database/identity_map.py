@@ -0,0 +1,64 @@
+"""Identity map сущностей в пределах одного UOW."""
+
+from collections.abc import Hashable
+
+from app.infrastructure.monitoring.metrics import metrics
+
+# Признак отсутствия записи в identity map
+MISSING = object()
+
+
+class IdentityMap:
+    """Результаты поиска сущностей, уже выполненного в этом UOW.
+
+    Ключ - пара (тип сущности, ключ поиска). Запоминается и отсутствие
+    сущности: записи этого же UOW сбрасывают затронутые ключи, а чужие
+    изменения не видны так же, как при повторном чтении в той же транзакции.
+    """
+
+    def __init__(self) -> None:
+        """Инициализирует пустой identity map."""
+        self._entries: dict[tuple[type, Hashable], object] = {}
+        self.lookups = 0
+        self.hits = 0
+
+    def __len__(self) -> int:
+        """Количество записей."""
+        return len(self._entries)
+
+    def get(self, entity_type: type, key: Hashable) -> object:
+        """Возвращает сущность, None (нет в базе) или MISSING (не искали)."""
+        self.lookups += 1
+        entity = self._entries.get((entity_type, key), MISSING)
+        if entity is not MISSING:
+            self.hits += 1
+            metrics.inc("uow_identity_map_hits", entity=entity_type.__name__)
+        return entity
+
+    def put(self, entity_type: type, key: Hashable, entity: object | None) -> None:
+        """Запоминает результат поиска."""
+        self._entries[(entity_type, key)] = entity
+
+    def invalidate(self, entity_type: type, key: Hashable) -> None:
+        """Сбрасывает запись по ключу."""
+        self._entries.pop((entity_type, key), None)
+
+    def invalidate_type(self, entity_type: type) -> None:
+        """Сбрасывает все записи сущностей типа."""
+        for entry in [entry for entry in self._entries if entry[0] is entity_type]:
+            del self._entries[entry]
+
+    def clear(self) -> None:
+        """Сбрасывает все записи."""
+        self._entries.clear()
+
+    def finish(self) -> None:
+        """Сбрасывает записи и учитывает число сэкономленных запросов.
+
+        Вызывается при завершении UOW; UOW без поиска не учитывается.
+        """
+        if self.lookups:
+            metrics.observe("uow_queries_saved", self.hits)
+        self._entries.clear()
+        self.lookups = 0
+        self.hits = 0
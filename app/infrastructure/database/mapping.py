@@ -0,0 +1,27 @@
+"""Отображение между строками Core-запросов и доменными сущностями.
+
+Репозитории выбирают столбцы таблиц в порядке полей сущности и собирают
+сущность позиционно из строки результата, минуя создание ORM-объектов,
+identity map и отслеживание состояния.
+"""
+
+from dataclasses import fields
+from functools import cache
+
+from sqlalchemy import Column, Table
+
+
+@cache
+def field_names(entity_type: type) -> tuple[str, ...]:
+    """Имена полей сущности в порядке объявления."""
+    return tuple(field.name for field in fields(entity_type))
+
+
+def entity_columns(table: Table, entity_type: type) -> list[Column]:
+    """Столбцы таблицы в порядке полей сущности."""
+    return [table.c[name] for name in field_names(entity_type)]
+
+
+def entity_params(entity: object) -> dict:
+    """Параметры запроса из полей сущности (без копирования значений)."""
+    return {name: getattr(entity, name) for name in field_names(type(entity))}
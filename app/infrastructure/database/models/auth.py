@@ -10,15 +10,28 @@ from app.infrastructure.database.models.base import Base, TimestampMixin
 
 
 class AuthSessionModel(Base, TimestampMixin):
-    """ORM-модель авторизационной сессии пользователя."""
+    """ORM-модель авторизационной сессии пользователя.
+
+    Таблица секционирована по диапазонам expires_at, поэтому expires_at
+    входит в первичный ключ. Секции создает AuthSessionPartitionManager.
+
+    Индекс по refresh_token не уникальный: уникальный индекс
+    секционированной таблицы обязан включать expires_at и не запретил
+    бы повтор токена с другим сроком. Уникальность обеспечивает
+    генерация токена (UUIDv7).
+    """
 
     __tablename__ = "auth_sessions"
+    __table_args__ = {"postgresql_partition_by": "RANGE (expires_at)"}
 
     uuid: Mapped[UUID] = mapped_column(SQLAlchemyUUID, primary_key=True)
     refresh_token: Mapped[UUID] = mapped_column(SQLAlchemyUUID, index=True)
     expires_at: Mapped[datetime] = mapped_column(
-        DateTime(timezone=True), default=lambda: datetime.now(UTC)
+        DateTime(timezone=True),
+        primary_key=True,
+        index=True,
+        default=lambda: datetime.now(UTC),
     )
     user_email: Mapped[str] = mapped_column(
-        String(320), ForeignKey("users.email", ondelete="CASCADE")
+        String(320), ForeignKey("users.email", ondelete="CASCADE"), index=True
     )
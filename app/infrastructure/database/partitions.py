@@ -0,0 +1,207 @@
+"""Секционирование auth_sessions по диапазонам expires_at."""
+
+import re
+from collections.abc import Callable, Iterable
+from dataclasses import dataclass
+from datetime import UTC, date, datetime, timedelta
+
+from sqlalchemy import TextClause, text
+from sqlalchemy.exc import DBAPIError
+from sqlalchemy.ext.asyncio import AsyncEngine
+
+from app.infrastructure.logging.logger import log_info, log_warning
+from app.infrastructure.monitoring.metrics import metrics
+
+PARENT_TABLE = "auth_sessions"
+DEFAULT_PARTITION = f"{PARENT_TABLE}_default"
+# Секции выравниваются по дням от эпохи, чтобы все процессы считали одинаково
+EPOCH = date(1970, 1, 1)
+
+IS_PARTITIONED_QUERY = text(
+    "SELECT EXISTS (SELECT 1 FROM pg_partitioned_table"
+    f" WHERE partrelid = to_regclass('{PARENT_TABLE}'))"
+)
+LIST_PARTITIONS_QUERY = text(
+    "SELECT c.relname FROM pg_inherits i JOIN pg_class c ON c.oid = i.inhrelid"
+    f" WHERE i.inhparent = '{PARENT_TABLE}'::regclass"
+)
+TABLE_EXISTS_QUERY = text("SELECT to_regclass(:name) IS NOT NULL")
+IS_ATTACHED_QUERY = text(
+    "SELECT EXISTS (SELECT 1 FROM pg_inherits i"
+    " JOIN pg_class c ON c.oid = i.inhrelid"
+    f" WHERE i.inhparent = '{PARENT_TABLE}'::regclass AND c.relname = :name)"
+)
+# Блокировка на время транзакции: секции меняет один процесс за раз
+LOCK_QUERY = text("SELECT pg_advisory_xact_lock(:key)")
+LOCK_KEY = 0x61757468_73657373  # "authsess"
+
+# Операцию уже выполнил другой процесс: duplicate_table, duplicate_object,
+# unique_violation (pg_type при одновременном CREATE), undefined_table
+# (DETACH уже отсоединенной секции)
+ALREADY_DONE_SQLSTATES = frozenset({"42P07", "42710", "23505", "42P01"})
+LOCK_NOT_AVAILABLE_SQLSTATE = "55P03"
+
+
+@dataclass(frozen=True, slots=True)
+class Partition:
+    """Секция auth_sessions с диапазоном [start, end) по expires_at (UTC)."""
+
+    start: date
+    end: date
+
+    NAME_PATTERN = re.compile(rf"^{PARENT_TABLE}_p(\d{{8}})_(\d{{8}})$")
+
+    @property
+    def name(self) -> str:
+        """Имя таблицы секции."""
+        return f"{PARENT_TABLE}_p{self.start:%Y%m%d}_{self.end:%Y%m%d}"
+
+    @classmethod
+    def parse(cls, name: str) -> "Partition | None":
+        """Восстанавливает диапазон секции по имени таблицы."""
+        match = cls.NAME_PATTERN.match(name)
+        if match is None:
+            return None
+        start, end = (datetime.strptime(g, "%Y%m%d").date() for g in match.groups())
+        return cls(start, end)
+
+    def overlaps(self, other: "Partition") -> bool:
+        """Пересекаются ли диапазоны секций."""
+        return self.start < other.end and other.start < self.end
+
+
+def plan_partitions(
+    existing: Iterable[str], today: date, interval_days: int, premake_days: int
+) -> tuple[list[Partition], list[Partition]]:
+    """Определяет, какие секции создать и какие удалить.
+
+    Создаются секции, покрывающие [today, today + premake_days). Удаляются
+    секции, верхняя граница которых не позже начала текущих суток: все
+    строки в них уже истекли.
+    """
+    partitions = [p for name in existing if (p := Partition.parse(name))]
+    to_drop = [p for p in partitions if p.end <= today]
+
+    offset = (today - EPOCH).days // interval_days * interval_days
+    start = EPOCH + timedelta(days=offset)
+    horizon = today + timedelta(days=premake_days)
+    to_create = []
+    while start < horizon:
+        candidate = Partition(start, start + timedelta(days=interval_days))
+        if not any(candidate.overlaps(p) for p in partitions):
+            to_create.append(candidate)
+        start = candidate.end
+
+    return to_create, to_drop
+
+
+class AuthSessionPartitionManager:
+    """Создает будущие секции auth_sessions и удаляет полностью истекшие.
+
+    Удаление истекших сессий целой секцией - DROP TABLE без
+    построчного DELETE, мертвых кортежей и нагрузки на VACUUM.
+    Если таблица не секционирована, ничего не делает.
+
+    maintain могут одновременно вызывать несколько воркеров: каждая
+    операция выполняется под advisory-блокировкой после проверки, что
+    ее еще никто не сделал. DDL ждет блокировки auth_sessions не
+    дольше lock_timeout секунд, иначе операция откладывается до
+    следующего запуска, чтобы не задерживать запросы за собой.
+    """
+
+    def __init__(
+        self,
+        engine: AsyncEngine,
+        interval_days: int = 7,
+        premake_days: int = 35,
+        lock_timeout: float = 2.0,
+        clock: Callable[[], datetime] = lambda: datetime.now(UTC),
+    ):
+        """Инициализирует менеджер секций."""
+        self._engine = engine
+        self._interval_days = interval_days
+        self._premake_days = premake_days
+        self._lock_timeout_ms = int(lock_timeout * 1000)
+        self._clock = clock
+
+    async def maintain(self) -> tuple[list[str], list[str]]:
+        """Создает и удаляет секции, возвращает имена созданных и удаленных."""
+        async with self._engine.connect() as conn:
+            if not await conn.scalar(IS_PARTITIONED_QUERY):
+                return [], []
+            existing = (await conn.scalars(LIST_PARTITIONS_QUERY)).all()
+
+        to_create, to_drop = plan_partitions(
+            existing,
+            self._clock().astimezone(UTC).date(),
+            self._interval_days,
+            self._premake_days,
+        )
+
+        # Каждая операция в своей транзакции, чтобы блокировки были короткими
+        created, dropped = [], []
+        if DEFAULT_PARTITION not in existing:
+            await self._execute(
+                DEFAULT_PARTITION,
+                TABLE_EXISTS_QUERY,
+                f"CREATE TABLE IF NOT EXISTS {DEFAULT_PARTITION}"
+                f" PARTITION OF {PARENT_TABLE} DEFAULT",
+            )
+        for partition in to_create:
+            if await self._execute(
+                partition.name,
+                TABLE_EXISTS_QUERY,
+                f"CREATE TABLE IF NOT EXISTS {partition.name}"
+                f" PARTITION OF {PARENT_TABLE}"
+                f" FOR VALUES FROM ('{partition.start} 00:00:00+00')"
+                f" TO ('{partition.end} 00:00:00+00')",
+            ):
+                created.append(partition.name)
+        for partition in to_drop:
+            if await self._execute(
+                partition.name,
+                IS_ATTACHED_QUERY,
+                f"ALTER TABLE {PARENT_TABLE} DETACH PARTITION {partition.name}",
+                f"DROP TABLE {partition.name}",
+                done_if=False,
+            ):
+                dropped.append(partition.name)
+
+        metrics.inc("auth_sessions_partitions_created", len(created))
+        metrics.inc("auth_sessions_partitions_dropped", len(dropped))
+        if created or dropped:
+            log_info("Секции auth_sessions обновлены", created=created, dropped=dropped)
+        return created, dropped
+
+    async def _execute(
+        self,
+        name: str,
+        check: TextClause,
+        *statements: str,
+        done_if: bool = True,
+    ) -> bool:
+        """Выполняет DDL секции в отдельной транзакции под блокировкой.
+
+        check возвращает состояние секции; если оно уже равно done_if,
+        операцию сделал другой процесс. Возвращает, выполнена ли она.
+        """
+        try:
+            async with self._engine.begin() as conn:
+                await conn.execute(
+                    text(f"SET LOCAL lock_timeout = {self._lock_timeout_ms}")
+                )
+                await conn.execute(LOCK_QUERY, {"key": LOCK_KEY})
+                if await conn.scalar(check, {"name": name}) == done_if:
+                    return False
+                for statement in statements:
+                    await conn.execute(text(statement))
+        except DBAPIError as e:
+            sqlstate = getattr(e.orig, "sqlstate", None)
+            if sqlstate in ALREADY_DONE_SQLSTATES:
+                return False
+            if sqlstate == LOCK_NOT_AVAILABLE_SQLSTATE:
+                metrics.inc("auth_sessions_partition_lock_timeouts")
+                log_warning("Секция auth_sessions отложена: таблица занята", name=name)
+                return False
+            raise
+        return True
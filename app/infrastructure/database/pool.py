@@ -0,0 +1,203 @@
+"""Пул соединений и параметры движка SQLAlchemy."""
+
+import asyncio
+import re
+import time
+from contextlib import AsyncExitStack
+from uuid import uuid4
+
+from sqlalchemy import event, exc
+from sqlalchemy.engine.default import CacheStats
+from sqlalchemy.ext.asyncio import AsyncEngine
+from sqlalchemy.pool import AsyncAdaptedQueuePool, ConnectionPoolEntry, NullPool, Pool
+
+from app.infrastructure.config.settings import Settings
+from app.infrastructure.monitoring.metrics import metrics
+from app.infrastructure.monitoring.request_context import current_route
+
+# Команды, состояние которых переживает транзакцию и теряется или
+# "протекает" к другим клиентам при transaction pooling в PgBouncer
+SESSION_STATE_STATEMENT = re.compile(
+    r"^\s*(?:"
+    r"SET\s+(?!LOCAL\b|TRANSACTION\b|CONSTRAINTS?\b)"
+    r"|RESET\b|DISCARD\b|LISTEN\b|UNLISTEN\b|PREPARE\b|DEALLOCATE\b|LOAD\b"
+    r"|CREATE\s+(?:(?:GLOBAL|LOCAL)\s+)?TEMP(?:ORARY)?\b(?!.*\bON\s+COMMIT\s+DROP\b)"
+    r"|DECLARE\b.*\bWITH\s+HOLD\b"
+    r")"
+    r"|\bpg_advisory_lock(?:_shared)?\s*\(",
+    re.IGNORECASE | re.DOTALL,
+)
+
+# Метки результата поиска запроса в кэше скомпилированных запросов
+CACHE_RESULTS = {
+    CacheStats.CACHE_HIT: "hit",
+    CacheStats.CACHE_MISS: "miss",
+    CacheStats.CACHING_DISABLED: "disabled",
+    CacheStats.NO_CACHE_KEY: "no_key",
+    CacheStats.NO_DIALECT_SUPPORT: "unsupported",
+}
+
+
+class SessionStateError(RuntimeError):
+    """Запрос зависит от состояния соединения, недопустимого за PgBouncer."""
+
+
+class InstrumentedAsyncQueuePool(AsyncAdaptedQueuePool):
+    """AsyncAdaptedQueuePool, замеряющий время получения соединения из пула."""
+
+    def _do_get(self) -> ConnectionPoolEntry:
+        start = time.perf_counter()
+        try:
+            return super()._do_get()
+        except exc.TimeoutError:
+            metrics.inc("db_pool_timeouts")
+            raise
+        finally:
+            metrics.observe("db_pool_wait_seconds", time.perf_counter() - start)
+
+
+def _unique_statement_name() -> str:
+    """Уникальное имя prepared statement, не конфликтующее между клиентами."""
+    return f"__asyncpg_{uuid4()}__"
+
+
+def get_engine_options(settings: Settings) -> dict:
+    """Формирует параметры create_async_engine для режима развертывания.
+
+    В режиме PgBouncer (transaction pooling) серверное соединение меняется
+    между транзакциями, поэтому кэш prepared statements asyncpg отключается,
+    а имена statements делаются уникальными. Локальный пул не нужен -
+    соединения пулит PgBouncer, - но может быть оставлен небольшим.
+    Параметры запуска, кроме application_name, PgBouncer не пропускает,
+    поэтому DB_SERVER_SETTINGS задаются на стороне роли/базы.
+    """
+    if not settings.DB_PGBOUNCER_MODE:
+        return {
+            "query_cache_size": settings.DB_QUERY_CACHE_SIZE,
+            "poolclass": InstrumentedAsyncQueuePool,
+            "pool_size": settings.DB_POOL_SIZE,
+            "max_overflow": settings.DB_MAX_OVERFLOW,
+            "pool_timeout": settings.DB_POOL_TIMEOUT,
+            "pool_recycle": settings.DB_POOL_RECYCLE,
+            "pool_pre_ping": settings.DB_POOL_PRE_PING,
+            "connect_args": {
+                "statement_cache_size": settings.DB_STATEMENT_CACHE_SIZE,
+                "server_settings": {
+                    "application_name": settings.DB_APPLICATION_NAME,
+                    **settings.DB_SERVER_SETTINGS,
+                },
+            },
+        }
+
+    options: dict = {
+        "query_cache_size": settings.DB_QUERY_CACHE_SIZE,
+        "connect_args": {
+            "statement_cache_size": 0,
+            "prepared_statement_cache_size": 0,
+            "prepared_statement_name_func": _unique_statement_name,
+            "server_settings": {"application_name": settings.DB_APPLICATION_NAME},
+        },
+    }
+    if settings.DB_PGBOUNCER_POOL_SIZE > 0:
+        options.update(
+            poolclass=InstrumentedAsyncQueuePool,
+            pool_size=settings.DB_PGBOUNCER_POOL_SIZE,
+            max_overflow=0,
+            pool_timeout=settings.DB_POOL_TIMEOUT,
+            pool_recycle=settings.DB_POOL_RECYCLE,
+            pool_pre_ping=settings.DB_POOL_PRE_PING,
+        )
+    else:
+        options["poolclass"] = NullPool
+    return options
+
+
+def forbid_session_state(engine: AsyncEngine) -> None:
+    """Запрещает запросы, оставляющие состояние на серверном соединении."""
+
+    @event.listens_for(engine.sync_engine, "before_cursor_execute")
+    def _check_statement(conn, cursor, statement, parameters, context, executemany):
+        if SESSION_STATE_STATEMENT.search(statement):
+            raise SessionStateError(
+                f"Запрос зависит от состояния сессии и несовместим "
+                f"с transaction pooling: {statement[:100]}"
+            )
+
+
+def track_connection_hold(pool: Pool) -> None:
+    """Замеряет, сколько соединение удерживается вне пула, по маршрутам."""
+
+    @event.listens_for(pool, "checkout")
+    def _on_checkout(dbapi_connection, connection_record, connection_proxy):
+        connection_record.info["checkout"] = (time.perf_counter(), current_route())
+
+    @event.listens_for(pool, "checkin")
+    def _on_checkin(dbapi_connection, connection_record):
+        checkout = connection_record.info.pop("checkout", None)
+        if checkout is None:
+            return
+        started, route = checkout
+        metrics.observe(
+            "db_connection_hold_seconds", time.perf_counter() - started, route=route
+        )
+
+
+def track_statement_cache(engine: AsyncEngine) -> None:
+    """Считает попадания в кэш скомпилированных запросов SQLAlchemy."""
+
+    @event.listens_for(engine.sync_engine, "before_cursor_execute")
+    def _on_execute(conn, cursor, statement, parameters, context, executemany):
+        if context is not None:
+            metrics.inc("db_statement_cache", result=CACHE_RESULTS[context.cache_hit])
+
+
+def get_statement_cache_stats(engine: AsyncEngine) -> dict[str, float]:
+    """Возвращает заполненность кэша скомпилированных запросов."""
+    cache = engine.sync_engine._compiled_cache
+    if cache is None:
+        return {}
+    return {"size": len(cache), "capacity": cache.capacity}
+
+
+def get_pool_usage(engine: AsyncEngine) -> float:
+    """Доля занятых соединений пула (0 - для пулов без ограничения)."""
+    pool = engine.pool
+    if not isinstance(pool, AsyncAdaptedQueuePool) or pool._max_overflow < 0:
+        return 0.0
+    capacity = pool.size() + pool._max_overflow
+    return pool.checkedout() / capacity if capacity else 0.0
+
+
+async def prewarm_pool(engine: AsyncEngine, count: int | None = None) -> int:
+    """Открывает соединения пула заранее и возвращает их в пул.
+
+    Соединения открываются одновременно, count ограничивается размером
+    пула: соединения сверх него закрылись бы при возврате. Для пулов без
+    постоянных соединений (NullPool) ничего не делает.
+    """
+    pool = engine.pool
+    if not isinstance(pool, AsyncAdaptedQueuePool):
+        return 0
+    count = pool.size() if count is None else min(count, pool.size())
+    if count <= 0:
+        return 0
+
+    async with AsyncExitStack() as stack:
+        await asyncio.gather(
+            *(stack.enter_async_context(engine.connect()) for _ in range(count))
+        )
+    return count
+
+
+def get_pool_stats(engine: AsyncEngine) -> dict[str, float]:
+    """Возвращает текущее состояние пула соединений движка."""
+    pool = engine.pool
+    if not isinstance(pool, AsyncAdaptedQueuePool):
+        return {}
+
+    return {
+        "size": pool.size(),
+        "checked_in": pool.checkedin(),
+        "checked_out": pool.checkedout(),
+        "overflow": max(pool.overflow(), 0),
+    }
@@ -0,0 +1,117 @@
+"""Маршрутизация чтения на реплику PostgreSQL."""
+
+import asyncio
+import time
+from collections.abc import Callable
+
+from sqlalchemy import event, text
+from sqlalchemy.ext.asyncio import AsyncEngine, AsyncSession, async_sessionmaker
+from sqlalchemy.orm import Session
+
+from app.domain.exceptions import ServiceUnavailableException
+from app.infrastructure.logging.logger import log_error
+from app.infrastructure.monitoring.metrics import metrics
+
+# Ключ session.info: сессия уже писала, чтение должно идти на primary
+PRIMARY_PINNED = "primary_pinned"
+
+# Отставание реплики в секундах; 0, если весь полученный WAL уже применен
+REPLICA_LAG_QUERY = text(
+    "SELECT CASE"
+    " WHEN pg_last_wal_receive_lsn() = pg_last_wal_replay_lsn() THEN 0"
+    " ELSE COALESCE("
+    "EXTRACT(EPOCH FROM now() - pg_last_xact_replay_timestamp()), 0)"
+    " END"
+)
+
+
+class PrimarySession(Session):
+    """Сессия primary, помечаемая после первого изменяющего запроса."""
+
+
+@event.listens_for(PrimarySession, "do_orm_execute")
+def _pin_after_write(orm_execute_state) -> None:
+    """Закрепляет чтение за primary после записи (read-your-writes)."""
+    if not orm_execute_state.is_select:
+        orm_execute_state.session.info[PRIMARY_PINNED] = True
+
+
+class ReplicaRouter:
+    """Выдает сессии реплики для чтения, пока реплика здорова.
+
+    Доступность и отставание реплики проверяются не чаще раза в
+    check_interval секунд, результат используется всеми запросами.
+    Если реплика недоступна или отстает больше max_lag секунд, чтение
+    уходит на primary (fallback=True) или отклоняется с 503.
+    """
+
+    def __init__(
+        self,
+        engine: AsyncEngine | None,
+        max_lag: float = 5.0,
+        check_interval: float = 5.0,
+        check_timeout: float = 1.0,
+        fallback: bool = True,
+        clock: Callable[[], float] = time.monotonic,
+    ):
+        """Инициализирует маршрутизатор."""
+        self._engine = engine
+        self._session_factory = (
+            async_sessionmaker(
+                bind=engine,
+                class_=AsyncSession,
+                expire_on_commit=False,
+                autoflush=False,
+            )
+            if engine is not None
+            else None
+        )
+        self._max_lag = max_lag
+        self._check_interval = check_interval
+        self._check_timeout = check_timeout
+        self._fallback = fallback
+        self._clock = clock
+        self._available = False
+        self._checking = False
+        self._next_check = clock()
+
+    @property
+    def enabled(self) -> bool:
+        """Настроена ли реплика."""
+        return self._engine is not None
+
+    async def session(self) -> AsyncSession | None:
+        """Возвращает сессию реплики или None, если читать нужно с primary."""
+        if not self.enabled:
+            return None
+
+        if self._clock() >= self._next_check and not self._checking:
+            await self._refresh()
+
+        if self._available:
+            return self._session_factory()
+        if not self._fallback:
+            raise ServiceUnavailableException(message="Реплика базы данных недоступна")
+        metrics.inc("db_replica_fallbacks")
+        return None
+
+    async def _refresh(self) -> None:
+        """Обновляет состояние реплики."""
+        self._checking = True
+        try:
+            lag = await asyncio.wait_for(self._measure_lag(), self._check_timeout)
+        except Exception as e:
+            self._available = False
+            log_error("Реплика базы данных недоступна", error=e)
+        else:
+            self._available = lag <= self._max_lag
+            metrics.set_gauge("db_replica_lag_seconds", lag)
+        finally:
+            self._checking = False
+            self._next_check = self._clock() + self._check_interval
+        metrics.set_gauge("db_replica_available", int(self._available))
+
+    async def _measure_lag(self) -> float:
+        """Запрашивает отставание реплики в секундах."""
+        async with self._engine.connect() as conn:
+            return float(await conn.scalar(REPLICA_LAG_QUERY))
@@ -1,60 +1,180 @@
 """SQLAlchemy реализация репозитория авторизационных сессий."""
 
-from dataclasses import asdict
+from collections.abc import Awaitable, Callable
 from datetime import datetime
 from uuid import UUID
 
-from sqlalchemy import delete, insert, select, update
+from sqlalchemy import (
+    bindparam,
+    delete,
+    func,
+    insert,
+    literal_column,
+    select,
+    tuple_,
+    update,
+)
 from sqlalchemy.ext.asyncio import AsyncSession
 
 from app.domain.entities.auth import AuthSession
+from app.domain.entities.user import User
 from app.domain.interfaces.auth_session_repo import IAuthSessionRepository
+from app.infrastructure.database.identity_map import MISSING, IdentityMap
+from app.infrastructure.database.mapping import entity_columns, entity_params
 from app.infrastructure.database.models.auth import AuthSessionModel
+from app.infrastructure.database.models.user import UserModel
+
+# Запросы собираются один раз при импорте модуля (см. user_repo)
+auth_sessions = AuthSessionModel.__table__
+users = UserModel.__table__
+
+ADD = insert(auth_sessions)
+FIND_BY_REFRESH_TOKEN = select(*entity_columns(auth_sessions, AuthSession)).where(
+    auth_sessions.c.refresh_token == bindparam("refresh_token")
+)
+UPDATE_REFRESH_TOKEN = (
+    update(auth_sessions)
+    .where(auth_sessions.c.uuid == bindparam("p_uuid"))
+    .values(
+        refresh_token=bindparam("p_refresh_token"),
+        expires_at=bindparam("p_expires_at"),
+    )
+)
+DELETE_BY_REFRESH_TOKEN = delete(auth_sessions).where(
+    auth_sessions.c.refresh_token == bindparam("refresh_token")
+)
+POP_BY_REFRESH_TOKEN = DELETE_BY_REFRESH_TOKEN.returning(
+    *entity_columns(auth_sessions, AuthSession)
+)
+ROTATE_REFRESH_TOKEN = (
+    update(auth_sessions)
+    .where(
+        auth_sessions.c.refresh_token == bindparam("p_refresh_token"),
+        auth_sessions.c.expires_at > func.now(),
+        auth_sessions.c.user_email == users.c.email,
+    )
+    .values(
+        refresh_token=bindparam("p_new_refresh_token"),
+        expires_at=bindparam("p_expires_at"),
+    )
+    .returning(*entity_columns(users, User))
+)
+# ctid уникален только внутри секции, поэтому строка адресуется парой
+# с tableoid. Строки, заблокированные другими транзакциями (например,
+# параллельным чистильщиком другого воркера), пропускаются.
+_EXPIRED_ROWS = (
+    select(literal_column("tableoid"), literal_column("ctid"))
+    .select_from(auth_sessions)
+    .where(auth_sessions.c.expires_at < func.now())
+    .limit(bindparam("batch_size"))
+    .with_for_update(skip_locked=True)
+)
+DELETE_EXPIRED = delete(auth_sessions).where(
+    tuple_(literal_column("tableoid"), literal_column("ctid")).in_(_EXPIRED_ROWS)
+)
 
 
 class AuthSessionRepository(IAuthSessionRepository):
     """SQLAlchemy реализация репозитория авторизационных сессий."""
 
-    def __init__(self, session: AsyncSession):
+    def __init__(
+        self,
+        session: AsyncSession,
+        read_session: Callable[[], Awaitable[AsyncSession]] | None = None,
+        identity_map: IdentityMap | None = None,
+    ):
         self.session = session
+        self._read_session = read_session
+        self._identity_map = identity_map
+
+    async def _session_for_read(self) -> AsyncSession:
+        """Сессия для чтения, допускающего реплику."""
+        if self._read_session is None:
+            return self.session
+        return await self._read_session()
+
+    def _invalidate(self, *refresh_tokens: UUID) -> None:
+        """Сбрасывает сессии в identity map после записи.
+
+        Без refresh token сбрасываются все сессии этого UOW.
+        """
+        if self._identity_map is None:
+            return
+        if not refresh_tokens:
+            self._identity_map.invalidate_type(AuthSession)
+        for refresh_token in refresh_tokens:
+            self._identity_map.invalidate(AuthSession, refresh_token)
 
     async def add(self, auth_session: AuthSession) -> None:
         """Добавляет новую авторизационную сессию."""
-        await self.session.execute(
-            insert(AuthSessionModel).values(**asdict(auth_session))
-        )
+        await self.session.execute(ADD, entity_params(auth_session))
+        self._invalidate(auth_session.refresh_token)
 
     async def find_by_refresh_token(self, refresh_token: UUID) -> AuthSession | None:
         """Находит авторизационную сессию по refresh token."""
-        stmt = select(AuthSessionModel).where(
-            AuthSessionModel.refresh_token == refresh_token
+        if self._identity_map is not None:
+            auth_session = self._identity_map.get(AuthSession, refresh_token)
+            if auth_session is not MISSING:
+                return auth_session
+
+        session = await self._session_for_read()
+        result = await session.execute(
+            FIND_BY_REFRESH_TOKEN, {"refresh_token": refresh_token}
         )
-        result = await self.session.execute(stmt)
-        auth_session_model = result.scalar_one_or_none()
-
-        if auth_session_model:
-            return AuthSession(
-                uuid=auth_session_model.uuid,
-                refresh_token=auth_session_model.refresh_token,
-                expires_at=auth_session_model.expires_at,
-                user_email=auth_session_model.user_email,
-            )
-        return None
+        row = result.one_or_none()
+        auth_session = AuthSession(*row) if row else None
+        if self._identity_map is not None:
+            self._identity_map.put(AuthSession, refresh_token, auth_session)
+        return auth_session
 
     async def update_refresh_token(
         self, uuid: UUID, refresh_token: UUID, expires_at: datetime
     ) -> None:
         """Обновляет refresh token."""
         await self.session.execute(
-            update(AuthSessionModel)
-            .where(AuthSessionModel.uuid == uuid)
-            .values(refresh_token=refresh_token, expires_at=expires_at)
+            UPDATE_REFRESH_TOKEN,
+            {
+                "p_uuid": uuid,
+                "p_refresh_token": refresh_token,
+                "p_expires_at": expires_at,
+            },
         )
+        self._invalidate()
 
     async def delete_by_refresh_token(self, refresh_token: UUID) -> None:
         """Удаляет авторизационную сессию по refresh token."""
         await self.session.execute(
-            delete(AuthSessionModel).where(
-                AuthSessionModel.refresh_token == refresh_token
-            )
+            DELETE_BY_REFRESH_TOKEN, {"refresh_token": refresh_token}
+        )
+        self._invalidate(refresh_token)
+
+    async def pop_by_refresh_token(self, refresh_token: UUID) -> AuthSession | None:
+        """Удаляет сессию по refresh token и возвращает ее (DELETE ... RETURNING)."""
+        result = await self.session.execute(
+            POP_BY_REFRESH_TOKEN, {"refresh_token": refresh_token}
         )
+        self._invalidate(refresh_token)
+        row = result.one_or_none()
+        return AuthSession(*row) if row else None
+
+    async def rotate_refresh_token(
+        self, refresh_token: UUID, new_refresh_token: UUID, expires_at: datetime
+    ) -> User | None:
+        """Заменяет действующий refresh token (UPDATE ... FROM users RETURNING)."""
+        result = await self.session.execute(
+            ROTATE_REFRESH_TOKEN,
+            {
+                "p_refresh_token": refresh_token,
+                "p_new_refresh_token": new_refresh_token,
+                "p_expires_at": expires_at,
+            },
+        )
+        self._invalidate(refresh_token, new_refresh_token)
+        row = result.one_or_none()
+        return User(*row) if row else None
+
+    async def delete_expired(self, batch_size: int) -> int:
+        """Удаляет пачку истекших сессий по (tableoid, ctid)."""
+        result = await self.session.execute(DELETE_EXPIRED, {"batch_size": batch_size})
+        self._invalidate()
+        return result.rowcount
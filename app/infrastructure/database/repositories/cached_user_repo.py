@@ -0,0 +1,190 @@
+"""Кэширующий декоратор репозитория пользователей."""
+
+import asyncio
+import time
+from collections import OrderedDict
+from collections.abc import Callable
+
+from app.domain.entities.user import User
+from app.domain.interfaces.user_repo import IUserRepository
+from app.infrastructure.monitoring.metrics import metrics
+
+# Результат ведущего запроса, завершившегося ошибкой
+_FAILED = object()
+
+
+class UserCache:
+    """Общий для процесса LRU-кэш пользователей с TTL.
+
+    Хранит только найденных пользователей: отсутствие пользователя не
+    кэшируется, чтобы только что зарегистрированный пользователь сразу
+    находился. Между процессами кэш не согласуется, устаревание
+    ограничено TTL.
+    """
+
+    def __init__(
+        self,
+        max_size: int = 10_000,
+        ttl: float = 30.0,
+        clock: Callable[[], float] = time.monotonic,
+    ):
+        """Инициализирует кэш."""
+        self._entries: OrderedDict[str, tuple[float, User]] = OrderedDict()
+        self._inflight: dict[str, asyncio.Future] = {}
+        self._max_size = max_size
+        self._ttl = ttl
+        self._clock = clock
+        self.hits = 0
+        self.misses = 0
+
+    def __len__(self) -> int:
+        """Количество записей в кэше."""
+        return len(self._entries)
+
+    @property
+    def enabled(self) -> bool:
+        """Включен ли кэш."""
+        return self._max_size > 0 and self._ttl > 0
+
+    def stats(self) -> dict[str, float]:
+        """Размер кэша и доля попаданий."""
+        total = self.hits + self.misses
+        return {
+            "size": len(self._entries),
+            "hit_ratio": self.hits / total if total else 0.0,
+        }
+
+    def get(self, email: str) -> User | None:
+        """Возвращает пользователя, если он есть в кэше и не устарел."""
+        entry = self._entries.get(email)
+        if entry is not None:
+            expires_at, user = entry
+            if expires_at > self._clock():
+                self._entries.move_to_end(email)
+                self.hits += 1
+                metrics.inc("user_cache_hits")
+                return user
+            del self._entries[email]
+
+        self.misses += 1
+        metrics.inc("user_cache_misses")
+        return None
+
+    def put(self, user: User) -> None:
+        """Сохраняет пользователя на ttl секунд."""
+        self._entries[user.email] = (self._clock() + self._ttl, user)
+        self._entries.move_to_end(user.email)
+        while len(self._entries) > self._max_size:
+            self._entries.popitem(last=False)
+
+    def invalidate(self, email: str) -> None:
+        """Удаляет пользователя из кэша.
+
+        Загрузка, начатая до вызова, могла прочитать прежнюю строку: ее
+        результат получат ожидающие, но в кэш он не попадет.
+        """
+        self._entries.pop(email, None)
+        self._inflight.pop(email, None)
+
+    async def load(self, email: str, loader: Callable) -> User | None:
+        """Загружает пользователя, объединяя одновременные промахи.
+
+        Пока запрос по email выполняется, остальные запросы по тому же
+        email ждут его результат. Если ведущий запрос упал, ожидающие
+        выполняют свой запрос сами.
+        """
+        pending = self._inflight.get(email)
+        if pending is not None:
+            metrics.inc("user_cache_coalesced")
+            result = await asyncio.shield(pending)
+            if result is not _FAILED:
+                return result
+            return await loader()
+
+        future = self._inflight[email] = asyncio.get_running_loop().create_future()
+        try:
+            user = await loader()
+        except BaseException:
+            future.set_result(_FAILED)
+            raise
+        else:
+            future.set_result(user)
+        finally:
+            current = self._inflight.get(email) is future
+            if current:
+                del self._inflight[email]
+
+        if user is not None and current:
+            self.put(user)
+        return user
+
+
+class CachedUserRepository(IUserRepository):
+    """Репозиторий пользователей с read-through кэшем find_by_email.
+
+    Возвращаемые из кэша объекты общие для всех запросов процесса,
+    изменять их нельзя.
+
+    После записи email до конца транзакции читается мимо общего кэша
+    (без get и put): иначе несохраненная строка, прочитанная через
+    primary, стала бы видна другим запросам, а после отката осталась бы
+    в кэше на весь TTL. Запись сбрасывает кэш сразу и еще раз в конце
+    транзакции через after_transaction, при commit и при откате: иначе
+    конкурентный запрос успел бы закэшировать прежнюю строку.
+    """
+
+    def __init__(
+        self,
+        repository: IUserRepository,
+        cache: UserCache,
+        after_transaction: Callable[[Callable[[], None]], None] | None = None,
+    ):
+        """Инициализирует репозиторий."""
+        self._repository = repository
+        self._cache = cache
+        self._after_transaction = after_transaction
+        self._written: set[str] = set()
+
+    def _invalidate(self, email: str) -> None:
+        """Сбрасывает пользователя сейчас и в конце транзакции."""
+        self._cache.invalidate(email)
+        if self._after_transaction is None or email in self._written:
+            return
+        self._written.add(email)
+
+        def finish() -> None:
+            self._written.discard(email)
+            self._cache.invalidate(email)
+
+        self._after_transaction(finish)
+
+    async def find_by_email(self, email: str, use_cache: bool = True) -> User | None:
+        """Находит пользователя по email, по возможности из кэша."""
+        if not use_cache:
+            return await self._repository.find_by_email(email, use_cache=False)
+        if email in self._written:
+            return await self._repository.find_by_email(email)
+
+        user = self._cache.get(email)
+        if user is not None:
+            return user
+        return await self._cache.load(
+            email, lambda: self._repository.find_by_email(email)
+        )
+
+    async def create_user(self, user: User) -> str:
+        """Создает пользователя и сбрасывает его запись в кэше."""
+        email = await self._repository.create_user(user)
+        self._invalidate(user.email)
+        return email
+
+    async def create_if_not_exists(self, user: User) -> str | None:
+        """Создает пользователя, если email свободен, и сбрасывает кэш."""
+        email = await self._repository.create_if_not_exists(user)
+        self._invalidate(user.email)
+        return email
+
+    async def update_password(self, email: str, hashed_password: str) -> None:
+        """Обновляет хэш пароля и сбрасывает запись пользователя в кэше."""
+        await self._repository.update_password(email, hashed_password)
+        self._invalidate(email)
@@ -1,43 +1,111 @@
 """SQL реализация репозитория пользователей."""
 
-from dataclasses import asdict
+from collections.abc import Awaitable, Callable
+from datetime import UTC, datetime
 
-from sqlalchemy import insert, select
+from sqlalchemy import bindparam, insert, select, text, update
 from sqlalchemy.ext.asyncio import AsyncSession
 
 from app.domain.entities.user import User
 from app.domain.interfaces.user_repo import IUserRepository
+from app.infrastructure.database.identity_map import MISSING, IdentityMap
+from app.infrastructure.database.mapping import entity_columns, entity_params
 from app.infrastructure.database.models.user import UserModel as UserModel
 
+# Запросы собираются один раз: ключ кэша неизменяемой конструкции
+# вычисляется однократно, а скомпилированный SQL берется из кэша движка
+users = UserModel.__table__
+
+FIND_BY_EMAIL = select(*entity_columns(users, User)).where(
+    users.c.email == bindparam("email")
+)
+CREATE_USER = insert(users).returning(users.c.email)
+# insert() диалекта PostgreSQL с ON CONFLICT не кэшируется SQLAlchemy
+# и компилируется на каждом вызове, поэтому запрос задан текстом
+CREATE_IF_NOT_EXISTS = (
+    text(
+        f"INSERT INTO users ({', '.join(users.c.keys())}) "
+        f"VALUES ({', '.join(f':{key}' for key in users.c.keys())}) "
+        "ON CONFLICT (email) DO NOTHING RETURNING email"
+    )
+    .bindparams(*(bindparam(column.key, type_=column.type) for column in users.c))
+    .columns(users.c.email)
+)
+UPDATE_PASSWORD = (
+    update(users)
+    .where(users.c.email == bindparam("p_email"))
+    .values(
+        hashed_password=bindparam("p_hashed_password"),
+        updated_at=bindparam("p_updated_at"),
+    )
+)
+
 
 class UserRepository(IUserRepository):
     """SQLAlchemy реализация репозитория пользователей."""
 
-    def __init__(self, session: AsyncSession):
+    def __init__(
+        self,
+        session: AsyncSession,
+        read_session: Callable[[], Awaitable[AsyncSession]] | None = None,
+        identity_map: IdentityMap | None = None,
+    ):
         self.session = session
+        self._read_session = read_session
+        self._identity_map = identity_map
+
+    async def _session_for_read(self) -> AsyncSession:
+        """Сессия для чтения, допускающего реплику."""
+        if self._read_session is None:
+            return self.session
+        return await self._read_session()
+
+    async def find_by_email(self, email: str, use_cache: bool = True) -> User | None:
+        """Находит пользователля по email.
+
+        use_cache=False читает из базы в обход identity map: вызывающий
+        получает собственный объект, который может изменять.
+        """
+        if use_cache and self._identity_map is not None:
+            user = self._identity_map.get(User, email)
+            if user is not MISSING:
+                return user
 
-    async def find_by_email(self, email: str) -> User | None:
-        """Находит пользователля по email."""
-        stmt = select(UserModel).where(UserModel.email == email)
-        result = await self.session.execute(stmt)
-        user_model = result.scalar_one_or_none()
-
-        if user_model:
-            return User(
-                email=user_model.email,
-                hashed_password=user_model.hashed_password,
-                is_active=user_model.is_active,
-                is_verified=user_model.is_verified,
-                created_at=user_model.created_at,
-                updated_at=user_model.updated_at,
-            )
-        return None
+        session = await self._session_for_read()
+        result = await session.execute(FIND_BY_EMAIL, {"email": email})
+        row = result.one_or_none()
+        user = User(*row) if row else None
+        if self._identity_map is not None:
+            self._identity_map.put(User, email, user)
+        return user
+
+    def _invalidate(self, email: str) -> None:
+        """Сбрасывает пользователя в identity map после записи."""
+        if self._identity_map is not None:
+            self._identity_map.invalidate(User, email)
 
     async def create_user(self, user: User) -> str:
         """Создает пользователя в базе данных и возвращает первичный ключ (email)."""
-        result = await self.session.execute(
-            insert(UserModel).values(**asdict(user)).returning(UserModel.email)
-        )
+        result = await self.session.execute(CREATE_USER, entity_params(user))
         email = result.scalar_one()
+        self._invalidate(email)
 
         return email
+
+    async def create_if_not_exists(self, user: User) -> str | None:
+        """Создает пользователя, если email свободен (INSERT ... ON CONFLICT)."""
+        result = await self.session.execute(CREATE_IF_NOT_EXISTS, entity_params(user))
+        self._invalidate(user.email)
+        return result.scalar_one_or_none()
+
+    async def update_password(self, email: str, hashed_password: str) -> None:
+        """Обновляет хэш пароля пользователя."""
+        await self.session.execute(
+            UPDATE_PASSWORD,
+            {
+                "p_email": email,
+                "p_hashed_password": hashed_password,
+                "p_updated_at": datetime.now(UTC),
+            },
+        )
+        self._invalidate(email)
@@ -0,0 +1,105 @@
+"""Проверка версии схемы базы данных при старте приложения."""
+
+import ast
+import re
+import time
+from dataclasses import dataclass
+from functools import cache
+from pathlib import Path
+
+from sqlalchemy import text
+from sqlalchemy.exc import ProgrammingError
+from sqlalchemy.ext.asyncio import AsyncEngine
+
+from app.infrastructure.logging.logger import log_info, log_warning
+from app.infrastructure.monitoring.metrics import metrics
+
+MIGRATIONS_DIR = Path(__file__).resolve().parents[3] / "migrations" / "versions"
+
+CURRENT_REVISIONS_QUERY = text("SELECT version_num FROM alembic_version")
+
+# Строки вида "revision = '9b8e3d5a2c61'" из шаблона script.py.mako
+REVISION_PATTERN = re.compile(
+    r"^(revision|down_revision)\s*(?::[^=]+)?=\s*(.+?)\s*$", re.MULTILINE
+)
+
+
+class SchemaVersionError(RuntimeError):
+    """Версия схемы базы данных не совпадает с миграциями в коде."""
+
+
+@dataclass(frozen=True, slots=True)
+class SchemaStatus:
+    """Ревизии Alembic в базе данных и головные ревизии миграций в коде."""
+
+    database: frozenset[str]
+    code: frozenset[str]
+
+    @property
+    def is_current(self) -> bool:
+        """Применены ли все миграции."""
+        return self.database == self.code
+
+
+@cache
+def code_heads(versions_dir: Path = MIGRATIONS_DIR) -> frozenset[str]:
+    """Возвращает головные ревизии миграций.
+
+    Файлы ревизий разбираются как текст, без импорта alembic и самих
+    миграций: импорт alembic заметно удлинил бы старт каждого воркера.
+    Головные ревизии - те, на которые не ссылается ни одна down_revision.
+    """
+    revisions = set()
+    parents = set()
+    for path in versions_dir.glob("*.py"):
+        values = dict(REVISION_PATTERN.findall(path.read_text(encoding="utf-8")))
+        if "revision" not in values:
+            continue
+        revisions.add(ast.literal_eval(values["revision"]))
+        down_revision = ast.literal_eval(values.get("down_revision", "None"))
+        if isinstance(down_revision, str):
+            parents.add(down_revision)
+        elif down_revision:
+            parents.update(down_revision)
+    return frozenset(revisions - parents)
+
+
+async def get_schema_status(
+    engine: AsyncEngine, versions_dir: Path = MIGRATIONS_DIR
+) -> SchemaStatus:
+    """Читает ревизии базы данных одним запросом и сравнивает с кодом."""
+    async with engine.connect() as conn:
+        try:
+            database = frozenset((await conn.scalars(CURRENT_REVISIONS_QUERY)).all())
+        except ProgrammingError:
+            # Таблицы alembic_version нет: миграции не применялись
+            database = frozenset()
+    return SchemaStatus(database=database, code=code_heads(versions_dir))
+
+
+async def check_schema_version(
+    engine: AsyncEngine, mode: str = "fail", versions_dir: Path = MIGRATIONS_DIR
+) -> SchemaStatus | None:
+    """Проверяет, что база данных на головной ревизии миграций.
+
+    mode: "fail" - выбросить SchemaVersionError при расхождении,
+    "warn" - только записать предупреждение, "off" - не проверять.
+    """
+    if mode == "off":
+        return None
+
+    start = time.perf_counter()
+    status = await get_schema_status(engine, versions_dir)
+    metrics.observe("startup_schema_check_seconds", time.perf_counter() - start)
+
+    if status.is_current:
+        log_info("Схема базы данных актуальна", revision=sorted(status.database))
+        return status
+
+    message = "Схема базы данных не совпадает с миграциями, выполните cli.py migrate"
+    if mode == "fail":
+        raise SchemaVersionError(
+            f"{message}: в базе {sorted(status.database)}, в коде {sorted(status.code)}"
+        )
+    log_warning(message, database=sorted(status.database), code=sorted(status.code))
+    return status
@@ -5,7 +5,17 @@ from collections.abc import AsyncGenerator
 from sqlalchemy.ext.asyncio import AsyncSession, async_sessionmaker, create_async_engine
 
 from app.infrastructure.config.settings import get_settings
+from app.infrastructure.database.pool import (
+    forbid_session_state,
+    get_engine_options,
+    get_pool_stats,
+    get_statement_cache_stats,
+    track_connection_hold,
+    track_statement_cache,
+)
+from app.infrastructure.database.replica import PrimarySession
 from app.infrastructure.logging.logger import logger
+from app.infrastructure.monitoring.metrics import metrics
 
 settings = get_settings()
 
@@ -17,6 +27,17 @@ engine = create_async_engine(
     DATABASE_URL,
     echo=False,  # Отключаем вывод SQL запросов независимо от настроек
     future=True,
+    **get_engine_options(settings),
+)
+
+if settings.DB_PGBOUNCER_MODE:
+    forbid_session_state(engine)
+
+track_connection_hold(engine.pool)
+track_statement_cache(engine)
+metrics.register_collector("db_pool", lambda: get_pool_stats(engine))
+metrics.register_collector(
+    "db_statement_cache", lambda: get_statement_cache_stats(engine)
 )
 
 SessionLocal = async_sessionmaker(
@@ -24,7 +45,28 @@ SessionLocal = async_sessionmaker(
     class_=AsyncSession,
     expire_on_commit=False,
     autoflush=False,
+    sync_session_class=PrimarySession,
+)
+
+# Реплика для чтения, если настроена
+replica_engine = (
+    create_async_engine(
+        settings.replica_db_url,
+        echo=False,
+        future=True,
+        **get_engine_options(settings),
+    )
+    if settings.replica_db_url
+    else None
 )
+if replica_engine is not None:
+    if settings.DB_PGBOUNCER_MODE:
+        forbid_session_state(replica_engine)
+    track_connection_hold(replica_engine.pool)
+    track_statement_cache(replica_engine)
+    metrics.register_collector(
+        "db_replica_pool", lambda: get_pool_stats(replica_engine)
+    )
 
 
 async def get_session() -> AsyncGenerator[AsyncSession]:
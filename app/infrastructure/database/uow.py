@@ -1,23 +1,99 @@
+from collections.abc import Callable
+
 from sqlalchemy.ext.asyncio import AsyncSession
 
+from app.domain.interfaces.auth_session_repo import IAuthSessionRepository
 from app.domain.interfaces.uow import IUOW
+from app.domain.interfaces.user_repo import IUserRepository
+from app.infrastructure.database.identity_map import IdentityMap
+from app.infrastructure.database.replica import PRIMARY_PINNED, ReplicaRouter
 from app.infrastructure.database.repositories.auth_session_repo import (
     AuthSessionRepository,
 )
+from app.infrastructure.database.repositories.cached_user_repo import (
+    CachedUserRepository,
+    UserCache,
+)
 from app.infrastructure.database.repositories.user_repo import UserRepository
+from app.infrastructure.monitoring.metrics import metrics
 
 
 class UOW(IUOW):
-    def __init__(self, session: AsyncSession):
+    def __init__(
+        self,
+        session: AsyncSession,
+        replica: ReplicaRouter | None = None,
+        user_cache: UserCache | None = None,
+    ):
         self.session = session
+        self._replica = replica
+        self._user_cache = user_cache
+        self._replica_session: AsyncSession | None = None
+        self.identity_map = IdentityMap()
+        self._users: IUserRepository | None = None
+        self._auth_sessions: IAuthSessionRepository | None = None
+        self._after_transaction: list[Callable[[], None]] = []
+
+    def after_transaction(self, callback: Callable[[], None]) -> None:
+        """Откладывает вызов до конца транзакции: commit, rollback или release."""
+        self._after_transaction.append(callback)
+
+    def _finish_transaction(self) -> None:
+        """Вызывает функции, отложенные до конца транзакции."""
+        callbacks, self._after_transaction = self._after_transaction, []
+        for callback in callbacks:
+            callback()
 
     async def commit(self) -> None:
         """Фиксирует изменения в базе данных."""
-        await self.session.commit()
+        try:
+            await self.session.commit()
+        finally:
+            self._finish_transaction()
 
     async def rollback(self) -> None:
         """Откатывает изменения."""
-        await self.session.rollback()
+        try:
+            await self.session.rollback()
+        finally:
+            self.identity_map.clear()
+            self._finish_transaction()
+
+    async def release(self) -> None:
+        """Возвращает соединение в пул, не дожидаясь конца запроса."""
+        try:
+            await self.session.close()
+        finally:
+            self._finish_transaction()
+        await self._close_replica_session()
+        self.identity_map.finish()
+
+    async def read_session(self) -> AsyncSession:
+        """Сессия для чтения, допускающего реплику.
+
+        После первой записи в этом UOW чтение идет на primary, чтобы
+        видеть собственные изменения (read-your-writes).
+        """
+        if self._replica is None:
+            return self.session
+        if self.session.info.get(PRIMARY_PINNED):
+            metrics.inc("db_reads", target="primary")
+            return self.session
+
+        if self._replica_session is None:
+            self._replica_session = await self._replica.session()
+            if self._replica_session is None:
+                metrics.inc("db_reads", target="primary")
+                return self.session
+
+        metrics.inc("db_reads", target="replica")
+        return self._replica_session
+
+    async def _close_replica_session(self) -> None:
+        """Закрывает сессию реплики, если она открывалась."""
+        if self._replica_session is not None:
+            await self._replica_session.close()
+            self._replica_session = None
 
     async def __aenter__(self):
         """Вход в контекстный менеджер."""
@@ -31,13 +107,33 @@ class UOW(IUOW):
         else:
             await self.commit()
             await self.session.close()
+        await self._close_replica_session()
+        self.identity_map.finish()
 
     @property
-    def users(self) -> UserRepository:
-        """Доступ к репозиторию юзера"""
-        return UserRepository(session=self.session)
+    def users(self) -> IUserRepository:
+        """Доступ к репозиторию юзера (создается один раз на UOW)"""
+        if self._users is None:
+            self._users = UserRepository(
+                session=self.session,
+                read_session=self.read_session,
+                identity_map=self.identity_map,
+            )
+            if self._user_cache is not None:
+                self._users = CachedUserRepository(
+                    self._users,
+                    self._user_cache,
+                    after_transaction=self.after_transaction,
+                )
+        return self._users
 
     @property
-    def auth_sessions(self) -> AuthSessionRepository:
-        """Доступ к репозиторию авторизационных сессий"""
-        return AuthSessionRepository(session=self.session)
+    def auth_sessions(self) -> IAuthSessionRepository:
+        """Доступ к репозиторию авторизационных сессий (один раз на UOW)"""
+        if self._auth_sessions is None:
+            self._auth_sessions = AuthSessionRepository(
+                session=self.session,
+                read_session=self.read_session,
+                identity_map=self.identity_map,
+            )
+        return self._auth_sessions
@@ -5,12 +5,48 @@ from collections.abc import AsyncIterable
 from dishka import Provider, Scope, provide
 from sqlalchemy.ext.asyncio import AsyncSession
 
+from app.application.use_cases.auth.purge_expired_sessions import (
+    PurgeExpiredSessionsUseCase,
+)
+from app.domain.interfaces.password_hasher import IPasswordHasher
+from app.domain.interfaces.rate_limiter import IRateLimitBackend
+from app.domain.interfaces.token_cache import ITokenCache
 from app.domain.interfaces.token_service import ITokenService
 from app.domain.interfaces.uow import IUOW
-from app.infrastructure.config.settings import Settings, get_settings
-from app.infrastructure.database.session import get_session
+from app.domain.interfaces.user_bulk_loader import IUserBulkLoader
+from app.infrastructure.config.settings import (
+    Settings,
+    get_settings,
+    on_settings_reload,
+)
+from app.infrastructure.consts import REFRESH_TOKEN_EXPIRE_DAYS
+from app.infrastructure.database.partitions import AuthSessionPartitionManager
+from app.infrastructure.database.pool import get_pool_usage, prewarm_pool
+from app.infrastructure.database.replica import ReplicaRouter
+from app.infrastructure.database.repositories.cached_user_repo import UserCache
+from app.infrastructure.database.session import (
+    SessionLocal,
+    engine,
+    get_session,
+    replica_engine,
+)
 from app.infrastructure.database.uow import UOW
+from app.infrastructure.database.user_import import CopyUserBulkLoader
+from app.infrastructure.monitoring.metrics import metrics
+from app.infrastructure.services.jwt_keys import JWTKeyRing
+from app.infrastructure.services.password_hasher import PasswordHasher
+from app.infrastructure.services.rate_limiter import (
+    InMemoryRateLimitBackend,
+    RateLimiter,
+)
+from app.infrastructure.services.session_reaper import SessionReaper
+from app.infrastructure.services.token_cache import LRUTokenCache
 from app.infrastructure.services.token_service import TokenService
+from app.infrastructure.services.warmup import (
+    StartupWarmup,
+    prime_repository_statements,
+    prime_token_service,
+)
 
 
 class AppProvider(Provider):
@@ -20,9 +56,13 @@ class AppProvider(Provider):
         """Инициализирует провайдер."""
         super().__init__(scope=Scope.APP)
 
-    @provide
+    @provide(cache=False)
     def settings(self) -> Settings:
-        """Предоставляет настройки приложения."""
+        """Предоставляет текущий снимок настроек.
+
+        Не кэшируется контейнером, чтобы запросы видели снимок после
+        reload_settings; сервисы приложения получают снимок при создании.
+        """
         return get_settings()
 
     @provide(scope=Scope.REQUEST)
@@ -32,12 +72,161 @@ class AppProvider(Provider):
         async for session in async_session:
             yield session
 
+    @provide
+    def replica_router(self, settings: Settings) -> ReplicaRouter:
+        """Предоставляет маршрутизатор чтения на реплику."""
+        return ReplicaRouter(
+            replica_engine,
+            max_lag=settings.DB_REPLICA_MAX_LAG_SECONDS,
+            check_interval=settings.DB_REPLICA_CHECK_INTERVAL,
+            fallback=settings.DB_REPLICA_FALLBACK,
+        )
+
+    @provide
+    def user_cache(self, settings: Settings) -> UserCache:
+        """Предоставляет общий для процесса кэш пользователей."""
+        cache = UserCache(
+            max_size=settings.USER_CACHE_SIZE, ttl=settings.USER_CACHE_TTL_SECONDS
+        )
+        metrics.register_collector("user_cache", cache.stats)
+        return cache
+
     @provide(scope=Scope.REQUEST)
-    async def uow(self, session: AsyncSession) -> IUOW:
+    async def uow(
+        self, session: AsyncSession, replica: ReplicaRouter, user_cache: UserCache
+    ) -> IUOW:
         """Предоставляет Unit of Work."""
-        return UOW(session)
+        return UOW(
+            session,
+            replica if replica.enabled else None,
+            user_cache if user_cache.enabled else None,
+        )
 
     @provide
-    def token_service(self, settings: Settings) -> ITokenService:
+    def user_bulk_loader(self) -> IUserBulkLoader:
+        """Предоставляет загрузчик пользователей через COPY."""
+        return CopyUserBulkLoader(engine)
+
+    @provide
+    def jwt_key_ring(self, settings: Settings) -> JWTKeyRing:
+        """Предоставляет набор ключей для подписи и проверки JWT."""
+        return JWTKeyRing.from_files(
+            settings.JWT_ALGORITHM,
+            private_keys=settings.JWT_PRIVATE_KEYS,
+            public_keys=settings.JWT_PUBLIC_KEYS,
+            active_kid=settings.JWT_ACTIVE_KID,
+        )
+
+    @provide
+    def token_service(self, settings: Settings, key_ring: JWTKeyRing) -> ITokenService:
         """Предоставляет сервис для работы с токенами."""
-        return TokenService(settings.SECRET_KEY, settings.JWT_ALGORITHM)
+        return TokenService(
+            settings.SECRET_KEY,
+            settings.JWT_ALGORITHM,
+            embed_user_claims=settings.AUTH_TRUST_TOKEN_CLAIMS,
+            key_ring=key_ring,
+        )
+
+    @provide
+    def token_cache(self, settings: Settings) -> ITokenCache:
+        """Предоставляет кэш проверенных access-токенов."""
+        return LRUTokenCache(max_size=settings.TOKEN_CACHE_SIZE)
+
+    @provide
+    async def password_hasher(
+        self, settings: Settings
+    ) -> AsyncIterable[IPasswordHasher]:
+        """Предоставляет сервис хэширования паролей."""
+        hasher = PasswordHasher(
+            max_workers=settings.PASSWORD_HASHER_WORKERS,
+            max_queue=settings.PASSWORD_HASHER_MAX_QUEUE,
+        )
+        if settings.PASSWORD_HASH_ROUNDS is not None:
+            hasher.set_rounds(settings.PASSWORD_HASH_ROUNDS)
+        elif settings.PASSWORD_HASH_CALIBRATE:
+            await hasher.calibrate(
+                budget_ms=settings.PASSWORD_HASH_BUDGET_MS,
+                min_rounds=settings.PASSWORD_HASH_MIN_ROUNDS,
+                max_rounds=settings.PASSWORD_HASH_MAX_ROUNDS,
+            )
+        yield hasher
+        hasher.shutdown()
+
+    @provide
+    def rate_limit_backend(self) -> IRateLimitBackend:
+        """Предоставляет хранилище состояния ограничителя запросов."""
+        return InMemoryRateLimitBackend()
+
+    @provide
+    async def rate_limiter(
+        self, settings: Settings, backend: IRateLimitBackend
+    ) -> AsyncIterable[RateLimiter]:
+        """Предоставляет ограничитель частоты запросов."""
+        limiter = RateLimiter(
+            backend, settings.RATE_LIMITS, enabled=settings.RATE_LIMIT_ENABLED
+        )
+        unsubscribe = on_settings_reload(
+            lambda new: limiter.configure(new.RATE_LIMITS, new.RATE_LIMIT_ENABLED)
+        )
+        yield limiter
+        unsubscribe()
+
+    @provide
+    def auth_session_partitions(
+        self, settings: Settings
+    ) -> AuthSessionPartitionManager:
+        """Предоставляет менеджер секций auth_sessions."""
+        interval = settings.AUTH_SESSIONS_PARTITION_DAYS
+        # Новые сессии должны попадать в заранее созданные секции, а не в DEFAULT
+        premake = max(
+            settings.AUTH_SESSIONS_PARTITION_PREMAKE_DAYS,
+            REFRESH_TOKEN_EXPIRE_DAYS + interval,
+        )
+        return AuthSessionPartitionManager(
+            engine, interval_days=interval, premake_days=premake
+        )
+
+    @provide
+    async def session_reaper(
+        self, settings: Settings, partitions: AuthSessionPartitionManager
+    ) -> AsyncIterable[SessionReaper]:
+        """Предоставляет фоновую задачу обслуживания auth_sessions."""
+        usecase = PurgeExpiredSessionsUseCase(
+            lambda: UOW(SessionLocal()),
+            batch_size=settings.SESSION_REAPER_BATCH_SIZE,
+            max_batches=settings.SESSION_REAPER_MAX_BATCHES,
+            batch_pause=settings.SESSION_REAPER_BATCH_PAUSE_SECONDS,
+            is_busy=lambda: (
+                get_pool_usage(engine) > settings.SESSION_REAPER_MAX_POOL_USAGE
+            ),
+        )
+
+        async def maintain() -> int:
+            # Полностью истекшие секции удаляются целиком, остаток - пачками
+            await partitions.maintain()
+            return await usecase.execute()
+
+        reaper = SessionReaper(
+            maintain,
+            interval=settings.SESSION_REAPER_INTERVAL_SECONDS,
+            jitter=settings.SESSION_REAPER_JITTER_SECONDS,
+        )
+        yield reaper
+        await reaper.stop()
+
+    @provide
+    async def startup_warmup(
+        self, settings: Settings, token_service: ITokenService
+    ) -> AsyncIterable[StartupWarmup]:
+        """Предоставляет прогрев воркера с шагами инфраструктуры."""
+        warmup = StartupWarmup(enabled=settings.WARMUP_ENABLED)
+        warmup.add(
+            "db_pool", lambda: prewarm_pool(engine, settings.WARMUP_POOL_CONNECTIONS)
+        )
+        warmup.add(
+            "db_statements",
+            lambda: prime_repository_statements(lambda: UOW(SessionLocal())),
+        )
+        warmup.add("token_service", lambda: prime_token_service(token_service))
+        yield warmup
+        await warmup.stop()
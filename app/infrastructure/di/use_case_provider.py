@@ -9,9 +9,14 @@ from app.application.use_cases.auth.login import LoginUseCase
 from app.application.use_cases.auth.logout import LogoutUseCase
 from app.application.use_cases.auth.refresh import RefreshTokenUseCase
 from app.application.use_cases.users.get_current_user import GetCurrentUserUseCase
+from app.application.use_cases.users.import_users import ImportUsersUseCase
 from app.application.use_cases.users.register import RegisterUserUseCase
+from app.domain.interfaces.password_hasher import IPasswordHasher
+from app.domain.interfaces.token_cache import ITokenCache
 from app.domain.interfaces.token_service import ITokenService
 from app.domain.interfaces.uow import IUOW
+from app.domain.interfaces.user_bulk_loader import IUserBulkLoader
+from app.infrastructure.config.settings import Settings
 
 
 class UseCaseProvider(Provider):
@@ -28,10 +33,13 @@ class UseCaseProvider(Provider):
 
     @provide
     async def login_usecase(
-        self, uow: IUOW, token_service: ITokenService
+        self,
+        uow: IUOW,
+        token_service: ITokenService,
+        password_hasher: IPasswordHasher,
     ) -> LoginUseCase:
         """Предоставляет use case для входа пользователей."""
-        return LoginUseCase(uow, token_service)
+        return LoginUseCase(uow, token_service, password_hasher)
 
     @provide
     async def logout_usecase(self, uow: IUOW, request: Request) -> LogoutUseCase:
@@ -49,8 +57,34 @@ class UseCaseProvider(Provider):
 
     @provide
     async def get_current_user_usecase(
-        self, uow: IUOW, token_service: ITokenService, request: Request
+        self,
+        uow: IUOW,
+        token_service: ITokenService,
+        token_cache: ITokenCache,
+        settings: Settings,
+        request: Request,
     ) -> GetCurrentUserUseCase:
         """Предоставляет use case для получения текущего пользователя."""
         access_token = request.cookies.get("access_token")
-        return GetCurrentUserUseCase(uow, token_service, access_token)
+        return GetCurrentUserUseCase(
+            uow,
+            token_service,
+            access_token,
+            token_cache,
+            trust_token_claims=settings.AUTH_TRUST_TOKEN_CLAIMS,
+        )
+
+    @provide
+    async def import_users_usecase(
+        self,
+        loader: IUserBulkLoader,
+        password_hasher: IPasswordHasher,
+        settings: Settings,
+    ) -> ImportUsersUseCase:
+        """Предоставляет use case для массового импорта пользователей."""
+        return ImportUsersUseCase(
+            loader,
+            password_hasher,
+            batch_size=settings.USER_IMPORT_BATCH_SIZE,
+            max_reported=settings.USER_IMPORT_MAX_REPORTED,
+        )
@@ -41,6 +41,15 @@ logging.getLogger("passlib").setLevel(logging.ERROR)
 logging.getLogger("uvicorn").setLevel(logging.WARNING)
 logging.getLogger("fastapi").setLevel(logging.WARNING)
 
+
+def set_log_level(level: str) -> None:
+    """Устанавливает уровень логирования приложения (например, "DEBUG")."""
+    level = level.upper()
+    logger.setLevel(level)
+    for handler in logger.handlers:
+        handler.setLevel(level)
+
+
 # Функции-обертки для удобного структурированного логирования
 
 
@@ -0,0 +1,95 @@
+"""Простой in-process реестр метрик приложения."""
+
+from collections.abc import Callable
+from dataclasses import dataclass
+
+
+@dataclass
+class Summary:
+    """Агрегат наблюдаемых значений (количество, сумма, максимум)."""
+
+    count: int = 0
+    total: float = 0.0
+    max: float = 0.0
+
+    def observe(self, value: float) -> None:
+        """Добавляет наблюдение."""
+        self.count += 1
+        self.total += value
+        if value > self.max:
+            self.max = value
+
+    def as_dict(self) -> dict[str, float]:
+        """Возвращает агрегат в виде словаря."""
+        avg = self.total / self.count if self.count else 0.0
+        return {"count": self.count, "sum": self.total, "avg": avg, "max": self.max}
+
+
+def _key(name: str, labels: dict[str, object]) -> str:
+    """Формирует ключ метрики с метками в стиле Prometheus."""
+    if not labels:
+        return name
+    rendered = ",".join(f"{k}={v}" for k, v in sorted(labels.items()))
+    return f"{name}{{{rendered}}}"
+
+
+class Metrics:
+    """Реестр счетчиков, gauge-метрик и агрегатов наблюдений."""
+
+    def __init__(self) -> None:
+        """Инициализирует пустой реестр."""
+        self._counters: dict[str, float] = {}
+        self._gauges: dict[str, float] = {}
+        self._summaries: dict[str, Summary] = {}
+        self._collectors: dict[str, Callable[[], dict[str, float]]] = {}
+
+    def inc(self, name: str, value: float = 1, **labels: object) -> None:
+        """Увеличивает счетчик."""
+        key = _key(name, labels)
+        self._counters[key] = self._counters.get(key, 0) + value
+
+    def set_gauge(self, name: str, value: float, **labels: object) -> None:
+        """Устанавливает значение gauge-метрики."""
+        self._gauges[_key(name, labels)] = value
+
+    def observe(self, name: str, value: float, **labels: object) -> None:
+        """Добавляет наблюдение в агрегат."""
+        key = _key(name, labels)
+        summary = self._summaries.get(key)
+        if summary is None:
+            summary = self._summaries[key] = Summary()
+        summary.observe(value)
+
+    def register_collector(
+        self, name: str, collector: Callable[[], dict[str, float]]
+    ) -> None:
+        """Регистрирует функцию, возвращающую gauge-метрики на момент снимка."""
+        self._collectors[name] = collector
+
+    def get(self, name: str, **labels: object) -> float:
+        """Возвращает значение счетчика или gauge-метрики."""
+        key = _key(name, labels)
+        return self._counters.get(key, self._gauges.get(key, 0))
+
+    def snapshot(self) -> dict[str, dict]:
+        """Возвращает снимок всех метрик."""
+        gauges = dict(self._gauges)
+        for name, collector in self._collectors.items():
+            for metric, value in collector().items():
+                gauges[f"{name}_{metric}"] = value
+
+        return {
+            "counters": dict(self._counters),
+            "gauges": gauges,
+            "summaries": {k: v.as_dict() for k, v in self._summaries.items()},
+        }
+
+    def reset(self) -> None:
+        """Сбрасывает все накопленные значения (коллекторы сохраняются)."""
+        self._counters.clear()
+        self._gauges.clear()
+        self._summaries.clear()
+
+
+# Глобальный реестр метрик приложения
+metrics = Metrics()
@@ -0,0 +1,29 @@
+"""Контекст текущего HTTP-запроса для метрик инфраструктуры."""
+
+from collections.abc import Mapping
+from contextvars import ContextVar, Token
+
+_request_scope: ContextVar[Mapping | None] = ContextVar("request_scope", default=None)
+
+
+def bind_request_scope(scope: Mapping) -> Token:
+    """Привязывает ASGI scope запроса к текущему контексту."""
+    return _request_scope.set(scope)
+
+
+def unbind_request_scope(token: Token) -> None:
+    """Отвязывает ASGI scope запроса от текущего контекста."""
+    _request_scope.reset(token)
+
+
+def current_route() -> str:
+    """Шаблон пути текущего запроса ("-" вне запроса или до маршрутизации).
+
+    Используется шаблон маршрута, а не фактический путь, чтобы число
+    значений метки не зависело от параметров в URL.
+    """
+    scope = _request_scope.get()
+    if scope is None:
+        return "-"
+    route = scope.get("route")
+    return getattr(route, "path", None) or "-"
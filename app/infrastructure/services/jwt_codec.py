@@ -0,0 +1,149 @@
+"""Специализированный кодек JWT для фиксированного заголовка HS256."""
+
+import base64
+import binascii
+import hashlib
+import hmac
+import json
+from calendar import timegm
+from datetime import UTC, datetime
+
+import jwt
+from jwt.exceptions import (
+    DecodeError,
+    ExpiredSignatureError,
+    ImmatureSignatureError,
+    InvalidAudienceError,
+    InvalidIssuedAtError,
+    InvalidJTIError,
+    InvalidSignatureError,
+    InvalidSubjectError,
+)
+
+HS256_HEADER = {"alg": "HS256", "typ": "JWT"}
+
+
+def _b64encode(data: bytes) -> str:
+    """base64url без выравнивания, как в JWS."""
+    return base64.urlsafe_b64encode(data).rstrip(b"=").decode("ascii")
+
+
+def _b64decode(data: str) -> bytes:
+    """Обратное к _b64encode преобразование."""
+    return base64.urlsafe_b64decode(data + "=" * (-len(data) % 4))
+
+
+class HS256Codec:
+    """Быстрый кодек JWT с заголовком {"alg":"HS256","typ":"JWT"}.
+
+    Сегмент заголовка закодирован заранее, объект HMAC с ключом создается
+    один раз и копируется на каждую операцию. Результат кодирования
+    побайтно совпадает с jwt.encode, проверка claims повторяет jwt.decode
+    с настройками по умолчанию. Токены с другим заголовком или нарушенной
+    структурой передаются в pyjwt, чтобы ошибки были теми же самыми.
+    """
+
+    def __init__(self, secret_key: str | bytes):
+        """Инициализирует кодек."""
+        if isinstance(secret_key, str):
+            secret_key = secret_key.encode("utf-8")
+        self._secret_key = secret_key
+        self._mac = hmac.new(secret_key, digestmod=hashlib.sha256)
+        self._header_segment = _b64encode(
+            json.dumps(HS256_HEADER, separators=(",", ":")).encode()
+        )
+        self._prefix = f"{self._header_segment}."
+
+    def encode(self, payload: dict) -> str:
+        """Кодирует и подписывает payload."""
+        payload = payload.copy()
+        for time_claim in ("exp", "iat", "nbf"):
+            value = payload.get(time_claim)
+            if isinstance(value, datetime):
+                payload[time_claim] = timegm(value.utctimetuple())
+
+        payload_segment = _b64encode(
+            json.dumps(payload, separators=(",", ":")).encode("utf-8")
+        )
+        signing_input = f"{self._prefix}{payload_segment}"
+        mac = self._mac.copy()
+        mac.update(signing_input.encode("ascii"))
+        return f"{signing_input}.{_b64encode(mac.digest())}"
+
+    def decode(self, token: str) -> dict:
+        """Проверяет подпись и claims токена и возвращает payload."""
+        if not token.startswith(self._prefix):
+            return self._fallback(token)
+
+        signing_input, _, signature_segment = token.rpartition(".")
+        payload_segment = signing_input[len(self._prefix) :]
+        if "." in payload_segment:
+            return self._fallback(token)
+
+        try:
+            signature = _b64decode(signature_segment)
+            mac = self._mac.copy()
+            mac.update(signing_input.encode("ascii"))
+        except (binascii.Error, UnicodeError, ValueError):
+            return self._fallback(token)
+
+        if not hmac.compare_digest(mac.digest(), signature):
+            raise InvalidSignatureError("Signature verification failed")
+
+        try:
+            payload = json.loads(_b64decode(payload_segment))
+        except (binascii.Error, UnicodeError, ValueError):
+            return self._fallback(token)
+        if not isinstance(payload, dict):
+            return self._fallback(token)
+
+        self._validate_claims(payload)
+        return payload
+
+    def _fallback(self, token: str) -> dict:
+        """Декодирует токен общим путем pyjwt."""
+        return jwt.decode(token, self._secret_key, algorithms=["HS256"])
+
+    @staticmethod
+    def _validate_claims(payload: dict) -> None:
+        """Проверяет claims так же, как jwt.decode с опциями по умолчанию."""
+        now = datetime.now(tz=UTC).timestamp()
+
+        if "iat" in payload:
+            try:
+                iat = int(payload["iat"])
+            except ValueError:
+                raise InvalidIssuedAtError(
+                    "Issued At claim (iat) must be an integer."
+                ) from None
+            if iat > now:
+                raise ImmatureSignatureError("The token is not yet valid (iat)")
+
+        if "nbf" in payload:
+            try:
+                nbf = int(payload["nbf"])
+            except ValueError:
+                raise DecodeError(
+                    "Not Before claim (nbf) must be an integer."
+                ) from None
+            if nbf > now:
+                raise ImmatureSignatureError("The token is not yet valid (nbf)")
+
+        if "exp" in payload:
+            try:
+                exp = int(payload["exp"])
+            except ValueError:
+                raise DecodeError(
+                    "Expiration Time claim (exp) must be an integer."
+                ) from None
+            if exp <= now:
+                raise ExpiredSignatureError("Signature has expired")
+
+        if payload.get("aud"):
+            raise InvalidAudienceError("Invalid audience")
+
+        if "sub" in payload and not isinstance(payload["sub"], str):
+            raise InvalidSubjectError("Subject must be a string")
+
+        if "jti" in payload and not isinstance(payload["jti"], str):
+            raise InvalidJTIError("JWT ID must be a string")
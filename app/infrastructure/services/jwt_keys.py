@@ -0,0 +1,101 @@
+"""Набор ключей для подписи и проверки JWT с ротацией по kid."""
+
+import hashlib
+import json
+from pathlib import Path
+
+import jwt
+from jwt.algorithms import Algorithm
+
+ASYMMETRIC_ALGORITHMS = {"EdDSA", "ES256"}
+
+
+class JWTKeyRing:
+    """Набор ключей JWT, проиндексированный по kid.
+
+    Ключи разбираются один раз при создании. Подписывает активный ключ,
+    проверка допускается любым известным ключом - так работает ротация:
+    новый ключ становится активным, старый остается только для проверки,
+    пока не истекут выпущенные им токены. JWKS сериализуется заранее.
+    """
+
+    def __init__(
+        self,
+        algorithm: str,
+        signing_keys: dict[str, object] | None = None,
+        verification_keys: dict[str, object] | None = None,
+        active_kid: str | None = None,
+    ):
+        """Инициализирует набор ключей."""
+        self.algorithm = algorithm
+        self.active_kid = active_kid
+        self._signing_keys = signing_keys or {}
+        self._verification_keys = verification_keys or {}
+
+        if self.is_asymmetric and active_kid not in self._signing_keys:
+            raise ValueError(
+                f"Для алгоритма {algorithm} нужен приватный ключ с kid={active_kid}"
+            )
+
+        self.jwks = self._build_jwks()
+        self.jwks_json = json.dumps(self.jwks, separators=(",", ":")).encode()
+        self.jwks_etag = f'"{hashlib.sha256(self.jwks_json).hexdigest()[:32]}"'
+
+    @classmethod
+    def from_files(
+        cls,
+        algorithm: str,
+        private_keys: dict[str, str],
+        public_keys: dict[str, str],
+        active_kid: str | None = None,
+    ) -> "JWTKeyRing":
+        """Загружает PEM-ключи из файлов (kid -> путь к файлу)."""
+        if algorithm not in ASYMMETRIC_ALGORITHMS:
+            return cls(algorithm)
+
+        jwt_algorithm = jwt.get_algorithm_by_name(algorithm)
+        signing_keys = {
+            kid: _load_key(jwt_algorithm, path) for kid, path in private_keys.items()
+        }
+        verification_keys = {
+            kid: _load_key(jwt_algorithm, path) for kid, path in public_keys.items()
+        }
+        return cls(algorithm, signing_keys, verification_keys, active_kid)
+
+    @property
+    def is_asymmetric(self) -> bool:
+        """Используется ли асимметричный алгоритм подписи."""
+        return self.algorithm in ASYMMETRIC_ALGORITHMS
+
+    @property
+    def signing_key(self) -> object:
+        """Приватный ключ для подписи новых токенов."""
+        return self._signing_keys[self.active_kid]
+
+    def verification_key(self, kid: str | None) -> object:
+        """Возвращает публичный ключ для проверки токена по kid."""
+        key = self._verification_keys.get(kid)
+        if key is None:
+            signing_key = self._signing_keys.get(kid)
+            if signing_key is None:
+                raise jwt.InvalidKeyError(f"Неизвестный kid: {kid}")
+            key = self._verification_keys[kid] = signing_key.public_key()
+        return key
+
+    def _build_jwks(self) -> dict:
+        """Формирует JWKS со всеми публичными ключами."""
+        if not self.is_asymmetric:
+            return {"keys": []}
+
+        jwt_algorithm = jwt.get_algorithm_by_name(self.algorithm)
+        kids = dict.fromkeys([*self._signing_keys, *self._verification_keys])
+        keys = []
+        for kid in kids:
+            jwk = jwt_algorithm.to_jwk(self.verification_key(kid), as_dict=True)
+            keys.append({**jwk, "kid": kid, "alg": self.algorithm, "use": "sig"})
+        return {"keys": keys}
+
+
+def _load_key(algorithm: Algorithm, path: str) -> object:
+    """Загружает и разбирает PEM-ключ."""
+    return algorithm.prepare_key(Path(path).read_bytes())
@@ -0,0 +1,182 @@
+"""Сервис хэширования паролей в пуле процессов."""
+
+import asyncio
+import multiprocessing
+import time
+from collections.abc import Sequence
+from concurrent.futures import ProcessPoolExecutor
+from functools import lru_cache
+
+from passlib.context import CryptContext
+
+from app.domain.exceptions import ServiceUnavailableException
+from app.domain.interfaces.password_hasher import IPasswordHasher
+from app.infrastructure.logging.logger import log_info
+from app.infrastructure.monitoring.metrics import metrics
+
+pwd_context = CryptContext(schemes=["bcrypt"], deprecated="auto")
+
+CALIBRATION_PASSWORD = "calibration-password"
+
+
+@lru_cache
+def _get_context(rounds: int | None) -> CryptContext:
+    """Возвращает контекст passlib для заданной стоимости bcrypt.
+
+    Верхняя граница не задается: needs_update считает устаревшими только
+    более слабые хэши, и перехэширование при входе лишь повышает стоимость.
+    """
+    if rounds is None:
+        return pwd_context
+    return pwd_context.copy(bcrypt__default_rounds=rounds, bcrypt__min_rounds=rounds)
+
+
+def _hash_password(password: str, rounds: int | None = None) -> str:
+    """Хэширует пароль (выполняется в процессе пула)."""
+    return _get_context(rounds).hash(password)
+
+
+def _hash_passwords(passwords: list[str], rounds: int | None = None) -> list[str]:
+    """Хэширует пачку паролей (выполняется в процессе пула)."""
+    context = _get_context(rounds)
+    return [context.hash(password) for password in passwords]
+
+
+def _verify_password(password: str, hashed_password: str) -> bool:
+    """Проверяет пароль (выполняется в процессе пула)."""
+    return pwd_context.verify(password, hashed_password)
+
+
+def _measure_hash_time(rounds: int) -> float:
+    """Замеряет время одного хэширования (выполняется в процессе пула)."""
+    context = _get_context(rounds)
+    start = time.perf_counter()
+    context.hash(CALIBRATION_PASSWORD)
+    return time.perf_counter() - start
+
+
+class PasswordHasher(IPasswordHasher):
+    """Сервис хэширования паролей.
+
+    bcrypt выполняется в ProcessPoolExecutor, поэтому не блокирует event loop
+    и масштабируется на все ядра. Количество ожидающих задач ограничено:
+    при переполнении очереди запрос отклоняется, а не копится в памяти.
+    Массовое хэширование (hash_many) оставляет reserved_workers процессов
+    свободными, чтобы вход и регистрация не ждали импорт.
+    """
+
+    def __init__(
+        self,
+        max_workers: int | None = None,
+        max_queue: int = 64,
+        reserved_workers: int = 1,
+    ):
+        """Инициализирует сервис хэширования паролей."""
+        self._executor = ProcessPoolExecutor(
+            max_workers=max_workers,
+            mp_context=multiprocessing.get_context("spawn"),
+        )
+        self._workers = self._executor._max_workers
+        self._bulk_slots = asyncio.Semaphore(max(1, self._workers - reserved_workers))
+        self._max_queue = max_queue
+        self._pending = 0
+        self._rounds: int | None = None
+
+    @property
+    def pending(self) -> int:
+        """Количество задач, ожидающих выполнения в пуле."""
+        return self._pending
+
+    @property
+    def rounds(self) -> int | None:
+        """Стоимость bcrypt, выбранная калибровкой (None - по умолчанию)."""
+        return self._rounds
+
+    async def hash(self, password: str) -> str:
+        """Хэширует пароль."""
+        return await self._run(_hash_password, password, self._rounds)
+
+    async def hash_many(
+        self, passwords: Sequence[str], chunk_size: int = 16
+    ) -> list[str]:
+        """Хэширует пачку паролей в процессах пула.
+
+        Пачка делится на части по chunk_size паролей. Части всех
+        одновременных вызовов делят общий лимит процессов: reserved_workers
+        процессов остаются для одиночных hash и verify, но импорту всегда
+        доступен хотя бы один процесс.
+        """
+
+        async def hash_chunk(chunk: list[str]) -> list[str]:
+            async with self._bulk_slots:
+                return await self._run(_hash_passwords, chunk, self._rounds)
+
+        chunks = [
+            list(passwords[start : start + chunk_size])
+            for start in range(0, len(passwords), chunk_size)
+        ]
+        results = await asyncio.gather(*(hash_chunk(chunk) for chunk in chunks))
+        return [hashed for chunk in results for hashed in chunk]
+
+    async def verify(self, password: str, hashed_password: str) -> bool:
+        """Проверяет, совпадает ли пароль с хэшированным паролем."""
+        return await self._run(_verify_password, password, hashed_password)
+
+    def needs_update(self, hashed_password: str) -> bool:
+        """Проверяет, нужно ли перехэшировать пароль с текущей стоимостью."""
+        return _get_context(self._rounds).needs_update(hashed_password)
+
+    def set_rounds(self, rounds: int) -> None:
+        """Задает стоимость bcrypt без калибровки."""
+        self._rounds = rounds
+        metrics.set_gauge("password_hash_rounds", rounds)
+
+    async def calibrate(
+        self, budget_ms: float, min_rounds: int = 12, max_rounds: int = 14
+    ) -> int:
+        """Подбирает максимальную стоимость bcrypt, укладывающуюся в бюджет.
+
+        Стоимость min_rounds принимается всегда, как нижняя граница безопасности.
+        Каждый следующий раунд удваивает время, поэтому заведомо не
+        укладывающиеся в бюджет значения не замеряются.
+        """
+        budget = budget_ms / 1000
+        rounds = min_rounds
+        elapsed = await self._run(_measure_hash_time, rounds)
+        chosen_rounds, chosen_elapsed = rounds, elapsed
+
+        while rounds < max_rounds and elapsed * 2 <= budget:
+            rounds += 1
+            elapsed = await self._run(_measure_hash_time, rounds)
+            if elapsed > budget:
+                break
+            chosen_rounds, chosen_elapsed = rounds, elapsed
+
+        self.set_rounds(chosen_rounds)
+        metrics.set_gauge("password_hash_seconds", chosen_elapsed)
+        log_info(
+            "Стоимость bcrypt откалибрована",
+            rounds=chosen_rounds,
+            hash_ms=round(chosen_elapsed * 1000, 1),
+            budget_ms=budget_ms,
+        )
+        return chosen_rounds
+
+    def shutdown(self) -> None:
+        """Останавливает пул процессов."""
+        self._executor.shutdown(wait=False, cancel_futures=True)
+
+    async def _run(self, func, *args):
+        """Выполняет функцию в пуле процессов с учетом лимита очереди."""
+        if self._pending >= self._max_queue:
+            raise ServiceUnavailableException(
+                message="Сервис хэширования паролей перегружен",
+                details={"pending": self._pending, "max_queue": self._max_queue},
+            )
+
+        self._pending += 1
+        try:
+            loop = asyncio.get_running_loop()
+            return await loop.run_in_executor(self._executor, func, *args)
+        finally:
+            self._pending -= 1
@@ -0,0 +1,124 @@
+"""Ограничитель частоты запросов для публичных эндпоинтов."""
+
+import math
+import time
+from collections.abc import Callable
+from dataclasses import dataclass
+
+from app.domain.exceptions import RateLimitException
+from app.domain.interfaces.rate_limiter import IRateLimitBackend
+from app.infrastructure.monitoring.metrics import metrics
+
+
+@dataclass(frozen=True, slots=True)
+class RateLimitRule:
+    """Правило ограничения: не более limit запросов за window секунд."""
+
+    limit: int
+    window: float
+
+    @classmethod
+    def parse(cls, value: str) -> "RateLimitRule":
+        """Разбирает правило из строки вида "10/60"."""
+        limit, _, window = value.partition("/")
+        return cls(limit=int(limit), window=float(window))
+
+
+class InMemoryRateLimitBackend(IRateLimitBackend):
+    """In-memory хранилище со скользящим окном (sliding window counter).
+
+    На каждый ключ хранится список [номер окна, счетчик прошлого окна,
+    счетчик текущего окна, длина окна]. Оценка числа запросов за последние
+    window секунд - взвешенная сумма двух соседних окон. Устаревшие ключи
+    удаляются периодической чисткой.
+    """
+
+    def __init__(
+        self,
+        sweep_interval: float = 60.0,
+        clock: Callable[[], float] = time.monotonic,
+    ):
+        """Инициализирует хранилище."""
+        self._entries: dict[str, list] = {}
+        self._sweep_interval = sweep_interval
+        self._clock = clock
+        self._next_sweep = clock() + sweep_interval
+
+    def __len__(self) -> int:
+        """Количество отслеживаемых ключей."""
+        return len(self._entries)
+
+    async def hit(self, key: str, limit: int, window: float) -> float:
+        """Учитывает запрос по ключу."""
+        now = self._clock()
+        if now >= self._next_sweep:
+            self._sweep(now)
+
+        index = math.floor(now / window)
+        entry = self._entries.get(key)
+        if entry is None:
+            entry = self._entries[key] = [index, 0, 0, window]
+        elif entry[0] != index:
+            entry[1] = entry[2] if entry[0] == index - 1 else 0
+            entry[2] = 0
+            entry[0] = index
+
+        elapsed = now - index * window
+        estimated = entry[1] * (1 - elapsed / window) + entry[2]
+        if estimated + 1 > limit:
+            return window - elapsed
+
+        entry[2] += 1
+        return 0
+
+    def _sweep(self, now: float) -> None:
+        """Удаляет ключи, не обновлявшиеся дольше двух окон."""
+        expired = [
+            key
+            for key, (index, _, _, window) in self._entries.items()
+            if math.floor(now / window) - index > 1
+        ]
+        for key in expired:
+            del self._entries[key]
+        self._next_sweep = now + self._sweep_interval
+
+
+class RateLimiter:
+    """Проверяет лимиты запросов по IP и email для именованных маршрутов.
+
+    Правила задаются словарем вида {"login:ip": "20/60", "login:email": "5/60"}.
+    """
+
+    def __init__(
+        self,
+        backend: IRateLimitBackend,
+        rules: dict[str, str],
+        enabled: bool = True,
+    ):
+        """Инициализирует ограничитель."""
+        self.backend = backend
+        self.configure(rules, enabled)
+
+    def configure(self, rules: dict[str, str], enabled: bool = True) -> None:
+        """Заменяет правила (например, после перечитывания настроек)."""
+        self.rules = {name: RateLimitRule.parse(rule) for name, rule in rules.items()}
+        self.enabled = enabled
+
+    async def check(
+        self, route: str, ip: str | None = None, email: str | None = None
+    ) -> None:
+        """Учитывает запрос и выбрасывает RateLimitException при превышении."""
+        if not self.enabled:
+            return
+
+        for scope, value in (("ip", ip), ("email", email and email.lower())):
+            rule = self.rules.get(f"{route}:{scope}")
+            if rule is None or not value:
+                continue
+
+            retry_after = await self.backend.hit(
+                f"{route}:{scope}:{value}", rule.limit, rule.window
+            )
+            if retry_after > 0:
+                metrics.inc("rate_limit_rejected", route=route, scope=scope)
+                raise RateLimitException(retry_after=retry_after)
@@ -0,0 +1,76 @@
+"""Фоновая задача удаления истекших авторизационных сессий."""
+
+import asyncio
+import random
+import time
+from collections.abc import Awaitable, Callable
+from contextlib import suppress
+
+from app.infrastructure.logging.logger import log_error, log_info
+from app.infrastructure.monitoring.metrics import metrics
+
+
+class SessionReaper:
+    """Периодически запускает удаление истекших сессий.
+
+    Интервал между запусками случайно сдвигается на ±jitter секунд,
+    чтобы воркеры разных процессов не чистили таблицу одновременно.
+    """
+
+    def __init__(
+        self,
+        purge: Callable[[], Awaitable[int]],
+        interval: float = 300.0,
+        jitter: float = 60.0,
+        rng: Callable[[float, float], float] = random.uniform,
+    ):
+        """Инициализирует задачу."""
+        self._purge = purge
+        self._interval = interval
+        self._jitter = min(jitter, interval)
+        self._rng = rng
+        self._task: asyncio.Task | None = None
+
+    def start(self) -> None:
+        """Запускает задачу в фоне."""
+        if self._task is None:
+            self._task = asyncio.create_task(self._run(), name="session-reaper")
+
+    async def stop(self) -> None:
+        """Останавливает задачу."""
+        if self._task is None:
+            return
+        self._task.cancel()
+        with suppress(asyncio.CancelledError):
+            await self._task
+        self._task = None
+
+    async def run_once(self) -> int:
+        """Выполняет один запуск удаления и публикует метрики."""
+        start = time.perf_counter()
+        purged = await self._purge()
+        elapsed = time.perf_counter() - start
+
+        metrics.inc("auth_sessions_purged", purged)
+        metrics.set_gauge("auth_sessions_purged_last_run", purged)
+        metrics.observe("session_reaper_run_seconds", elapsed)
+        log_info(
+            "Истекшие сессии удалены",
+            purged=purged,
+            elapsed_ms=round(elapsed * 1000, 1),
+        )
+        return purged
+
+    def next_delay(self) -> float:
+        """Задержка до следующего запуска."""
+        return self._interval + self._rng(-self._jitter, self._jitter)
+
+    async def _run(self) -> None:
+        """Цикл периодических запусков."""
+        while True:
+            await asyncio.sleep(self.next_delay())
+            try:
+                await self.run_once()
+            except Exception as e:
+                metrics.inc("session_reaper_errors")
+                log_error("Ошибка при удалении истекших сессий", error=e)
@@ -0,0 +1,66 @@
+"""LRU-кэш проверенных access-токенов."""
+
+import hashlib
+import time
+from collections import OrderedDict
+from collections.abc import Callable
+
+from app.domain.interfaces.token_cache import ITokenCache
+from app.infrastructure.monitoring.metrics import metrics
+
+
+class LRUTokenCache(ITokenCache):
+    """Ограниченный по размеру LRU-кэш claims access-токенов.
+
+    Ключ - дайджест токена, а не сам токен. Запись живет до claim `exp`
+    токена; токены без `exp` не кэшируются.
+    """
+
+    def __init__(self, max_size: int = 10_000, clock: Callable[[], float] = time.time):
+        """Инициализирует кэш."""
+        self._entries: OrderedDict[bytes, tuple[float, dict]] = OrderedDict()
+        self._max_size = max_size
+        self._clock = clock
+        self.hits = 0
+        self.misses = 0
+        self.evictions = 0
+
+    def __len__(self) -> int:
+        """Количество записей в кэше."""
+        return len(self._entries)
+
+    def get(self, token: str) -> dict | None:
+        """Возвращает claims токена, если они есть в кэше и не истекли."""
+        key = self._digest(token)
+        entry = self._entries.get(key)
+        if entry is not None:
+            expires_at, claims = entry
+            if expires_at > self._clock():
+                self._entries.move_to_end(key)
+                self.hits += 1
+                metrics.inc("token_cache_hits")
+                return claims
+            del self._entries[key]
+
+        self.misses += 1
+        metrics.inc("token_cache_misses")
+        return None
+
+    def put(self, token: str, claims: dict) -> None:
+        """Сохраняет claims токена до истечения его срока."""
+        expires_at = claims.get("exp")
+        if self._max_size <= 0 or not isinstance(expires_at, int | float):
+            return
+
+        key = self._digest(token)
+        self._entries[key] = (expires_at, claims)
+        self._entries.move_to_end(key)
+        while len(self._entries) > self._max_size:
+            self._entries.popitem(last=False)
+            self.evictions += 1
+            metrics.inc("token_cache_evictions")
+
+    @staticmethod
+    def _digest(token: str) -> bytes:
+        """Возвращает дайджест токена, используемый как ключ кэша."""
+        return hashlib.blake2b(token.encode(), digest_size=16).digest()
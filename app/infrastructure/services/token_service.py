@@ -4,27 +4,59 @@ from uuid import UUID
 import jwt
 from uuid_extensions import uuid7
 
+from app.domain.entities.user import User
 from app.infrastructure.consts import (
     ACCESS_TOKEN_EXPIRE_MINUTES,
     JWT_ALGORITHM,
     REFRESH_TOKEN_EXPIRE_DAYS,
 )
+from app.infrastructure.services.jwt_codec import HS256Codec
+from app.infrastructure.services.jwt_keys import JWTKeyRing
 
 
 class TokenService:
     """Сервис для работы с токенами."""
 
-    def __init__(self, secret_key: str, algorithm: str = JWT_ALGORITHM):
-        """Инициализирует сервис для работы с токенами."""
+    def __init__(
+        self,
+        secret_key: str,
+        algorithm: str = JWT_ALGORITHM,
+        embed_user_claims: bool = False,
+        key_ring: JWTKeyRing | None = None,
+    ):
+        """Инициализирует сервис для работы с токенами.
+
+        Для асимметричных алгоритмов (EdDSA, ES256) токены подписываются
+        активным ключом из key_ring и содержат его kid в заголовке.
+        """
         self.secret_key = secret_key
         self.algorithm = algorithm
+        self.embed_user_claims = embed_user_claims
+        self.key_ring = key_ring if key_ring and key_ring.is_asymmetric else None
+        self._codec = HS256Codec(secret_key) if algorithm == "HS256" else None
 
-    def generate_access_token(self, email: str) -> str:
+    def generate_access_token(self, email: str, user: User | None = None) -> str:
         """Генерирует access token."""
         payload = {
             "sub": email,
             "exp": datetime.now(UTC) + timedelta(minutes=ACCESS_TOKEN_EXPIRE_MINUTES),
         }
+        if self.embed_user_claims and user is not None:
+            payload.update(
+                is_active=user.is_active,
+                is_verified=user.is_verified,
+                created_at=_isoformat(user.created_at),
+                updated_at=_isoformat(user.updated_at),
+            )
+        if self.key_ring:
+            return jwt.encode(
+                payload,
+                self.key_ring.signing_key,
+                algorithm=self.algorithm,
+                headers={"kid": self.key_ring.active_kid},
+            )
+        if self._codec:
+            return self._codec.encode(payload)
         encoded_jwt = jwt.encode(payload, self.secret_key, algorithm=self.algorithm)
         return f"{encoded_jwt}"
 
@@ -32,8 +64,31 @@ class TokenService:
         """Декодирует access token."""
         if token.startswith("Bearer "):
             token = token[7:]
+        if self.key_ring:
+            kid = jwt.get_unverified_header(token).get("kid")
+            key = self.key_ring.verification_key(kid)
+            return jwt.decode(token, key, algorithms=[self.algorithm])
+        if self._codec:
+            return self._codec.decode(token)
         return jwt.decode(token, self.secret_key, algorithms=[self.algorithm])
 
+    def user_from_claims(self, claims: dict) -> User | None:
+        """Собирает пользователя из claims токена.
+
+        Хэш пароля в токен не попадает, поэтому hashed_password пустой.
+        """
+        if "is_active" not in claims:
+            return None
+
+        return User(
+            email=claims["sub"],
+            hashed_password="",
+            is_active=claims["is_active"],
+            is_verified=claims["is_verified"],
+            created_at=_fromisoformat(claims.get("created_at")),
+            updated_at=_fromisoformat(claims.get("updated_at")),
+        )
+
     def generate_refresh_token(self) -> UUID:
         """Генерирует refresh token."""
         return uuid7()
@@ -41,3 +96,13 @@ class TokenService:
     def get_refresh_token_expires_at(self) -> datetime:
         """Возвращает срок действия refresh token."""
         return datetime.now(UTC) + timedelta(days=REFRESH_TOKEN_EXPIRE_DAYS)
+
+
+def _isoformat(value: datetime | None) -> str | None:
+    """Сериализует дату в claim токена."""
+    return value.isoformat() if value else None
+
+
+def _fromisoformat(value: str | None) -> datetime | None:
+    """Десериализует дату из claim токена."""
+    return datetime.fromisoformat(value) if value else None
@@ -0,0 +1,121 @@
+"""Потоковый разбор файлов импорта пользователей (CSV и NDJSON)."""
+
+import codecs
+import csv
+import json
+from collections.abc import AsyncIterable, AsyncIterator
+
+from app.domain.entities.user_import import UserImportRow
+
+FORMATS = ("csv", "ndjson")
+
+_TRUE = {"1", "true", "yes", "y", "t"}
+_FALSE = {"0", "false", "no", "n", "f", ""}
+
+
+async def iter_lines(chunks: AsyncIterable[bytes]) -> AsyncIterator[str]:
+    """Разбивает поток байтов UTF-8 на строки без чтения всего потока."""
+    decoder = codecs.getincrementaldecoder("utf-8-sig")()
+    buffer = ""
+    async for chunk in chunks:
+        buffer += decoder.decode(chunk)
+        *lines, buffer = buffer.split("\n")
+        for line in lines:
+            yield line.rstrip("\r")
+    buffer += decoder.decode(b"", final=True)
+    if buffer:
+        yield buffer.rstrip("\r")
+
+
+def _parse_bool(value: object, default: bool) -> bool:
+    """Разбирает логическое значение из CSV или JSON."""
+    if value is None:
+        return default
+    if isinstance(value, bool):
+        return value
+    text = str(value).strip().lower()
+    if text in _TRUE:
+        return True
+    if text in _FALSE:
+        return False
+    raise ValueError(f"ожидалось логическое значение, получено {value!r}")
+
+
+def _make_row(line: int, fields: dict) -> UserImportRow:
+    """Строит строку импорта из словаря полей."""
+    try:
+        return UserImportRow(
+            line=line,
+            email=str(fields.get("email") or "").strip(),
+            password=fields.get("password") or None,
+            hashed_password=fields.get("hashed_password") or None,
+            is_active=_parse_bool(fields.get("is_active"), True),
+            is_verified=_parse_bool(fields.get("is_verified"), False),
+        )
+    except ValueError as e:
+        return UserImportRow(line=line, email="", error=str(e))
+
+
+async def parse_csv(lines: AsyncIterable[str]) -> AsyncIterator[UserImportRow]:
+    """Разбирает CSV с заголовком.
+
+    Обязателен столбец email и один из password или hashed_password;
+    is_active и is_verified необязательны. Значения с переводом строки
+    внутри кавычек не поддерживаются.
+    """
+    header: list[str] | None = None
+    number = 0
+    async for line in lines:
+        number += 1
+        if not line.strip():
+            continue
+        values = next(csv.reader([line]))
+        if header is None:
+            header = [name.strip().lower() for name in values]
+            if "email" not in header or not {"password", "hashed_password"} & set(
+                header
+            ):
+                yield UserImportRow(
+                    line=number,
+                    email="",
+                    error="в заголовке нужны email и password или hashed_password",
+                )
+                return
+            continue
+        if len(values) != len(header):
+            yield UserImportRow(
+                line=number,
+                email="",
+                error=f"ожидалось {len(header)} столбцов, получено {len(values)}",
+            )
+            continue
+        yield _make_row(number, dict(zip(header, values, strict=True)))
+
+
+async def parse_ndjson(lines: AsyncIterable[str]) -> AsyncIterator[UserImportRow]:
+    """Разбирает NDJSON: по одному JSON-объекту с полями CSV на строку."""
+    number = 0
+    async for line in lines:
+        number += 1
+        if not line.strip():
+            continue
+        try:
+            fields = json.loads(line)
+        except ValueError as e:
+            yield UserImportRow(line=number, email="", error=f"некорректный JSON: {e}")
+            continue
+        if not isinstance(fields, dict):
+            yield UserImportRow(line=number, email="", error="ожидался JSON-объект")
+            continue
+        yield _make_row(number, fields)
+
+
+def parse_users(
+    chunks: AsyncIterable[bytes], file_format: str
+) -> AsyncIterator[UserImportRow]:
+    """Разбирает поток байтов файла импорта в заданном формате."""
+    if file_format == "csv":
+        return parse_csv(iter_lines(chunks))
+    if file_format == "ndjson":
+        return parse_ndjson(iter_lines(chunks))
+    raise ValueError(f"Неподдерживаемый формат импорта: {file_format}")
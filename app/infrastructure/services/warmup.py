@@ -0,0 +1,123 @@
+"""Прогрев воркера после старта и признак готовности к трафику."""
+
+import asyncio
+import inspect
+import time
+from collections.abc import Awaitable, Callable
+from contextlib import suppress
+from datetime import UTC, datetime
+from uuid import UUID
+
+from app.domain.entities.user import User
+from app.domain.interfaces.token_service import ITokenService
+from app.domain.interfaces.uow import IUOW
+from app.infrastructure.logging.logger import log_error, log_info
+from app.infrastructure.monitoring.metrics import metrics
+
+# Ключи, которых заведомо нет в базе (домен .invalid зарезервирован RFC 2606)
+WARMUP_EMAIL = "warmup@warmup.invalid"
+WARMUP_TOKEN = UUID(int=0)
+
+
+class StartupWarmup:
+    """Выполняет шаги прогрева в фоне и отмечает готовность воркера.
+
+    Пока прогрев не завершен, ready ложно и /ready отвечает 503, поэтому
+    балансировщик не отправляет на воркер трафик, а первые запросы не
+    платят за открытие соединений и компиляцию запросов. Ошибка шага
+    логируется и не мешает готовности: прогрев - только оптимизация.
+    """
+
+    def __init__(self, enabled: bool = True):
+        """Инициализирует прогрев."""
+        self.enabled = enabled
+        self.timings: dict[str, float] = {}
+        self._steps: list[tuple[str, Callable[[], object]]] = []
+        self._ready = asyncio.Event()
+        self._task: asyncio.Task | None = None
+
+    @property
+    def ready(self) -> bool:
+        """Завершен ли прогрев."""
+        return self._ready.is_set()
+
+    def add(self, name: str, step: Callable[[], Awaitable[object] | object]) -> None:
+        """Добавляет шаг прогрева (синхронный или асинхронный)."""
+        self._steps.append((name, step))
+
+    def start(self) -> None:
+        """Запускает прогрев в фоне."""
+        if self._task is None:
+            self._task = asyncio.create_task(self.run(), name="startup-warmup")
+
+    async def stop(self) -> None:
+        """Прерывает незавершенный прогрев."""
+        if self._task is None:
+            return
+        self._task.cancel()
+        with suppress(asyncio.CancelledError):
+            await self._task
+        self._task = None
+
+    async def wait(self) -> None:
+        """Ожидает завершения прогрева."""
+        await self._ready.wait()
+
+    async def run(self) -> None:
+        """Выполняет шаги по очереди и публикует время каждого."""
+        if self.enabled:
+            started = time.perf_counter()
+            for name, step in self._steps:
+                start = time.perf_counter()
+                try:
+                    result = step()
+                    if inspect.isawaitable(result):
+                        await result
+                except Exception as e:
+                    metrics.inc("startup_warmup_errors", step=name)
+                    log_error("Ошибка прогрева", error=e, step=name)
+                elapsed = time.perf_counter() - start
+                self.timings[name] = elapsed
+                metrics.observe("startup_warmup_seconds", elapsed, step=name)
+
+            total = time.perf_counter() - started
+            metrics.set_gauge("startup_warmup_total_seconds", total)
+            log_info(
+                "Прогрев завершен",
+                elapsed_ms=round(total * 1000, 1),
+                steps={k: round(v * 1000, 1) for k, v in self.timings.items()},
+            )
+        self._ready.set()
+
+
+async def prime_repository_statements(uow_factory: Callable[[], IUOW]) -> None:
+    """Выполняет запросы репозиториев по несуществующим ключам и откатывает.
+
+    Запросы компилируются и попадают в кэш SQLAlchemy до первого запроса
+    к API. Вставки не выполняются: они требуют существующего пользователя.
+    """
+    uow = uow_factory()
+    try:
+        users, auth_sessions = uow.users, uow.auth_sessions
+        expires_at = datetime.now(UTC)
+        await users.find_by_email(WARMUP_EMAIL)
+        await users.update_password(WARMUP_EMAIL, "")
+        await auth_sessions.find_by_refresh_token(WARMUP_TOKEN)
+        await auth_sessions.update_refresh_token(WARMUP_TOKEN, WARMUP_TOKEN, expires_at)
+        await auth_sessions.delete_by_refresh_token(WARMUP_TOKEN)
+        await auth_sessions.pop_by_refresh_token(WARMUP_TOKEN)
+        await auth_sessions.rotate_refresh_token(WARMUP_TOKEN, WARMUP_TOKEN, expires_at)
+        await auth_sessions.delete_expired(0)
+    finally:
+        await uow.rollback()
+        await uow.release()
+
+
+def prime_token_service(token_service: ITokenService) -> None:
+    """Выпускает и проверяет access-токен, чтобы прогреть ключи и кодек."""
+    token = token_service.generate_access_token(
+        WARMUP_EMAIL, User(email=WARMUP_EMAIL, hashed_password="")
+    )
+    token_service.user_from_claims(token_service.decode_access_token(token))
+    token_service.generate_refresh_token()
+    token_service.get_refresh_token_expires_at()
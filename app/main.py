@@ -1,22 +1,44 @@
 """Главный файл приложения."""
 
-from contextlib import asynccontextmanager
+import asyncio
+import signal
+import time
+from contextlib import asynccontextmanager, suppress
 from pathlib import Path
 
-from dishka.integrations.fastapi import setup_dishka
-from fastapi import FastAPI, Request
+from dishka.integrations.fastapi import FromDishka, inject, setup_dishka
+from fastapi import FastAPI, Request, status
 from fastapi.middleware.cors import CORSMiddleware
 from fastapi.openapi.utils import get_openapi
-from fastapi.responses import HTMLResponse
+from fastapi.responses import HTMLResponse, JSONResponse
 from fastapi.staticfiles import StaticFiles
 from fastapi.templating import Jinja2Templates
 
-from app.infrastructure.config.settings import get_settings
-from app.infrastructure.database.session import create_tables
+from app.domain.interfaces.password_hasher import IPasswordHasher
+from app.infrastructure.config.settings import (
+    get_settings,
+    on_settings_reload,
+    reload_settings,
+)
+from app.infrastructure.database.partitions import AuthSessionPartitionManager
+from app.infrastructure.database.schema import check_schema_version
+from app.infrastructure.database.session import create_tables, engine
 from app.infrastructure.di.container import container
-from app.infrastructure.logging.logger import log_info
-from app.presentation.api.router import api_private_router, api_public_router
+from app.infrastructure.logging.logger import log_error, log_info, set_log_level
+from app.infrastructure.monitoring.metrics import metrics
+from app.infrastructure.services.jwt_keys import JWTKeyRing
+from app.infrastructure.services.session_reaper import SessionReaper
+from app.infrastructure.services.warmup import StartupWarmup
+from app.presentation.api.router import (
+    api_private_router,
+    api_public_router,
+    api_well_known_router,
+)
 from app.presentation.exception_handlers import register_exception_handlers
+from app.presentation.metrics import register_metrics_endpoint
+from app.presentation.middleware import RequestContextMiddleware
+from app.presentation.responses import FastJSONResponse
+from app.presentation.web.router import templates as web_templates
 from app.presentation.web.router import web_router
 
 # Получаем настройки приложения
@@ -31,15 +53,68 @@ STATIC_DIR = BASE_DIR / "presentation" / "static"
 templates = Jinja2Templates(directory=str(TEMPLATES_DIR))
 
 
+def load_templates() -> None:
+    """Загружает и компилирует все шаблоны Jinja2 заранее."""
+    for env in (templates.env, web_templates.env):
+        for name in env.list_templates():
+            env.get_template(name)
+
+
+def reload_on_sighup() -> None:
+    """Перечитывает настройки по сигналу SIGHUP."""
+    try:
+        result = reload_settings()
+    except Exception as e:
+        log_error("Ошибка перечитывания настроек", error=e)
+        return
+    log_info(
+        "Настройки перечитаны",
+        applied=result.applied,
+        restart_required=result.restart_required,
+    )
+
+
 @asynccontextmanager
 async def lifespan(app: FastAPI):
     """Менеджер контекста для жизненного цикла приложения."""
     # Startup
+    started = time.perf_counter()
+    set_log_level(settings.LOG_LEVEL)
+    unsubscribe_log_level = on_settings_reload(lambda new: set_log_level(new.LOG_LEVEL))
+    # kill -HUP <pid воркера> перечитывает настройки без перезапуска
+    loop = asyncio.get_running_loop()
+    with suppress(AttributeError, NotImplementedError):
+        loop.add_signal_handler(signal.SIGHUP, reload_on_sighup)
     log_info("Приложение запущено", environment=settings.ENVIRONMENT)
-    # Создаем таблицы в базе данных
-    await create_tables()
+    if settings.DB_CREATE_ALL:
+        # Режим разработки: таблицы создаются без миграций, а секции
+        # auth_sessions (их создает миграция) - до первой вставки
+        await create_tables()
+        partitions = await container.get(AuthSessionPartitionManager)
+        await partitions.maintain()
+    else:
+        # Одним запросом сверяем ревизию Alembic в базе с миграциями в коде.
+        # Секции создает миграция, дальше их обслуживает SessionReaper
+        await check_schema_version(engine, settings.DB_SCHEMA_CHECK)
+    # Запускаем пул хэширования паролей и калибруем стоимость bcrypt
+    await container.get(IPasswordHasher)
+    # Разбираем ключи JWT один раз при старте, чтобы сразу увидеть ошибки
+    await container.get(JWTKeyRing)
+    # Запускаем фоновое удаление истекших сессий
+    if settings.SESSION_REAPER_ENABLED:
+        reaper = await container.get(SessionReaper)
+        reaper.start()
+    metrics.set_gauge("startup_seconds", time.perf_counter() - started)
+    # Прогреваем воркер в фоне, /ready ответит 200 после завершения
+    warmup = await container.get(StartupWarmup)
+    warmup.add("openapi", app.openapi)
+    warmup.add("templates", load_templates)
+    warmup.start()
     yield
     # Shutdown
+    with suppress(AttributeError, NotImplementedError):
+        loop.remove_signal_handler(signal.SIGHUP)
+    unsubscribe_log_level()
     if container:
         await container.close()
     log_info("Приложение остановлено")
@@ -51,6 +126,7 @@ app = FastAPI(
     description="API для управления пользователями",
     version="1.0.0",
     lifespan=lifespan,
+    default_response_class=FastJSONResponse,
 )
 
 # Настраиваем Dishka для FastAPI
@@ -65,6 +141,9 @@ app.add_middleware(
     allow_headers=["*"],
 )
 
+# Привязываем контекст запроса для метрик удержания соединений с БД
+app.add_middleware(RequestContextMiddleware)
+
 # Регистрируем статические файлы
 app.mount("/static", StaticFiles(directory=str(STATIC_DIR)), name="static")
 
@@ -74,6 +153,7 @@ register_exception_handlers(app)
 # Регистрируем API роутеры
 app.include_router(api_public_router)
 app.include_router(api_private_router)
+app.include_router(api_well_known_router)
 
 # Регистрируем веб-роутеры для HTML страниц
 app.include_router(web_router)
@@ -116,3 +196,18 @@ async def health_check(request: Request):
     """Проверка работоспособности API."""
     log_info("Запрос проверки работоспособности API")
     return templates.TemplateResponse("index.html", {"request": request})
+
+
+@app.get("/ready")
+@inject
+async def readiness_check(warmup: FromDishka[StartupWarmup]) -> JSONResponse:
+    """Готовность воркера принимать трафик (после завершения прогрева)."""
+    if not warmup.ready:
+        return JSONResponse(
+            {"status": "warming_up"}, status_code=status.HTTP_503_SERVICE_UNAVAILABLE
+        )
+    return JSONResponse({"status": "ready", "warmup": warmup.timings})
+
+
+# Регистрируем /metrics (по умолчанию только для администраторов)
+register_metrics_endpoint(app, settings.METRICS_ENDPOINT)
@@ -0,0 +1,156 @@
+"""Административное API (доступно пользователям из ADMIN_EMAILS)."""
+
+import asyncio
+import json
+from collections.abc import AsyncIterable, AsyncIterator
+from dataclasses import asdict
+from tempfile import SpooledTemporaryFile
+
+from dishka.integrations.fastapi import FromDishka, inject
+from fastapi import APIRouter, Request, status
+from fastapi.responses import StreamingResponse
+from starlette.background import BackgroundTask
+
+from app.application.use_cases.users.import_users import ImportUsersUseCase
+from app.domain.entities.user import User
+from app.domain.entities.user_import import UserImportRow
+from app.domain.exceptions import AuthorizationException, ValidationException
+from app.infrastructure.config.settings import Settings, reload_settings
+from app.infrastructure.logging.logger import log_error, log_info
+from app.infrastructure.services.user_import_parser import parse_users
+
+router = APIRouter()
+
+IMPORT_FORMATS = {
+    "text/csv": "csv",
+    "application/x-ndjson": "ndjson",
+    "application/ndjson": "ndjson",
+    "application/jsonl": "ndjson",
+}
+# Тело импорта до этого размера хранится в памяти, больше - во временном файле
+IMPORT_SPOOL_MAX_MEMORY = 8 << 20
+IMPORT_READ_CHUNK = 1 << 16
+
+
+def require_admin(user: User, settings: Settings) -> None:
+    """Проверяет, что пользователь является администратором."""
+    if user.email not in settings.ADMIN_EMAILS:
+        raise AuthorizationException()
+
+
+async def _spool_body(chunks: AsyncIterable[bytes]) -> SpooledTemporaryFile:
+    """Читает тело запроса целиком до начала ответа.
+
+    После старта StreamingResponse Starlette слушает receive() в ожидании
+    отключения клиента и забирает оттуда же сообщения с телом, поэтому
+    читать тело во время ответа нельзя: части строк терялись бы.
+    """
+    body = SpooledTemporaryFile(max_size=IMPORT_SPOOL_MAX_MEMORY)
+    try:
+        async for chunk in chunks:
+            body.write(chunk)
+    except BaseException:
+        body.close()
+        raise
+    body.seek(0)
+    return body
+
+
+async def _read_spooled(body: SpooledTemporaryFile) -> AsyncIterator[bytes]:
+    """Отдает сохраненное тело частями."""
+    while chunk := body.read(IMPORT_READ_CHUNK):
+        yield chunk
+
+
+async def _import_progress(
+    usecase: ImportUsersUseCase, rows: AsyncIterator[UserImportRow]
+) -> AsyncIterator[bytes]:
+    """Выполняет импорт, отдавая ход после каждой пачки строкой NDJSON."""
+    queue: asyncio.Queue[dict | None] = asyncio.Queue()
+    task = asyncio.create_task(
+        usecase.execute(
+            rows, on_progress=lambda report: queue.put_nowait(report.progress())
+        )
+    )
+    task.add_done_callback(lambda _: queue.put_nowait(None))
+    try:
+        while (progress := await queue.get()) is not None:
+            yield json.dumps(progress).encode() + b"\n"
+        try:
+            report = await task
+        except Exception as e:
+            # Статус 200 уже отправлен, ошибка передается последней строкой
+            log_error("Ошибка импорта пользователей", error=e)
+            yield json.dumps({"error": str(e)}, ensure_ascii=False).encode() + b"\n"
+            return
+        final = {**report.as_dict(), "done": True}
+        yield json.dumps(final, ensure_ascii=False).encode() + b"\n"
+    finally:
+        task.cancel()
+
+
+@router.post("/users/import", status_code=status.HTTP_200_OK)
+@inject
+async def import_users(
+    request: Request,
+    current_user: FromDishka[User],
+    settings: FromDishka[Settings],
+    usecase: FromDishka[ImportUsersUseCase],
+) -> StreamingResponse:
+    """Импортирует пользователей из тела запроса (CSV или NDJSON).
+
+    Тело сохраняется (в памяти или во временном файле) до начала
+    ответа. В ответ после каждой пачки отдается строка NDJSON с ходом
+    импорта и скоростью, последней - итоговый отчет.
+    Открытые пароли хэшируются общим пулом процессов приложения; для
+    больших объемов лучше передавать hashed_password или использовать
+    `cli.py import-users`.
+    """
+    require_admin(current_user, settings)
+    content_type = request.headers.get("content-type", "").split(";")[0].strip()
+    file_format = IMPORT_FORMATS.get(content_type)
+    if file_format is None:
+        raise ValidationException(
+            message="Поддерживаются только text/csv и application/x-ndjson",
+            details={"content_type": content_type},
+        )
+
+    log_info(
+        "Запущен импорт пользователей", email=current_user.email, format=file_format
+    )
+    body = await _spool_body(request.stream())
+    rows = parse_users(_read_spooled(body), file_format)
+    return StreamingResponse(
+        _import_progress(usecase, rows),
+        media_type="application/x-ndjson",
+        background=BackgroundTask(body.close),
+    )
+
+
+@router.post("/settings/reload", status_code=status.HTTP_200_OK)
+@inject
+async def reload_settings_endpoint(
+    current_user: FromDishka[User],
+    settings: FromDishka[Settings],
+) -> dict:
+    """Перечитывает настройки из окружения и .env без перезапуска.
+
+    Применяются только поля из RELOADABLE_FIELDS, изменения остальных
+    возвращаются в restart_required. Затрагивает воркер, обработавший
+    запрос; чтобы перечитать настройки во всех воркерах, отправьте им
+    SIGHUP.
+    """
+    require_admin(current_user, settings)
+    try:
+        result = reload_settings()
+    except ValueError as e:
+        raise ValidationException(
+            message="Некорректные настройки", details={"error": str(e)}
+        ) from e
+    log_info(
+        "Настройки перечитаны",
+        email=current_user.email,
+        applied=result.applied,
+        restart_required=result.restart_required,
+    )
+    return asdict(result)
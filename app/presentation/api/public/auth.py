@@ -1,16 +1,24 @@
 """API для работы с авторизацией."""
 
-from dataclasses import asdict
-
 from dishka.integrations.fastapi import FromDishka, inject
-from fastapi import APIRouter, Response, status
+from fastapi import APIRouter, Request, status
 
 from app.application.use_cases.auth.login import LoginUseCase
 from app.application.use_cases.auth.refresh import RefreshTokenUseCase
-from app.domain.exceptions import AuthenticationException
+from app.domain.exceptions import (
+    AuthenticationException,
+    ServiceUnavailableException,
+)
 from app.infrastructure.config.settings import Settings
 from app.infrastructure.logging.logger import log_error, log_info
-from app.presentation.schemas.auth import LoginRequest, TokenResponse
+from app.infrastructure.services.rate_limiter import RateLimiter
+from app.presentation.rate_limit import get_client_ip
+from app.presentation.responses import FastJSONResponse
+from app.presentation.schemas.auth import (
+    LoginRequest,
+    TokenResponse,
+    dump_token_response,
+)
 
 router = APIRouter()
 
@@ -19,17 +27,21 @@ router = APIRouter()
 @inject
 async def login(
     login_data: LoginRequest,
-    response: Response,
+    request: Request,
     login_usecase: FromDishka[LoginUseCase],
     settings: FromDishka[Settings],
-) -> TokenResponse:
+    rate_limiter: FromDishka[RateLimiter],
+) -> FastJSONResponse:
     """Эндпоинт для авторизации пользователя."""
+    await rate_limiter.check("login", ip=get_client_ip(request), email=login_data.email)
     log_info("Получен запрос на авторизацию", email=login_data.email)
 
     try:
         tokens = await login_usecase.execute(
             email=login_data.email, password=login_data.password
         )
+        # Ответ собирается напрямую, без валидации TokenResponse
+        response = FastJSONResponse(dump_token_response(tokens))
 
         # Устанавливаем куки для токенов
         response.set_cookie(
@@ -50,7 +62,9 @@ async def login(
         )
 
         log_info("Пользователь успешно авторизован", email=login_data.email)
-        return TokenResponse(**asdict(tokens))
+        return response
+    except ServiceUnavailableException:
+        raise
     except Exception as e:
         log_error("Ошибка при авторизации", error=e, email=login_data.email)
         raise AuthenticationException(message=str(e)) from e
@@ -59,15 +73,18 @@ async def login(
 @router.patch("/refresh", response_model=TokenResponse, status_code=status.HTTP_200_OK)
 @inject
 async def refresh(
-    response: Response,
+    request: Request,
     refresh_token_usecase: FromDishka[RefreshTokenUseCase],
     settings: FromDishka[Settings],
-) -> TokenResponse:
+    rate_limiter: FromDishka[RateLimiter],
+) -> FastJSONResponse:
     """Эндпоинт для обновления refresh token."""
+    await rate_limiter.check("refresh", ip=get_client_ip(request))
     log_info("Получен запрос на обновление токена")
 
     try:
         tokens = await refresh_token_usecase.execute()
+        response = FastJSONResponse(dump_token_response(tokens))
 
         # Устанавливаем куки для новых токенов
         response.set_cookie(
@@ -88,7 +105,7 @@ async def refresh(
         )
 
         log_info("Токены успешно обновлены")
-        return TokenResponse(**asdict(tokens))
+        return response
     except Exception as e:
         log_error("Ошибка при обновлении токенов", error=e)
         raise AuthenticationException(message=str(e)) from e
@@ -1,10 +1,13 @@
 """Роутеры для управления пользователями."""
 
 from dishka.integrations.fastapi import FromDishka, inject
-from fastapi import APIRouter, HTTPException, status
+from fastapi import APIRouter, HTTPException, Request, status
 
 from app.application.use_cases.users.register import RegisterUserUseCase
+from app.domain.interfaces.password_hasher import IPasswordHasher
 from app.infrastructure.logging.logger import logger
+from app.infrastructure.services.rate_limiter import RateLimiter
+from app.presentation.rate_limit import get_client_ip
 from app.presentation.schemas.user import UserCreate, UserCreateResp
 
 router = APIRouter()
@@ -16,11 +19,20 @@ router = APIRouter()
 @inject
 async def create_user(
     user_data: UserCreate,
+    request: Request,
     register_usecase: FromDishka[RegisterUserUseCase],
+    password_hasher: FromDishka[IPasswordHasher],
+    rate_limiter: FromDishka[RateLimiter],
 ) -> UserCreateResp:
     """Создает нового пользователя."""
+    await rate_limiter.check(
+        "register", ip=get_client_ip(request), email=user_data.email
+    )
     try:
-        user_email = await register_usecase.execute(user_data.to_domain())
+        hashed_password = await password_hasher.hash(user_data.password)
+        user_email = await register_usecase.execute(
+            user_data.to_domain(hashed_password)
+        )
         return UserCreateResp(email=user_email)
     except ValueError as e:
         logger.error(f"Ошибка при создании пользователя: {str(e)}")
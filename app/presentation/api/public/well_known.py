@@ -0,0 +1,29 @@
+"""Служебные эндпоинты /.well-known."""
+
+from dishka.integrations.fastapi import FromDishka, inject
+from fastapi import APIRouter, Request, Response, status
+
+from app.infrastructure.config.settings import Settings
+from app.infrastructure.services.jwt_keys import JWTKeyRing
+
+router = APIRouter()
+
+
+@router.get("/jwks.json", status_code=status.HTTP_200_OK)
+@inject
+async def jwks(
+    request: Request,
+    key_ring: FromDishka[JWTKeyRing],
+    settings: FromDishka[Settings],
+) -> Response:
+    """Возвращает публичные ключи для локальной проверки JWT другими сервисами."""
+    headers = {
+        "Cache-Control": f"public, max-age={settings.JWKS_CACHE_MAX_AGE}",
+        "ETag": key_ring.jwks_etag,
+    }
+    if request.headers.get("if-none-match") == key_ring.jwks_etag:
+        return Response(status_code=status.HTTP_304_NOT_MODIFIED, headers=headers)
+
+    return Response(
+        content=key_ring.jwks_json, media_type="application/json", headers=headers
+    )
@@ -1,5 +1,7 @@
 """Обработчики исключений для FastAPI."""
 
+import math
+
 from fastapi import FastAPI, Request, status
 from fastapi.responses import JSONResponse
 from pydantic import ValidationError
@@ -10,7 +12,9 @@ from app.domain.exceptions import (
     BusinessRuleException,
     DomainException,
     NotFoundException,
+    RateLimitException,
     RefreshTokenException,
+    ServiceUnavailableException,
     TokenException,
     ValidationException,
 )
@@ -89,6 +93,24 @@ def register_exception_handlers(app: FastAPI) -> None:
             content={"detail": exc.message, "errors": exc.details},
         )
 
+    @app.exception_handler(ServiceUnavailableException)
+    async def service_unavailable_exception_handler(
+        request: Request, exc: ServiceUnavailableException
+    ):
+        log_error("Сервис перегружен", error=exc, path=request.url.path)
+        return JSONResponse(
+            status_code=status.HTTP_503_SERVICE_UNAVAILABLE,
+            content={"detail": exc.message},
+        )
+
+    @app.exception_handler(RateLimitException)
+    async def rate_limit_exception_handler(request: Request, exc: RateLimitException):
+        return JSONResponse(
+            status_code=status.HTTP_429_TOO_MANY_REQUESTS,
+            content={"detail": exc.message},
+            headers={"Retry-After": str(math.ceil(exc.retry_after))},
+        )
+
     @app.exception_handler(DomainException)
     async def domain_exception_handler(request: Request, exc: DomainException):
         log_error("Доменная ошибка", error=exc, path=request.url.path)
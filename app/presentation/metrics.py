@@ -0,0 +1,36 @@
+"""Эндпоинт /metrics со снимком метрик приложения."""
+
+from dishka.integrations.fastapi import FromDishka, inject
+from fastapi import FastAPI
+
+from app.domain.entities.user import User
+from app.infrastructure.config.settings import Settings
+from app.infrastructure.monitoring.metrics import metrics
+from app.presentation.api.private.admin import require_admin
+
+
+async def metrics_snapshot() -> dict:
+    """Возвращает снимок метрик приложения."""
+    return metrics.snapshot()
+
+
+@inject
+async def admin_metrics_snapshot(
+    current_user: FromDishka[User], settings: FromDishka[Settings]
+) -> dict:
+    """Возвращает снимок метрик приложения администратору."""
+    require_admin(current_user, settings)
+    return metrics.snapshot()
+
+
+def register_metrics_endpoint(app: FastAPI, mode: str) -> None:
+    """Регистрирует /metrics в режиме из METRICS_ENDPOINT.
+
+    Снимок раскрывает счетчики пула, кэшей и авторизации: "admin" -
+    только для ADMIN_EMAILS, "public" - без авторизации (когда порт
+    приложения закрыт снаружи), "off" - эндпоинт не регистрируется.
+    """
+    if mode == "public":
+        app.add_api_route("/metrics", metrics_snapshot, methods=["GET"])
+    elif mode == "admin":
+        app.add_api_route("/metrics", admin_metrics_snapshot, methods=["GET"])
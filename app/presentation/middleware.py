@@ -0,0 +1,28 @@
+"""ASGI middleware приложения."""
+
+from starlette.types import ASGIApp, Receive, Scope, Send
+
+from app.infrastructure.monitoring.request_context import (
+    bind_request_scope,
+    unbind_request_scope,
+)
+
+
+class RequestContextMiddleware:
+    """Делает ASGI scope запроса доступным инфраструктуре (метрикам пула)."""
+
+    def __init__(self, app: ASGIApp):
+        """Инициализирует middleware."""
+        self.app = app
+
+    async def __call__(self, scope: Scope, receive: Receive, send: Send) -> None:
+        """Обрабатывает запрос."""
+        if scope["type"] != "http":
+            await self.app(scope, receive, send)
+            return
+
+        token = bind_request_scope(scope)
+        try:
+            await self.app(scope, receive, send)
+        finally:
+            unbind_request_scope(token)
@@ -0,0 +1,8 @@
+"""Вспомогательные функции для ограничения частоты запросов."""
+
+from fastapi import Request
+
+
+def get_client_ip(request: Request) -> str | None:
+    """Возвращает IP-адрес клиента."""
+    return request.client.host if request.client else None
@@ -0,0 +1,36 @@
+"""Быстрая сериализация JSON-ответов API."""
+
+from datetime import datetime
+from typing import Any
+
+import orjson
+from fastapi.responses import JSONResponse
+
+
+def dumps(content: Any) -> bytes:
+    """Сериализует JSON-совместимые данные в компактный UTF-8 через orjson.
+
+    Результат побайтно совпадает с рендерингом JSONResponse.
+    """
+    return orjson.dumps(content)
+
+
+def json_datetime(value: datetime | None) -> str | None:
+    """Дата в формате сериализации pydantic (UTC обозначается как Z)."""
+    if value is None:
+        return None
+    text = value.isoformat()
+    return f"{text[:-6]}Z" if text.endswith("+00:00") else text
+
+
+class FastJSONResponse(JSONResponse):
+    """JSON-ответ, сериализуемый orjson.
+
+    Класс ответа приложения по умолчанию. Содержимое должно быть уже
+    JSON-совместимым: для моделей ответа его готовит FastAPI, горячие
+    эндпоинты передают результат dump_* функций схем.
+    """
+
+    def render(self, content: Any) -> bytes:
+        """Сериализует содержимое ответа."""
+        return dumps(content)
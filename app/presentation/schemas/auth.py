@@ -6,6 +6,8 @@ from uuid import UUID
 
 from pydantic import BaseModel, EmailStr
 
+from app.domain.entities.auth import Token
+
 
 class LoginRequest(BaseModel):
     """Схема запроса на авторизацию."""
@@ -19,3 +21,11 @@ class TokenResponse(BaseModel):
 
     access_token: str
     refresh_token: UUID
+
+
+def dump_token_response(token: Token) -> dict:
+    """Содержимое TokenResponse из доменной модели без валидации модели."""
+    return {
+        "access_token": token.access_token,
+        "refresh_token": str(token.refresh_token),
+    }
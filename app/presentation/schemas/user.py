@@ -4,7 +4,8 @@ from datetime import datetime
 
 from pydantic import BaseModel, EmailStr, Field
 
-from app.domain.entities.user import User, pwd_context
+from app.domain.entities.user import User
+from app.presentation.responses import json_datetime
 
 
 class UserCreate(BaseModel):
@@ -13,11 +14,11 @@ class UserCreate(BaseModel):
     email: EmailStr
     password: str = Field(..., min_length=8, max_length=100)
 
-    def to_domain(self) -> User:
+    def to_domain(self, hashed_password: str) -> User:
         """Конвертирует схему в доменную модель."""
         return User(
             email=self.email,
-            hashed_password=pwd_context.hash(self.password),
+            hashed_password=hashed_password,
         )
 
 
@@ -48,3 +49,18 @@ class UserResponse(UserBase):
     is_verified: bool
     created_at: datetime | None = None
     updated_at: datetime | None = None
+
+
+def dump_user_response(user: User) -> dict:
+    """Содержимое UserResponse из доменной модели.
+
+    Совпадает с UserResponse.model_dump(mode="json"), но без asdict,
+    валидации модели и jsonable_encoder.
+    """
+    return {
+        "email": user.email,
+        "is_active": user.is_active,
+        "is_verified": user.is_verified,
+        "created_at": json_datetime(user.created_at),
+        "updated_at": json_datetime(user.updated_at),
+    }
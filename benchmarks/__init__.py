@@ -0,0 +1 @@
+"""Микро-бенчмарки горячих путей приложения."""
@@ -0,0 +1,89 @@
+"""Бенчмарк сериализации ответов /me, /login и /refresh.
+
+Прежний путь повторяет FastAPI: модель ответа из asdict, валидация поля
+ответа эндпоинта, jsonable_encoder и JSONResponse со стандартным json.
+Новый путь - dump_* функции схем и FastJSONResponse (orjson).
+
+Запуск: python -m benchmarks.bench_json_responses
+"""
+
+from dataclasses import asdict
+from datetime import UTC, datetime
+from uuid import uuid4
+
+from fastapi.responses import JSONResponse
+from fastapi.routing import serialize_response
+
+from app.domain.entities.auth import Token
+from app.domain.entities.user import User
+from app.presentation.api.public.auth import router as auth_router
+from app.presentation.responses import FastJSONResponse
+from app.presentation.schemas.auth import TokenResponse, dump_token_response
+from app.presentation.schemas.user import UserResponse, dump_user_response
+from benchmarks.common import bench, report
+
+USER = User(
+    email="user@example.com",
+    hashed_password="$2b$12$" + "x" * 53,
+    created_at=datetime.now(UTC),
+    updated_at=datetime.now(UTC),
+)
+TOKEN = Token(access_token="e" * 180, refresh_token=uuid4())
+
+
+def run(coro):
+    """Выполняет корутину без цикла событий (она не приостанавливается)."""
+    try:
+        coro.send(None)
+    except StopIteration as stop:
+        return stop.value
+    raise RuntimeError("корутина приостановилась")
+
+
+def response_field(path: str):
+    """Поле ответа маршрута, по которому FastAPI валидирует результат."""
+    return next(r for r in auth_router.routes if r.path == path).response_field
+
+
+def main() -> None:
+    """Запускает бенчмарк."""
+    token_field = response_field("/login")
+
+    def me_before() -> bytes:
+        # response_model=None: модель проходит только через jsonable_encoder
+        content = UserResponse(**asdict(USER), exclude={"hashed_password"})
+        encoded = run(serialize_response(response_content=content))
+        return JSONResponse(encoded).body
+
+    def tokens_before() -> bytes:
+        content = TokenResponse(**asdict(TOKEN))
+        encoded = run(serialize_response(field=token_field, response_content=content))
+        return JSONResponse(encoded).body
+
+    def me_after() -> bytes:
+        return FastJSONResponse(dump_user_response(USER)).body
+
+    def tokens_after() -> bytes:
+        return FastJSONResponse(dump_token_response(TOKEN)).body
+
+    assert me_before() == me_after()
+    assert tokens_before() == tokens_after()
+
+    report(
+        "GET /me",
+        {
+            "asdict + UserResponse + encoder": bench(me_before, number=20_000),
+            "dump_user_response + orjson": bench(me_after, number=20_000),
+        },
+    )
+    report(
+        "POST /login, PATCH /refresh",
+        {
+            "asdict + TokenResponse + encoder": bench(tokens_before, number=20_000),
+            "dump_token_response + orjson": bench(tokens_after, number=20_000),
+        },
+    )
+
+
+if __name__ == "__main__":
+    main()
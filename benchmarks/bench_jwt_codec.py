@@ -0,0 +1,42 @@
+"""Сравнение быстрого кодека HS256 с общим путем pyjwt.
+
+Запуск: python -m benchmarks.bench_jwt_codec
+"""
+
+from datetime import UTC, datetime, timedelta
+
+import jwt
+
+from app.infrastructure.services.jwt_codec import HS256Codec
+from benchmarks.common import bench, report
+
+SECRET = "benchmark-secret-key-with-32-bytes!"
+
+
+def main() -> None:
+    """Запускает бенчмарк."""
+    codec = HS256Codec(SECRET)
+    payload = {
+        "sub": "user@example.com",
+        "exp": datetime.now(UTC) + timedelta(minutes=15),
+    }
+    token = codec.encode(payload)
+
+    report(
+        "encode",
+        {
+            "pyjwt": bench(lambda: jwt.encode(payload, SECRET, algorithm="HS256")),
+            "HS256Codec": bench(lambda: codec.encode(payload)),
+        },
+    )
+    report(
+        "decode",
+        {
+            "pyjwt": bench(lambda: jwt.decode(token, SECRET, algorithms=["HS256"])),
+            "HS256Codec": bench(lambda: codec.decode(token)),
+        },
+    )
+
+
+if __name__ == "__main__":
+    main()
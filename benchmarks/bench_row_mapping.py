@@ -0,0 +1,91 @@
+"""Время и выделение памяти на один поиск пользователя: ORM-объект с
+копированием в сущность против Core-строки, собранной в сущность напрямую.
+
+Используется SQLite в памяти, поэтому сравнивается только работа Python
+на стороне приложения. Каждый поиск выполняется в новой сессии, как в
+запросе к API.
+
+Запуск: python -m benchmarks.bench_row_mapping
+"""
+
+import tracemalloc
+from dataclasses import asdict
+
+from sqlalchemy import create_engine, select
+from sqlalchemy.orm import Session
+
+from app.domain.entities.user import User
+from app.infrastructure.database.mapping import entity_params
+from app.infrastructure.database.models import Base, UserModel
+from app.infrastructure.database.repositories.user_repo import FIND_BY_EMAIL
+from benchmarks.common import bench, report
+
+EMAIL = "user@example.com"
+
+
+def allocated(func, number: int = 1_000) -> float:
+    """Средний пик выделенной памяти на один вызов в байтах."""
+    func()
+    total = 0
+    tracemalloc.start()
+    for _ in range(number):
+        tracemalloc.reset_peak()
+        baseline, _ = tracemalloc.get_traced_memory()
+        func()
+        total += tracemalloc.get_traced_memory()[1] - baseline
+    tracemalloc.stop()
+    return total / number
+
+
+def main() -> None:
+    """Запускает бенчмарк."""
+    engine = create_engine("sqlite://")
+    Base.metadata.create_all(engine, tables=[UserModel.__table__])
+    with Session(engine) as session:
+        session.add(UserModel(email=EMAIL, hashed_password="hash"))
+        session.commit()
+
+    orm_query = select(UserModel).where(UserModel.email == EMAIL)
+
+    def orm_lookup() -> User:
+        with Session(engine) as session:
+            model = session.execute(orm_query).scalar_one()
+            return User(
+                email=model.email,
+                hashed_password=model.hashed_password,
+                is_active=model.is_active,
+                is_verified=model.is_verified,
+                created_at=model.created_at,
+                updated_at=model.updated_at,
+            )
+
+    def core_lookup() -> User:
+        with Session(engine) as session:
+            row = session.execute(FIND_BY_EMAIL, {"email": EMAIL}).one()
+            return User(*row)
+
+    assert orm_lookup() == core_lookup()
+    user = core_lookup()
+
+    report(
+        "Поиск пользователя: время",
+        {
+            "ORM + копирование": bench(orm_lookup, number=5_000),
+            "Core-строка": bench(core_lookup, number=5_000),
+        },
+    )
+    report(
+        "Параметры вставки из сущности: время",
+        {
+            "dataclasses.asdict": bench(lambda: asdict(user)),
+            "entity_params": bench(lambda: entity_params(user)),
+        },
+    )
+
+    print("Поиск пользователя: выделено памяти на вызов")
+    for name, func in (("ORM + копирование", orm_lookup), ("Core-строка", core_lookup)):
+        print(f"  {name:<32} {allocated(func):8.0f} байт")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,73 @@
+"""Бенчмарк: разбор настроек на каждый вызов против общего снимка.
+
+Стоимость вызова измеряется для Settings() (разбор окружения, .env и
+валидаторы) и для get_settings(). Для импорта приложения считается,
+сколько раз вызывается get_settings (раньше каждый вызов разбирал
+настройки заново) и сколько раз настройки разбираются на самом деле.
+
+Запуск: ALGORITHM=HS256 python -m benchmarks.bench_settings
+"""
+
+import subprocess
+import sys
+
+from app.infrastructure.config.settings import Settings, get_settings
+from benchmarks.common import bench, report
+
+# Считает вызовы get_settings и разборы Settings при импорте приложения
+IMPORT_PROBE = """
+import time
+from app.infrastructure.config import settings as module
+
+calls = parsed = 0
+parse_seconds = 0.0
+get_settings, init = module.get_settings, module.Settings.__init__
+
+def counting_get_settings():
+    global calls
+    calls += 1
+    return get_settings()
+
+def counting_init(self, *args, **kwargs):
+    global parsed, parse_seconds
+    start = time.perf_counter()
+    init(self, *args, **kwargs)
+    parse_seconds += time.perf_counter() - start
+    parsed += 1
+
+module.get_settings = counting_get_settings
+module.Settings.__init__ = counting_init
+
+start = time.perf_counter()
+import app.main
+print(calls, parsed, parse_seconds * 1000, (time.perf_counter() - start) * 1000)
+"""
+
+
+def main() -> None:
+    """Запускает бенчмарк."""
+    report(
+        "Получение настроек",
+        {
+            "Settings()": bench(Settings, number=2_000),
+            "get_settings()": bench(get_settings, number=200_000),
+        },
+    )
+
+    output = subprocess.run(
+        [sys.executable, "-c", IMPORT_PROBE],
+        check=True,
+        capture_output=True,
+        text=True,
+    ).stdout.split()
+    calls, parsed = int(output[0]), int(output[1])
+    parse_ms, import_ms = float(output[2]), float(output[3])
+    per_parse = parse_ms / parsed
+    print("Импорт app.main")
+    print(f"  вызовов get_settings: {calls}, разборов настроек: {parsed}")
+    print(f"  разбор настроек: {parse_ms:.1f} мс из {import_ms:.1f} мс импорта")
+    print(f"  сэкономлено: ~{(calls - parsed) * per_parse:.1f} мс на процесс")
+
+
+if __name__ == "__main__":
+    main()
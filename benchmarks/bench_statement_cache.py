@@ -0,0 +1,101 @@
+"""Накладные расходы Python на подготовку запроса: сборка на каждый вызов
+против заранее собранных запросов репозиториев.
+
+Повторяет путь Connection.execute до обращения к драйверу: вычисление ключа
+кэша, поиск скомпилированного SQL в кэше движка и сборка параметров.
+
+Запуск: python -m benchmarks.bench_statement_cache
+"""
+
+from dataclasses import asdict
+from datetime import UTC, datetime
+from uuid import uuid4
+
+from sqlalchemy import func, select, update
+from sqlalchemy.dialects.postgresql import insert as pg_insert
+from sqlalchemy.dialects.postgresql.asyncpg import dialect as asyncpg_dialect
+from sqlalchemy.util import LRUCache
+
+from app.domain.entities.user import User
+from app.infrastructure.database.models import AuthSessionModel, UserModel
+from app.infrastructure.database.repositories import auth_session_repo, user_repo
+from benchmarks.common import bench, report
+
+DIALECT = asyncpg_dialect()
+
+
+def prepare(statement, params: dict, cache: LRUCache) -> None:
+    """Готовит запрос к выполнению так же, как Connection.execute."""
+    compiled, extracted, _ = statement._compile_w_cache(
+        DIALECT, compiled_cache=cache, column_keys=sorted(params)
+    )
+    compiled.construct_params(params, extracted_parameters=extracted)
+
+
+def compare(title: str, build_inline, prebuilt, params: dict) -> None:
+    """Сравнивает сборку запроса на каждый вызов с заранее собранным."""
+    inline_cache, prebuilt_cache = LRUCache(500), LRUCache(500)
+
+    def inline():
+        statement, inline_params = build_inline()
+        prepare(statement, inline_params, inline_cache)
+
+    report(
+        title,
+        {
+            "сборка на каждый вызов": bench(inline, number=20_000),
+            "заранее собранный": bench(
+                lambda: prepare(prebuilt, params, prebuilt_cache), number=20_000
+            ),
+        },
+    )
+
+
+def main() -> None:
+    """Запускает бенчмарк."""
+    user = User("user@example.com", "hash")
+    token, new_token = uuid4(), uuid4()
+    expires_at = datetime.now(UTC)
+
+    compare(
+        "users.find_by_email",
+        lambda: (select(UserModel).where(UserModel.email == user.email), {}),
+        user_repo.FIND_BY_EMAIL,
+        {"email": user.email},
+    )
+    compare(
+        "users.create_if_not_exists",
+        lambda: (
+            pg_insert(UserModel)
+            .values(**asdict(user))
+            .on_conflict_do_nothing(index_elements=[UserModel.email])
+            .returning(UserModel.email),
+            {},
+        ),
+        user_repo.CREATE_IF_NOT_EXISTS,
+        user_repo._user_params(user),
+    )
+    compare(
+        "auth_sessions.rotate_refresh_token",
+        lambda: (
+            update(AuthSessionModel)
+            .where(
+                AuthSessionModel.refresh_token == token,
+                AuthSessionModel.expires_at > func.now(),
+                AuthSessionModel.user_email == UserModel.email,
+            )
+            .values(refresh_token=new_token, expires_at=expires_at)
+            .returning(*UserModel.__table__.c),
+            {},
+        ),
+        auth_session_repo.ROTATE_REFRESH_TOKEN,
+        {
+            "p_refresh_token": token,
+            "p_new_refresh_token": new_token,
+            "p_expires_at": expires_at,
+        },
+    )
+
+
+if __name__ == "__main__":
+    main()
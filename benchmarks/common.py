@@ -0,0 +1,23 @@
+"""Общие утилиты для бенчмарков."""
+
+import time
+from collections.abc import Callable
+
+
+def bench(func: Callable[[], object], number: int = 100_000, repeat: int = 5) -> float:
+    """Возвращает лучшее время одного вызова функции в микросекундах."""
+    best = float("inf")
+    for _ in range(repeat):
+        start = time.perf_counter()
+        for _ in range(number):
+            func()
+        best = min(best, time.perf_counter() - start)
+    return best / number * 1_000_000
+
+
+def report(title: str, results: dict[str, float]) -> None:
+    """Печатает результаты и ускорение относительно первого варианта."""
+    print(title)
+    baseline = next(iter(results.values()))
+    for name, micros in results.items():
+        print(f"  {name:<32} {micros:8.2f} мкс/вызов  x{baseline / micros:.2f}")
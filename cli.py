@@ -75,5 +75,218 @@ def current() -> None:
     subprocess.run(cmd)
 
 
+@cli.command()
+@click.option(
+    "--algorithm",
+    type=click.Choice(["EdDSA", "ES256"]),
+    default="EdDSA",
+    help="Алгоритм подписи JWT",
+)
+@click.option("--out", "-o", required=True, help="Путь к файлу приватного ключа")
+def generate_jwt_key(algorithm: str, out: str) -> None:
+    """Сгенерировать пару ключей для подписи JWT (PEM)."""
+    from pathlib import Path
+
+    from cryptography.hazmat.primitives import serialization
+    from cryptography.hazmat.primitives.asymmetric import ec, ed25519
+
+    if algorithm == "EdDSA":
+        private_key = ed25519.Ed25519PrivateKey.generate()
+    else:
+        private_key = ec.generate_private_key(ec.SECP256R1())
+
+    private_path = Path(out)
+    public_path = private_path.with_suffix(".pub.pem")
+    private_path.write_bytes(
+        private_key.private_bytes(
+            serialization.Encoding.PEM,
+            serialization.PrivateFormat.PKCS8,
+            serialization.NoEncryption(),
+        )
+    )
+    private_path.chmod(0o600)
+    public_path.write_bytes(
+        private_key.public_key().public_bytes(
+            serialization.Encoding.PEM,
+            serialization.PublicFormat.SubjectPublicKeyInfo,
+        )
+    )
+    click.echo(f"Приватный ключ: {private_path}")
+    click.echo(f"Публичный ключ: {public_path}")
+
+
+@cli.command()
+@click.option("--batch-size", type=int, help="Размер пачки (по умолчанию из настроек)")
+@click.option("--max-batches", type=int, help="Максимум пачек (по умолчанию: до конца)")
+def purge_sessions(batch_size: int | None, max_batches: int | None) -> None:
+    """Удалить истекшие авторизационные сессии."""
+    import asyncio
+
+    from app.application.use_cases.auth.purge_expired_sessions import (
+        PurgeExpiredSessionsUseCase,
+    )
+    from app.infrastructure.config.settings import get_settings
+    from app.infrastructure.database.partitions import AuthSessionPartitionManager
+    from app.infrastructure.database.session import SessionLocal, engine
+    from app.infrastructure.database.uow import UOW
+
+    settings = get_settings()
+    partitions = AuthSessionPartitionManager(
+        engine,
+        interval_days=settings.AUTH_SESSIONS_PARTITION_DAYS,
+        premake_days=settings.AUTH_SESSIONS_PARTITION_PREMAKE_DAYS,
+    )
+    usecase = PurgeExpiredSessionsUseCase(
+        lambda: UOW(SessionLocal()),
+        batch_size=batch_size or settings.SESSION_REAPER_BATCH_SIZE,
+        max_batches=max_batches,
+        batch_pause=settings.SESSION_REAPER_BATCH_PAUSE_SECONDS,
+    )
+
+    async def purge() -> int:
+        try:
+            _, dropped = await partitions.maintain()
+            if dropped:
+                click.echo(f"Удалены истекшие секции: {', '.join(dropped)}")
+            return await usecase.execute()
+        finally:
+            await engine.dispose()
+
+    click.echo("Удаление истекших сессий...")
+    purged = asyncio.run(purge())
+    click.echo(f"Удалено сессий: {purged}")
+
+
+@cli.command()
+@click.argument("path", type=click.Path(exists=True, dir_okay=False, allow_dash=True))
+@click.option(
+    "--format",
+    "file_format",
+    type=click.Choice(["csv", "ndjson"]),
+    help="Формат файла (по умолчанию: по расширению)",
+)
+@click.option("--batch-size", type=int, help="Размер пачки (по умолчанию из настроек)")
+@click.option("--workers", type=int, help="Процессов хэширования (по умолчанию: CPU)")
+def import_users(
+    path: str, file_format: str | None, batch_size: int | None, workers: int | None
+) -> None:
+    """Импортировать пользователей из CSV или NDJSON (PATH или - для stdin)."""
+    import asyncio
+    import sys
+
+    from app.application.use_cases.users.import_users import ImportUsersUseCase
+    from app.domain.entities.user_import import UserImportReport
+    from app.infrastructure.config.settings import get_settings
+    from app.infrastructure.database.session import engine
+    from app.infrastructure.database.user_import import CopyUserBulkLoader
+    from app.infrastructure.services.password_hasher import PasswordHasher
+    from app.infrastructure.services.user_import_parser import parse_users
+
+    if file_format is None:
+        file_format = "csv" if path.endswith(".csv") else "ndjson"
+
+    settings = get_settings()
+    # Других вызовов нет, импорт занимает все процессы
+    password_hasher = PasswordHasher(max_workers=workers, reserved_workers=0)
+    if settings.PASSWORD_HASH_ROUNDS is not None:
+        password_hasher.set_rounds(settings.PASSWORD_HASH_ROUNDS)
+    usecase = ImportUsersUseCase(
+        CopyUserBulkLoader(engine),
+        password_hasher,
+        batch_size=batch_size or settings.USER_IMPORT_BATCH_SIZE,
+        max_reported=settings.USER_IMPORT_MAX_REPORTED,
+    )
+
+    async def read_chunks():
+        file = sys.stdin.buffer if path == "-" else open(path, "rb")
+        try:
+            while chunk := await asyncio.to_thread(file.read, 1 << 20):
+                yield chunk
+        finally:
+            if file is not sys.stdin.buffer:
+                file.close()
+
+    def show_progress(report: UserImportReport) -> None:
+        click.echo(
+            f"\rОбработано: {report.processed}, создано: {report.imported}, "
+            f"конфликтов: {report.conflicts}, ошибок: {report.invalid}, "
+            f"{report.rows_per_second:.0f} строк/с",
+            nl=False,
+            err=True,
+        )
+
+    async def run():
+        try:
+            return await usecase.execute(
+                parse_users(read_chunks(), file_format), on_progress=show_progress
+            )
+        finally:
+            password_hasher.shutdown()
+            await engine.dispose()
+
+    report = asyncio.run(run())
+    click.echo("", err=True)
+    click.echo(
+        f"Создано: {report.imported}, конфликтов: {report.conflicts}, "
+        f"ошибок: {report.invalid}, {report.rows_per_second:.0f} строк/с "
+        f"за {report.elapsed:.1f} с"
+    )
+    for email in report.conflict_emails:
+        click.echo(f"  уже существует: {email}")
+    for error in report.errors:
+        click.echo(f"  {error}")
+
+
+@cli.command()
+@click.option("--host", help="Адрес (по умолчанию SERVER_HOST)")
+@click.option("--port", type=int, help="Порт (по умолчанию SERVER_PORT)")
+@click.option("--workers", type=int, help="Воркеров (по умолчанию: по числу CPU)")
+def serve(host: str | None, port: int | None, workers: int | None) -> None:
+    """Запустить production-сервер uvicorn с несколькими воркерами."""
+    import asyncio
+    import os
+
+    import uvicorn
+
+    from app.infrastructure.config.server import (
+        APP_MODULE,
+        calibrate_password_hash,
+        resolve_workers,
+        uvicorn_options,
+        worker_environment,
+    )
+    from app.infrastructure.config.settings import get_settings
+
+    overrides = {"SERVER_HOST": host, "SERVER_PORT": port, "SERVER_WORKERS": workers}
+    settings = get_settings().model_copy(
+        update={k: v for k, v in overrides.items() if v is not None}
+    )
+    workers = resolve_workers(settings)
+    # Воркеры запускаются через spawn и наследуют окружение процесса
+    os.environ.update(worker_environment(settings, workers))
+    if (
+        workers > 1
+        and settings.PASSWORD_HASH_CALIBRATE
+        and settings.PASSWORD_HASH_ROUNDS is None
+    ):
+        rounds = asyncio.run(calibrate_password_hash(settings))
+        os.environ["PASSWORD_HASH_ROUNDS"] = str(rounds)
+    options = uvicorn_options(settings, workers)
+
+    app = APP_MODULE
+    if settings.SERVER_PRELOAD:
+        # Ошибки импорта и настроек видны до запуска воркеров, а не в каждом
+        from app.main import app as preloaded_app
+
+        if workers == 1:
+            app = preloaded_app
+
+    click.echo(
+        f"Запуск на {options['host']}:{options['port']}: воркеров {workers}, "
+        f"loop={options['loop']}, http={options['http']}"
+    )
+    uvicorn.run(app, **options)
+
+
 if __name__ == "__main__":
     cli()
@@ -0,0 +1,111 @@
+"""Partition auth_sessions by expires_at
+
+Revision ID: 4f2a9c1e7b3d
+Revises: d6bc8fec8cb8
+Create Date: 2026-10-18 12:00:00.000000
+
+"""
+
+import sqlalchemy as sa
+from alembic import op
+
+# revision identifiers, used by Alembic.
+revision = '4f2a9c1e7b3d'
+down_revision = 'd6bc8fec8cb8'
+branch_labels = None
+depends_on = None
+
+# Должны совпадать с настройками AuthSessionPartitionManager по умолчанию
+PARTITION_DAYS = 7
+PREMAKE_DAYS = 35
+
+# Секции от текущей до покрывающей самую позднюю из переносимых сессий
+CREATE_PARTITIONS = f"""
+DO $$
+DECLARE
+    today date := (now() AT TIME ZONE 'UTC')::date;
+    horizon date := greatest(
+        today + {PREMAKE_DAYS},
+        (SELECT (max(expires_at) AT TIME ZONE 'UTC')::date + 1
+         FROM auth_sessions_unpartitioned)
+    );
+    part_start date := date '1970-01-01'
+        + (today - date '1970-01-01') / {PARTITION_DAYS} * {PARTITION_DAYS};
+    part_end date;
+BEGIN
+    WHILE part_start < horizon LOOP
+        part_end := part_start + {PARTITION_DAYS};
+        EXECUTE format(
+            'CREATE TABLE %I PARTITION OF auth_sessions '
+            'FOR VALUES FROM (%L) TO (%L)',
+            'auth_sessions_p' || to_char(part_start, 'YYYYMMDD')
+                || '_' || to_char(part_end, 'YYYYMMDD'),
+            part_start::text || ' 00:00:00+00',
+            part_end::text || ' 00:00:00+00'
+        );
+        part_start := part_end;
+    END LOOP;
+END
+$$
+"""
+
+COLUMNS = "uuid, refresh_token, expires_at, user_email, created_at, updated_at"
+
+
+def _create_table(*primary_key: str, **kwargs) -> None:
+    """Создает таблицу auth_sessions с индексом по refresh_token."""
+    op.create_table(
+        'auth_sessions',
+        sa.Column('uuid', sa.UUID(), nullable=False),
+        sa.Column('refresh_token', sa.UUID(), nullable=False),
+        sa.Column('expires_at', sa.DateTime(timezone=True), nullable=False),
+        sa.Column('user_email', sa.String(length=320), nullable=False),
+        sa.Column('created_at', sa.DateTime(timezone=True), nullable=False),
+        sa.Column('updated_at', sa.DateTime(timezone=True), nullable=True),
+        sa.ForeignKeyConstraint(['user_email'], ['users.email'], ondelete='CASCADE'),
+        sa.PrimaryKeyConstraint(*primary_key),
+        **kwargs,
+    )
+    op.create_index(
+        op.f('ix_auth_sessions_refresh_token'),
+        'auth_sessions',
+        ['refresh_token'],
+        unique=False,
+    )
+
+
+def _rename_table(new_name: str) -> None:
+    """Переименовывает auth_sessions вместе с индексами."""
+    op.rename_table('auth_sessions', new_name)
+    op.execute(f"ALTER INDEX auth_sessions_pkey RENAME TO {new_name}_pkey")
+    op.execute(
+        f"ALTER INDEX ix_auth_sessions_refresh_token "
+        f"RENAME TO ix_{new_name}_refresh_token"
+    )
+
+
+def upgrade() -> None:
+    _rename_table('auth_sessions_unpartitioned')
+    _create_table(
+        'uuid', 'expires_at', postgresql_partition_by='RANGE (expires_at)'
+    )
+    op.execute("CREATE TABLE auth_sessions_default PARTITION OF auth_sessions DEFAULT")
+    op.execute(CREATE_PARTITIONS)
+
+    # Истекшие сессии не переносим
+    op.execute(
+        f"INSERT INTO auth_sessions ({COLUMNS}) "
+        f"SELECT {COLUMNS} FROM auth_sessions_unpartitioned WHERE expires_at > now()"
+    )
+    op.drop_table('auth_sessions_unpartitioned')
+
+
+def downgrade() -> None:
+    _rename_table('auth_sessions_partitioned')
+    _create_table('uuid')
+    op.execute(
+        f"INSERT INTO auth_sessions ({COLUMNS}) "
+        f"SELECT {COLUMNS} FROM auth_sessions_partitioned"
+    )
+    # Удаляет и все секции
+    op.drop_table('auth_sessions_partitioned')
@@ -0,0 +1,41 @@
+"""Tune auth_sessions indexes
+
+Revision ID: 9b8e3d5a2c61
+Revises: 4f2a9c1e7b3d
+Create Date: 2026-10-18 15:00:00.000000
+
+"""
+
+from alembic import op
+
+# revision identifiers, used by Alembic.
+revision = '9b8e3d5a2c61'
+down_revision = '4f2a9c1e7b3d'
+branch_labels = None
+depends_on = None
+
+
+def upgrade() -> None:
+    # Индекс ix_auth_sessions_refresh_token остается неуникальным:
+    # уникальный индекс обязан включать expires_at и не гарантировал бы
+    # уникальность refresh_token, ее обеспечивает генерация UUIDv7
+
+    # Для ON DELETE CASCADE из users
+    op.create_index(
+        op.f('ix_auth_sessions_user_email'),
+        'auth_sessions',
+        ['user_email'],
+        unique=False,
+    )
+    # Для пакетной чистки истекших сессий
+    op.create_index(
+        op.f('ix_auth_sessions_expires_at'),
+        'auth_sessions',
+        ['expires_at'],
+        unique=False,
+    )
+
+
+def downgrade() -> None:
+    op.drop_index(op.f('ix_auth_sessions_expires_at'), table_name='auth_sessions')
+    op.drop_index(op.f('ix_auth_sessions_user_email'), table_name='auth_sessions')
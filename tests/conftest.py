@@ -9,6 +9,8 @@ import pytest
 
 from app.domain.entities.auth import Token
 from app.domain.entities.user import User
+from app.domain.interfaces.password_hasher import IPasswordHasher
+from app.domain.interfaces.token_cache import ITokenCache
 from app.domain.interfaces.token_service import ITokenService
 from app.domain.interfaces.uow import IUOW
 
@@ -37,22 +39,46 @@ def mock_uow() -> MagicMock:
     uow.__aexit__ = AsyncMock(side_effect=async_exit)
     uow.commit = AsyncMock()
     uow.rollback = AsyncMock()
+    uow.release = AsyncMock()
 
     # Моки для репозиториев
     uow.users = MagicMock()
     uow.users.find_by_email = AsyncMock()
     uow.users.create_user = AsyncMock()
+    uow.users.create_if_not_exists = AsyncMock()
+    uow.users.update_password = AsyncMock()
 
     uow.auth_sessions = MagicMock()
     uow.auth_sessions.add = AsyncMock()
     uow.auth_sessions.find_by_refresh_token = AsyncMock()
-    uow.auth_sessions.remove = AsyncMock()
     uow.auth_sessions.delete_by_refresh_token = AsyncMock()
     uow.auth_sessions.update_refresh_token = AsyncMock()
+    uow.auth_sessions.pop_by_refresh_token = AsyncMock()
+    uow.auth_sessions.rotate_refresh_token = AsyncMock()
+    uow.auth_sessions.delete_expired = AsyncMock()
 
     return uow
 
 
+@pytest.fixture
+def count_round_trips():
+    """Возвращает функцию подсчета обращений к репозиториям UOW.
+
+    Каждый метод репозитория выполняет один запрос, поэтому число вызовов
+    равно числу обращений к базе (без учета COMMIT).
+    """
+
+    def count(uow: MagicMock) -> int:
+        return sum(
+            method.await_count
+            for repository in (uow.users, uow.auth_sessions)
+            for method in vars(repository).values()
+            if isinstance(method, AsyncMock)
+        )
+
+    return count
+
+
 @pytest.fixture
 def mock_token_service() -> MagicMock:
     """Создает мок для сервиса токенов."""
@@ -70,6 +96,16 @@ def mock_token_service() -> MagicMock:
     return service
 
 
+@pytest.fixture
+def mock_token_cache() -> MagicMock:
+    """Создает мок для кэша проверенных токенов."""
+    cache = MagicMock(spec=ITokenCache)
+    cache.get = MagicMock(return_value=None)
+    cache.put = MagicMock()
+
+    return cache
+
+
 @pytest.fixture
 def mock_user() -> User:
     """Создает мок пользователя."""
@@ -86,15 +122,23 @@ def mock_user() -> User:
 @pytest.fixture
 def mock_user_entity() -> User:
     """Создает мок сущности пользователя."""
-    user = User(
+    return User(
         email="test@example.com",
         hashed_password="$2b$12$abc123hashvalue456",
         is_active=True,
         is_verified=True,
     )
-    # Мокируем метод verify_password для тестов
-    user.verify_password = MagicMock(return_value=True)
-    return user
+
+
+@pytest.fixture
+def mock_password_hasher() -> MagicMock:
+    """Создает мок для сервиса хэширования паролей."""
+    hasher = MagicMock(spec=IPasswordHasher)
+    hasher.hash = AsyncMock(return_value="$2b$12$abc123hashvalue456")
+    hasher.verify = AsyncMock(return_value=True)
+    hasher.needs_update = MagicMock(return_value=False)
+
+    return hasher
 
 
 @pytest.fixture
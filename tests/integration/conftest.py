@@ -0,0 +1,15 @@
+"""Фикстуры интеграционных тестов с реальной базой PostgreSQL."""
+
+import os
+
+import pytest
+from sqlalchemy.engine import URL, make_url
+
+
+@pytest.fixture
+def database_url() -> URL:
+    """URL тестовой базы (TEST_DATABASE_URL), без него тест пропускается."""
+    url = os.getenv("TEST_DATABASE_URL")
+    if not url:
+        pytest.skip("TEST_DATABASE_URL не задан")
+    return make_url(url)
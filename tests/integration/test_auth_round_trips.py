@@ -0,0 +1,118 @@
+"""Интеграционные тесты числа обращений к БД в use cases авторизации."""
+
+from datetime import UTC, datetime, timedelta
+from unittest.mock import MagicMock
+from uuid import uuid4
+
+import pytest
+import pytest_asyncio
+from sqlalchemy import delete, event
+from sqlalchemy.ext.asyncio import AsyncSession, create_async_engine
+
+from app.application.use_cases.auth.logout import LogoutUseCase
+from app.application.use_cases.auth.refresh import RefreshTokenUseCase
+from app.application.use_cases.users.register import RegisterUserUseCase
+from app.domain.entities.auth import AuthSession
+from app.domain.entities.user import User
+from app.domain.exceptions import RefreshTokenException, ValidationException
+from app.domain.interfaces.token_service import ITokenService
+from app.infrastructure.database.models import AuthSessionModel, Base, UserModel
+from app.infrastructure.database.partitions import AuthSessionPartitionManager
+from app.infrastructure.database.uow import UOW
+
+EMAIL = "round-trips@example.com"
+
+
+@pytest_asyncio.fixture
+async def engine(database_url):
+    """Движок тестовой базы со счетчиком выполненных запросов."""
+    engine = create_async_engine(database_url)
+    async with engine.begin() as conn:
+        await conn.run_sync(Base.metadata.create_all)
+        await conn.execute(delete(UserModel).where(UserModel.email == EMAIL))
+    await AuthSessionPartitionManager(engine).maintain()
+
+    statements = []
+    event.listen(
+        engine.sync_engine,
+        "before_cursor_execute",
+        lambda conn, cursor, statement, *args: statements.append(statement),
+    )
+    engine.statements = statements
+    yield engine
+    await engine.dispose()
+
+
+def make_uow(engine) -> UOW:
+    """Создает UOW без кэша и реплики."""
+    return UOW(AsyncSession(engine, expire_on_commit=False))
+
+
+async def add_session(engine, expires_at: datetime) -> AuthSession:
+    """Создает авторизационную сессию пользователя."""
+    auth_session = AuthSession(
+        uuid=uuid4(),
+        refresh_token=uuid4(),
+        expires_at=expires_at,
+        user_email=EMAIL,
+        created_at=datetime.now(UTC),
+    )
+    async with make_uow(engine) as uow:
+        await uow.auth_sessions.add(auth_session)
+    engine.statements.clear()
+    return auth_session
+
+
+@pytest.mark.asyncio
+async def test_register_is_one_statement(engine):
+    """Тест регистрации одним запросом, в том числе при занятом email."""
+    # Act
+    await RegisterUserUseCase(make_uow(engine)).execute(User(EMAIL, "hash"))
+    created = len(engine.statements)
+    with pytest.raises(ValidationException):
+        await RegisterUserUseCase(make_uow(engine)).execute(User(EMAIL, "hash"))
+
+    # Assert
+    assert created == 1
+    assert len(engine.statements) == 2
+
+
+@pytest.mark.asyncio
+async def test_refresh_and_logout_round_trips(engine):
+    """Тест числа запросов при ротации токена, истечении и выходе."""
+    # Arrange
+    await RegisterUserUseCase(make_uow(engine)).execute(User(EMAIL, "hash"))
+    token_service = MagicMock(spec=ITokenService)
+    token_service.generate_access_token.return_value = "access"
+    token_service.generate_refresh_token.side_effect = uuid4
+    token_service.get_refresh_token_expires_at.return_value = datetime.now(
+        UTC
+    ) + timedelta(days=7)
+
+    # Act & Assert: успешная ротация - один запрос
+    active = await add_session(engine, datetime.now(UTC) + timedelta(days=1))
+    tokens = await RefreshTokenUseCase(
+        make_uow(engine), token_service, active.refresh_token
+    ).execute()
+    assert len(engine.statements) == 1
+
+    # Истекший токен - ротация и удаление сессии
+    expired = await add_session(engine, datetime.now(UTC) - timedelta(days=1))
+    with pytest.raises(RefreshTokenException, match="истек"):
+        await RefreshTokenUseCase(
+            make_uow(engine), token_service, expired.refresh_token
+        ).execute()
+    assert len(engine.statements) == 2
+
+    # Выход - один запрос
+    engine.statements.clear()
+    await LogoutUseCase(make_uow(engine), tokens.refresh_token).execute()
+    assert len(engine.statements) == 1
+
+    async with make_uow(engine) as uow:
+        remaining = await uow.session.execute(
+            AuthSessionModel.__table__.select().where(
+                AuthSessionModel.user_email == EMAIL
+            )
+        )
+        assert remaining.all() == []
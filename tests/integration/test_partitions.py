@@ -0,0 +1,62 @@
+"""Интеграционные тесты одновременного обслуживания секций auth_sessions."""
+
+import asyncio
+from datetime import UTC, datetime, timedelta
+
+import pytest
+import pytest_asyncio
+from sqlalchemy import text
+from sqlalchemy.ext.asyncio import create_async_engine
+
+from app.infrastructure.database.models import Base
+from app.infrastructure.database.partitions import (
+    LIST_PARTITIONS_QUERY,
+    AuthSessionPartitionManager,
+)
+
+WORKERS = 4
+
+
+@pytest_asyncio.fixture
+async def engine(database_url):
+    """Движок тестовой базы с секционированной auth_sessions."""
+    engine = create_async_engine(database_url, pool_size=WORKERS * 2)
+    async with engine.begin() as conn:
+        await conn.run_sync(Base.metadata.create_all)
+    yield engine
+    await engine.dispose()
+
+
+async def partitions(engine) -> set[str]:
+    """Имена секций auth_sessions."""
+    async with engine.connect() as conn:
+        return set((await conn.scalars(LIST_PARTITIONS_QUERY)).all())
+
+
+@pytest.mark.asyncio
+async def test_concurrent_maintain_creates_and_drops_each_partition_once(engine):
+    """Тест одновременного обслуживания секций несколькими воркерами."""
+    # Arrange
+    # Через год все текущие секции истекают, а будущие еще не созданы
+    await AuthSessionPartitionManager(engine).maintain()
+    before = await partitions(engine)
+    later = datetime.now(UTC) + timedelta(days=365)
+    managers = [
+        AuthSessionPartitionManager(engine, clock=lambda: later) for _ in range(WORKERS)
+    ]
+
+    # Act
+    results = await asyncio.gather(*(manager.maintain() for manager in managers))
+
+    # Assert
+    created = [name for names, _ in results for name in names]
+    dropped = [name for _, names in results for name in names]
+    assert len(created) == len(set(created))
+    assert sorted(dropped) == sorted(before - {"auth_sessions_default"})
+    assert await partitions(engine) == {"auth_sessions_default", *created}
+
+    # Возвращаем секции на текущую дату для остальных тестов
+    async with engine.begin() as conn:
+        for name in created:
+            await conn.execute(text(f"DROP TABLE {name}"))
+    await AuthSessionPartitionManager(engine).maintain()
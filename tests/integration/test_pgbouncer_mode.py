@@ -0,0 +1,236 @@
+"""Интеграционные тесты режима PgBouncer (transaction pooling)."""
+
+import asyncio
+
+import pytest
+import pytest_asyncio
+from sqlalchemy import literal, select
+from sqlalchemy.exc import DBAPIError
+from sqlalchemy.ext.asyncio import AsyncSession, create_async_engine
+from sqlalchemy.pool import NullPool
+
+from app.infrastructure.config.settings import Settings
+from app.infrastructure.database.models.base import Base
+from app.infrastructure.database.pool import (
+    SessionStateError,
+    forbid_session_state,
+    get_engine_options,
+)
+from app.infrastructure.database.uow import UOW
+
+SSL_REQUEST = 80877103
+GSSENC_REQUEST = 80877104
+CANCEL_REQUEST = 80877102
+AUTH_OK = b"R\x00\x00\x00\x08\x00\x00\x00\x00"
+# Коды AuthenticationXXX, после которых сервер ждет ответа клиента
+AUTH_NEEDS_RESPONSE = {3, 5, 10, 11}
+
+
+async def _read_startup(reader: asyncio.StreamReader) -> bytes:
+    """Читает стартовое сообщение (без байта типа)."""
+    header = await reader.readexactly(4)
+    length = int.from_bytes(header, "big")
+    return header + await reader.readexactly(length - 4)
+
+
+async def _read_message(reader: asyncio.StreamReader) -> bytes:
+    """Читает сообщение протокола PostgreSQL целиком."""
+    header = await reader.readexactly(5)
+    length = int.from_bytes(header[1:], "big")
+    return header + await reader.readexactly(length - 4)
+
+
+class TransactionPoolingProxy:
+    """Заменитель PgBouncer для тестов.
+
+    Как и PgBouncer, отдает освободившееся серверное соединение следующему
+    клиенту без сброса состояния сессии: prepared statements, SET и прочее
+    остаются на сервере. Клиенту при этом проигрывается записанный ответ
+    на стартовое сообщение, аутентификация повторно не выполняется.
+    """
+
+    def __init__(self, host: str, port: int):
+        self._upstream = (host, port)
+        self._idle: list[tuple[asyncio.StreamReader, asyncio.StreamWriter]] = []
+        self._startup_response: bytes | None = None
+        self._server: asyncio.Server | None = None
+        self.server_connections = 0
+
+    async def start(self) -> int:
+        """Запускает прокси и возвращает его порт."""
+        self._server = await asyncio.start_server(self._handle, "127.0.0.1", 0)
+        return self._server.sockets[0].getsockname()[1]
+
+    async def stop(self) -> None:
+        """Останавливает прокси и закрывает серверные соединения."""
+        self._server.close()
+        await self._server.wait_closed()
+        for _, writer in self._idle:
+            writer.close()
+
+    async def _handle(self, client_reader, client_writer) -> None:
+        """Обслуживает одно клиентское соединение."""
+        try:
+            startup = await _read_startup(client_reader)
+            while int.from_bytes(startup[4:8], "big") in (SSL_REQUEST, GSSENC_REQUEST):
+                client_writer.write(b"N")
+                await client_writer.drain()
+                startup = await _read_startup(client_reader)
+            if int.from_bytes(startup[4:8], "big") == CANCEL_REQUEST:
+                return
+
+            if self._idle:
+                server_reader, server_writer = self._idle.pop()
+                client_writer.write(AUTH_OK + self._startup_response)
+            else:
+                server_reader, server_writer = await asyncio.open_connection(
+                    *self._upstream
+                )
+                self.server_connections += 1
+                server_writer.write(startup)
+                if not await self._authenticate(
+                    client_reader, client_writer, server_reader, server_writer
+                ):
+                    server_writer.close()
+                    return
+
+            if await self._pipe(
+                client_reader, client_writer, server_reader, server_writer
+            ):
+                self._idle.append((server_reader, server_writer))
+            else:
+                server_writer.close()
+        except (asyncio.IncompleteReadError, ConnectionError):
+            pass
+        finally:
+            client_writer.close()
+
+    async def _authenticate(
+        self, client_reader, client_writer, server_reader, server_writer
+    ) -> bool:
+        """Пропускает аутентификацию и записывает ответ на стартовое сообщение."""
+        recorded = b""
+        authenticated = False
+        while True:
+            message = await _read_message(server_reader)
+            client_writer.write(message)
+            await client_writer.drain()
+
+            kind = message[:1]
+            if kind == b"E":
+                return False
+            if kind == b"R":
+                code = int.from_bytes(message[5:9], "big")
+                if code == 0:
+                    authenticated = True
+                elif code in AUTH_NEEDS_RESPONSE:
+                    server_writer.write(await _read_message(client_reader))
+                continue
+            if authenticated:
+                recorded += message
+            if kind == b"Z":
+                if self._startup_response is None:
+                    self._startup_response = recorded
+                return True
+
+    async def _pipe(
+        self, client_reader, client_writer, server_reader, server_writer
+    ) -> bool:
+        """Передает сообщения, пока клиент не отключится.
+
+        Возвращает True, если серверное соединение можно отдать другому клиенту.
+        """
+        status = b"I"
+
+        async def server_to_client():
+            nonlocal status
+            while True:
+                message = await _read_message(server_reader)
+                if message[:1] == b"Z":
+                    status = message[5:6]
+                client_writer.write(message)
+                await client_writer.drain()
+
+        forwarder = asyncio.create_task(server_to_client())
+        terminated = False
+        try:
+            while not forwarder.done():
+                message = await _read_message(client_reader)
+                if message[:1] == b"X":
+                    terminated = True
+                    break
+                server_writer.write(message)
+                await server_writer.drain()
+        except asyncio.IncompleteReadError:
+            pass
+        finally:
+            forwarder.cancel()
+        return terminated and status == b"I"
+
+
+@pytest_asyncio.fixture
+async def proxy_url(database_url):
+    """URL подключения к базе через заменитель PgBouncer."""
+    engine = create_async_engine(database_url)
+    async with engine.begin() as conn:
+        await conn.run_sync(Base.metadata.create_all)
+    await engine.dispose()
+
+    proxy = TransactionPoolingProxy(database_url.host, database_url.port or 5432)
+    port = await proxy.start()
+    yield database_url.set(host="127.0.0.1", port=port), proxy
+    await proxy.stop()
+
+
+async def _run_transactions(engine, count: int) -> None:
+    """Выполняет несколько транзакций UOW подряд."""
+    for _ in range(count):
+        async with UOW(AsyncSession(engine, expire_on_commit=False)) as uow:
+            await uow.session.execute(select(literal(1)))
+            assert await uow.users.find_by_email(email="missing@example.com") is None
+
+
+@pytest.mark.asyncio
+async def test_pgbouncer_mode_survives_server_connection_reuse(proxy_url):
+    """Тест работы UOW, когда серверное соединение переходит между клиентами."""
+    # Arrange
+    url, proxy = proxy_url
+    settings = Settings(ALGORITHM="HS256", DB_PGBOUNCER_MODE=True)
+    engine = create_async_engine(url, **get_engine_options(settings))
+    forbid_session_state(engine)
+
+    # Act
+    await _run_transactions(engine, count=5)
+    await engine.dispose()
+
+    # Assert
+    assert proxy.server_connections == 1
+
+
+@pytest.mark.asyncio
+async def test_default_statement_cache_breaks_on_server_connection_reuse(proxy_url):
+    """Тест того, что заменитель воспроизводит проблему prepared statements."""
+    # Arrange
+    url, _ = proxy_url
+    engine = create_async_engine(url, poolclass=NullPool)
+
+    # Act & Assert
+    with pytest.raises(DBAPIError, match="already exists"):
+        await _run_transactions(engine, count=5)
+    await engine.dispose()
+
+
+@pytest.mark.asyncio
+async def test_pgbouncer_mode_rejects_session_state(proxy_url):
+    """Тест запрета запросов, зависящих от состояния сессии."""
+    # Arrange
+    url, _ = proxy_url
+    settings = Settings(ALGORITHM="HS256", DB_PGBOUNCER_MODE=True)
+    engine = create_async_engine(url, **get_engine_options(settings))
+    forbid_session_state(engine)
+
+    # Act & Assert
+    with pytest.raises(SessionStateError):
+        async with engine.connect() as conn:
+            await conn.exec_driver_sql("SET search_path TO public")
+    await engine.dispose()
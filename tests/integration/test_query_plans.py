@@ -0,0 +1,236 @@
+"""Регрессионные тесты планов запросов репозиториев (EXPLAIN FORMAT JSON).
+
+Каждый сценарий вызывает метод репозитория на заполненной базе внутри
+откатываемой транзакции, записывает выполненные запросы и проверяет их
+планы: последовательное сканирование запрещено (enable_seqscan = off делает
+его выбор возможным только при отсутствии подходящего индекса), а каждый
+запрос должен использовать ожидаемые индексы.
+"""
+
+import json
+import re
+from datetime import UTC, datetime, timedelta
+from uuid import uuid4
+
+import pytest
+import pytest_asyncio
+from sqlalchemy import delete, event, func, select, text
+from sqlalchemy.ext.asyncio import AsyncSession, create_async_engine
+
+from app.domain.entities.auth import AuthSession
+from app.domain.entities.user import User
+from app.infrastructure.database.models import AuthSessionModel, Base
+from app.infrastructure.database.partitions import AuthSessionPartitionManager
+from app.infrastructure.database.repositories.auth_session_repo import (
+    AuthSessionRepository,
+)
+from app.infrastructure.database.repositories.user_repo import UserRepository
+
+PREFIX = "plan-"
+USERS = 5_000
+SESSIONS = 50_000
+
+SEED_USERS = text(
+    "INSERT INTO users (email, hashed_password, is_active, is_verified, created_at) "
+    f"SELECT '{PREFIX}' || g || '@example.com', 'hash', true, false, now() "
+    "FROM generate_series(1, :users) AS g ON CONFLICT DO NOTHING"
+)
+# Сессии распределены от трех дней в прошлом до тридцати дней вперед
+SEED_SESSIONS = text(
+    "INSERT INTO auth_sessions (uuid, refresh_token, expires_at, user_email, "
+    "created_at) "
+    "SELECT gen_random_uuid(), gen_random_uuid(), "
+    "now() + make_interval(hours => g % (33 * 24) - 72), "
+    f"'{PREFIX}' || (g % :users + 1) || '@example.com', now() "
+    "FROM generate_series(1, :sessions) AS g"
+)
+
+REFRESH_TOKEN_INDEX = r"refresh_token"
+USER_EMAIL_INDEX = r"user_email"
+EXPIRES_AT_INDEX = r"(?<!token)_expires_at(_idx)?$"
+PRIMARY_KEY = r"pkey$"
+
+
+@pytest_asyncio.fixture
+async def engine(database_url):
+    """Движок тестовой базы с заполненными таблицами users и auth_sessions."""
+    engine = create_async_engine(database_url)
+    async with engine.begin() as conn:
+        await conn.run_sync(Base.metadata.create_all)
+    await AuthSessionPartitionManager(engine).maintain()
+
+    async with engine.begin() as conn:
+        seeded = await conn.scalar(
+            select(func.count())
+            .select_from(AuthSessionModel)
+            .where(AuthSessionModel.user_email.startswith(PREFIX))
+        )
+        if seeded < SESSIONS:
+            await conn.execute(SEED_USERS, {"users": USERS})
+            await conn.execute(SEED_SESSIONS, {"users": USERS, "sessions": SESSIONS})
+        await conn.execute(text("ANALYZE users"))
+        await conn.execute(text("ANALYZE auth_sessions"))
+
+    yield engine
+    await engine.dispose()
+
+
+@pytest_asyncio.fixture
+async def sample(engine) -> AuthSession:
+    """Действующая сессия из заполненных данных."""
+    async with engine.connect() as conn:
+        row = (
+            await conn.execute(
+                select(AuthSessionModel.__table__)
+                .where(
+                    AuthSessionModel.user_email.startswith(PREFIX),
+                    AuthSessionModel.expires_at > func.now(),
+                )
+                .limit(1)
+            )
+        ).one()
+    return AuthSession(**row._mapping)
+
+
+def _new_session(user_email: str) -> AuthSession:
+    """Новая сессия для сценария вставки."""
+    return AuthSession(
+        uuid=uuid4(),
+        refresh_token=uuid4(),
+        expires_at=datetime.now(UTC) + timedelta(days=30),
+        user_email=user_email,
+        created_at=datetime.now(UTC),
+    )
+
+
+# Сценарий: (название, вызов репозиториев, ожидаемые индексы)
+SCENARIOS = [
+    (
+        "users.find_by_email",
+        lambda users, sessions, s: users.find_by_email(s.user_email),
+        [PRIMARY_KEY],
+    ),
+    (
+        "users.create_if_not_exists",
+        lambda users, sessions, s: users.create_if_not_exists(
+            User(s.user_email, "hash")
+        ),
+        [],
+    ),
+    (
+        "users.update_password",
+        lambda users, sessions, s: users.update_password(s.user_email, "hash"),
+        [PRIMARY_KEY],
+    ),
+    (
+        "auth_sessions.add",
+        lambda users, sessions, s: sessions.add(_new_session(s.user_email)),
+        [],
+    ),
+    (
+        "auth_sessions.find_by_refresh_token",
+        lambda users, sessions, s: sessions.find_by_refresh_token(s.refresh_token),
+        [REFRESH_TOKEN_INDEX],
+    ),
+    (
+        "auth_sessions.update_refresh_token",
+        lambda users, sessions, s: sessions.update_refresh_token(
+            s.uuid, uuid4(), s.expires_at
+        ),
+        [PRIMARY_KEY],
+    ),
+    (
+        "auth_sessions.delete_by_refresh_token",
+        lambda users, sessions, s: sessions.delete_by_refresh_token(s.refresh_token),
+        [REFRESH_TOKEN_INDEX],
+    ),
+    (
+        "auth_sessions.pop_by_refresh_token",
+        lambda users, sessions, s: sessions.pop_by_refresh_token(s.refresh_token),
+        [REFRESH_TOKEN_INDEX],
+    ),
+    (
+        "auth_sessions.rotate_refresh_token",
+        lambda users, sessions, s: sessions.rotate_refresh_token(
+            s.refresh_token, uuid4(), s.expires_at
+        ),
+        [REFRESH_TOKEN_INDEX, PRIMARY_KEY],
+    ),
+    (
+        "auth_sessions.delete_expired",
+        lambda users, sessions, s: sessions.delete_expired(100),
+        [EXPIRES_AT_INDEX],
+    ),
+    (
+        # Запрос, который выполняет ON DELETE CASCADE при удалении пользователя
+        "users ON DELETE CASCADE",
+        lambda users, sessions, s: sessions.session.execute(
+            delete(AuthSessionModel).where(AuthSessionModel.user_email == s.user_email)
+        ),
+        [USER_EMAIL_INDEX],
+    ),
+]
+
+
+def _walk(plan: dict):
+    """Обходит все узлы плана."""
+    yield plan
+    for child in plan.get("Plans", []):
+        yield from _walk(child)
+
+
+async def _explain(engine, scenario, sample: AuthSession) -> list[tuple[str, dict]]:
+    """Выполняет сценарий в откатываемой транзакции и возвращает планы."""
+    statements = []
+
+    def record(conn, cursor, statement, parameters, context, executemany):
+        statements.append((statement, parameters))
+
+    async with engine.connect() as conn:
+        await conn.begin()
+        session = AsyncSession(bind=conn, join_transaction_mode="create_savepoint")
+        event.listen(conn.sync_connection, "before_cursor_execute", record)
+        try:
+            await scenario(
+                UserRepository(session), AuthSessionRepository(session), sample
+            )
+        finally:
+            event.remove(conn.sync_connection, "before_cursor_execute", record)
+
+        await conn.exec_driver_sql("SET LOCAL enable_seqscan = off")
+        plans = []
+        for statement, parameters in statements:
+            result = await conn.exec_driver_sql(
+                f"EXPLAIN (FORMAT JSON) {statement}", parameters
+            )
+            value = result.scalar_one()
+            if isinstance(value, str):
+                value = json.loads(value)
+            plans.append((statement, value[0]["Plan"]))
+        await conn.rollback()
+    return plans
+
+
+@pytest.mark.asyncio
+@pytest.mark.parametrize(
+    ("scenario", "expected_indexes"),
+    [pytest.param(call, indexes, id=name) for name, call, indexes in SCENARIOS],
+)
+async def test_repository_query_plan(engine, sample, scenario, expected_indexes):
+    """Тест отсутствия последовательных сканирований и использования индексов."""
+    # Act
+    plans = await _explain(engine, scenario, sample)
+
+    # Assert
+    assert plans, "сценарий не выполнил ни одного запроса"
+    nodes = [node for _, plan in plans for node in _walk(plan)]
+    seq_scans = [
+        node["Relation Name"] for node in nodes if node["Node Type"] == "Seq Scan"
+    ]
+    assert not seq_scans, f"Seq Scan по {seq_scans} в {[s for s, _ in plans]}"
+
+    index_names = [node["Index Name"] for node in nodes if "Index Name" in node]
+    for pattern in expected_indexes:
+        assert any(re.search(pattern, name) for name in index_names), (
+            f"ожидался индекс {pattern!r}, использованы {index_names}"
+        )
@@ -0,0 +1,58 @@
+"""Интеграционные тесты загрузки пользователей через COPY."""
+
+from datetime import UTC, datetime
+
+import pytest
+import pytest_asyncio
+from sqlalchemy import delete, select
+from sqlalchemy.ext.asyncio import create_async_engine
+
+from app.domain.entities.user import User
+from app.infrastructure.database.models import Base, UserModel
+from app.infrastructure.database.user_import import CopyUserBulkLoader
+
+PREFIX = "bulk-import-"
+
+
+@pytest_asyncio.fixture
+async def engine(database_url):
+    """Движок тестовой базы без пользователей импорта."""
+    engine = create_async_engine(database_url)
+    async with engine.begin() as conn:
+        await conn.run_sync(Base.metadata.create_all)
+        await conn.execute(delete(UserModel).where(UserModel.email.startswith(PREFIX)))
+    yield engine
+    async with engine.begin() as conn:
+        await conn.execute(delete(UserModel).where(UserModel.email.startswith(PREFIX)))
+    await engine.dispose()
+
+
+def make_user(name: str) -> User:
+    """Пользователь для импорта."""
+    return User(f"{PREFIX}{name}@example.com", "hash", created_at=datetime.now(UTC))
+
+
+@pytest.mark.asyncio
+async def test_load_reports_existing_and_duplicate_emails(engine):
+    """Тест загрузки пачки с существующим и повторяющимся email."""
+    # Arrange
+    loader = CopyUserBulkLoader(engine)
+    await loader.load([make_user("existing")])
+
+    # Act
+    conflicts = await loader.load(
+        [make_user("existing"), make_user("new"), make_user("new")]
+    )
+
+    # Assert
+    assert conflicts == [f"{PREFIX}existing@example.com", f"{PREFIX}new@example.com"]
+    async with engine.connect() as conn:
+        emails = (
+            await conn.scalars(
+                select(UserModel.email).where(UserModel.email.startswith(PREFIX))
+            )
+        ).all()
+    assert sorted(emails) == [
+        f"{PREFIX}existing@example.com",
+        f"{PREFIX}new@example.com",
+    ]
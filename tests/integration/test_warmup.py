@@ -0,0 +1,44 @@
+"""Интеграционные тесты прогрева воркера."""
+
+import pytest
+import pytest_asyncio
+from sqlalchemy.ext.asyncio import AsyncSession, create_async_engine
+
+from app.infrastructure.database.models import Base
+from app.infrastructure.database.partitions import AuthSessionPartitionManager
+from app.infrastructure.database.pool import prewarm_pool
+from app.infrastructure.database.uow import UOW
+from app.infrastructure.services.warmup import prime_repository_statements
+
+
+@pytest_asyncio.fixture
+async def engine(database_url):
+    """Движок тестовой базы с пулом на три соединения."""
+    engine = create_async_engine(database_url, pool_size=3, max_overflow=5)
+    async with engine.begin() as conn:
+        await conn.run_sync(Base.metadata.create_all)
+    await AuthSessionPartitionManager(engine).maintain()
+    yield engine
+    await engine.dispose()
+
+
+@pytest.mark.asyncio
+async def test_prewarm_pool_opens_connections_up_to_pool_size(engine):
+    """Тест открытия соединений пула, но не больше его размера."""
+    # Act
+    opened = await prewarm_pool(engine, 10)
+
+    # Assert
+    assert opened == 3
+    assert engine.pool.checkedin() == 3
+    assert engine.pool.checkedout() == 0
+
+
+@pytest.mark.asyncio
+async def test_prime_repository_statements_runs_against_database(engine):
+    """Тест выполнения запросов прогрева на реальной схеме."""
+    # Act
+    await prime_repository_statements(lambda: UOW(AsyncSession(engine)))
+
+    # Assert
+    assert engine.pool.checkedout() == 0
@@ -0,0 +1,132 @@
+"""Тесты для use case получения текущего пользователя."""
+
+import pytest
+
+from app.application.use_cases.users.get_current_user import GetCurrentUserUseCase
+from app.domain.exceptions import AuthenticationException
+
+
+@pytest.mark.asyncio(loop_scope="function")
+async def test_get_current_user_decodes_and_caches_token(
+    mock_uow, mock_token_service, mock_token_cache, mock_user
+):
+    """Тест получения пользователя с декодированием и кэшированием токена."""
+    # Arrange
+    claims = {"sub": mock_user.email, "exp": 4102444800}
+    mock_token_service.decode_access_token.return_value = claims
+    mock_uow.users.find_by_email.return_value = mock_user
+
+    usecase = GetCurrentUserUseCase(
+        mock_uow, mock_token_service, "access_token", mock_token_cache
+    )
+
+    # Act
+    result = await usecase.execute()
+
+    # Assert
+    assert result == mock_user
+    mock_token_cache.get.assert_called_once_with("access_token")
+    mock_token_service.decode_access_token.assert_called_once_with("access_token")
+    mock_token_cache.put.assert_called_once_with("access_token", claims)
+    mock_uow.users.find_by_email.assert_called_once_with(
+        email=mock_user.email, use_cache=True
+    )
+    mock_uow.release.assert_awaited_once()
+
+
+@pytest.mark.asyncio(loop_scope="function")
+async def test_get_current_user_uses_cached_claims(
+    mock_uow, mock_token_service, mock_token_cache, mock_user
+):
+    """Тест получения пользователя по claims из кэша без декодирования."""
+    # Arrange
+    mock_token_cache.get.return_value = {"sub": mock_user.email, "exp": 4102444800}
+    mock_uow.users.find_by_email.return_value = mock_user
+
+    usecase = GetCurrentUserUseCase(
+        mock_uow, mock_token_service, "access_token", mock_token_cache
+    )
+
+    # Act
+    result = await usecase.execute()
+
+    # Assert
+    assert result == mock_user
+    mock_token_service.decode_access_token.assert_not_called()
+    mock_token_cache.put.assert_not_called()
+
+
+@pytest.mark.asyncio(loop_scope="function")
+async def test_get_current_user_invalid_token(
+    mock_uow, mock_token_service, mock_token_cache
+):
+    """Тест получения пользователя с невалидным токеном."""
+    # Arrange
+    mock_token_service.decode_access_token.side_effect = ValueError("invalid")
+
+    usecase = GetCurrentUserUseCase(
+        mock_uow, mock_token_service, "bad_token", mock_token_cache
+    )
+
+    # Act & Assert
+    with pytest.raises(AuthenticationException):
+        await usecase.execute()
+
+    mock_token_cache.put.assert_not_called()
+    mock_uow.users.find_by_email.assert_not_called()
+
+
+@pytest.mark.asyncio(loop_scope="function")
+async def test_get_current_user_from_token_claims(
+    mock_uow, mock_token_service, mock_token_cache, mock_user
+):
+    """Тест сборки пользователя из claims токена без обращения к БД."""
+    # Arrange
+    mock_token_service.decode_access_token.return_value = {
+        "sub": mock_user.email,
+        "exp": 4102444800,
+        "is_active": True,
+    }
+    mock_token_service.user_from_claims.return_value = mock_user
+
+    usecase = GetCurrentUserUseCase(
+        mock_uow,
+        mock_token_service,
+        "access_token",
+        mock_token_cache,
+        trust_token_claims=True,
+    )
+
+    # Act
+    result = await usecase.execute()
+
+    # Assert
+    assert result == mock_user
+    mock_uow.users.find_by_email.assert_not_called()
+
+
+@pytest.mark.asyncio(loop_scope="function")
+async def test_get_current_user_fresh_reads_database(
+    mock_uow, mock_token_service, mock_token_cache, mock_user
+):
+    """Тест явного запроса актуальных данных пользователя из БД."""
+    # Arrange
+    mock_uow.users.find_by_email.return_value = mock_user
+
+    usecase = GetCurrentUserUseCase(
+        mock_uow,
+        mock_token_service,
+        "access_token",
+        mock_token_cache,
+        trust_token_claims=True,
+    )
+
+    # Act
+    result = await usecase.execute(fresh=True)
+
+    # Assert
+    assert result == mock_user
+    mock_token_service.user_from_claims.assert_not_called()
+    mock_uow.users.find_by_email.assert_called_once_with(
+        email="test@example.com", use_cache=False
+    )
@@ -0,0 +1,107 @@
+"""Тесты для use case массового импорта пользователей."""
+
+from unittest.mock import AsyncMock, MagicMock
+
+import pytest
+
+from app.application.use_cases.users.import_users import ImportUsersUseCase
+from app.domain.entities.user_import import UserImportRow
+from app.domain.interfaces.user_bulk_loader import IUserBulkLoader
+
+HASH = "$2b$12$" + "a" * 53
+
+
+async def rows(*items: UserImportRow):
+    """Асинхронный поток строк импорта."""
+    for item in items:
+        yield item
+
+
+@pytest.fixture
+def loader() -> MagicMock:
+    """Загрузчик без конфликтов."""
+    loader = MagicMock(spec=IUserBulkLoader)
+    loader.load = AsyncMock(return_value=[])
+    return loader
+
+
+@pytest.fixture
+def hasher(mock_password_hasher) -> MagicMock:
+    """Хэшер, возвращающий по хэшу на каждый пароль."""
+    mock_password_hasher.hash_many = AsyncMock(
+        side_effect=lambda passwords: [f"hash:{p}" for p in passwords]
+    )
+    return mock_password_hasher
+
+
+@pytest.mark.asyncio(loop_scope="function")
+async def test_import_loads_in_batches(loader, hasher):
+    """Тест загрузки пачками и хэширования только открытых паролей."""
+    # Arrange
+    usecase = ImportUsersUseCase(loader, hasher, batch_size=2)
+    progress = []
+
+    # Act
+    report = await usecase.execute(
+        rows(
+            UserImportRow(1, "a@example.com", password="password-a"),
+            UserImportRow(2, "b@example.com", hashed_password=HASH),
+            UserImportRow(3, "c@example.com", password="password-c"),
+        ),
+        on_progress=lambda report: progress.append(report.imported),
+    )
+
+    # Assert
+    assert report.processed == 3
+    assert report.imported == 3
+    assert progress == [2, 3]
+    first, second = (call.args[0] for call in loader.load.await_args_list)
+    assert [u.hashed_password for u in first] == ["hash:password-a", HASH]
+    assert [u.email for u in second] == ["c@example.com"]
+    hasher.hash_many.assert_any_await(["password-a"])
+
+
+@pytest.mark.asyncio(loop_scope="function")
+async def test_import_reports_conflicts_and_invalid_rows(loader, hasher):
+    """Тест отчета о существующих email и некорректных строках."""
+    # Arrange
+    loader.load.return_value = ["a@example.com"]
+    usecase = ImportUsersUseCase(loader, hasher, batch_size=10)
+
+    # Act
+    report = await usecase.execute(
+        rows(
+            UserImportRow(1, "a@example.com", password="password-a"),
+            UserImportRow(2, "b@example.com", password="short"),
+            UserImportRow(3, "not-an-email", password="password-c"),
+            UserImportRow(4, "d@example.com", hashed_password="plain"),
+            UserImportRow(5, "", error="некорректный JSON"),
+            UserImportRow(6, "f@example.com", password="password-f"),
+        )
+    )
+
+    # Assert
+    assert report.processed == 6
+    assert report.imported == 1
+    assert report.conflicts == 1
+    assert report.conflict_emails == ["a@example.com"]
+    assert report.invalid == 4
+    assert report.errors[0].startswith("строка 2: длина пароля")
+    assert report.errors[-1] == "строка 5: некорректный JSON"
+
+
+@pytest.mark.asyncio(loop_scope="function")
+async def test_import_limits_reported_examples(loader, hasher):
+    """Тест ограничения числа примеров ошибок в отчете."""
+    # Arrange
+    usecase = ImportUsersUseCase(loader, hasher, max_reported=2)
+
+    # Act
+    report = await usecase.execute(
+        rows(*(UserImportRow(n, "", error="ошибка") for n in range(5)))
+    )
+
+    # Assert
+    assert report.invalid == 5
+    assert len(report.errors) == 2
+    loader.load.assert_not_awaited()
@@ -1,25 +1,29 @@
 """Тесты для use case логина пользователя."""
 
 from datetime import UTC, datetime, timedelta
-from unittest.mock import MagicMock
 
 import pytest
 
 from app.application.use_cases.auth.login import LoginUseCase
 from app.domain.entities.auth import Token
-from app.domain.entities.user import User, pwd_context
+from app.domain.entities.user import User
 from app.domain.exceptions import AuthenticationException
+from app.domain.interfaces.password_hasher import IPasswordHasher
 from app.domain.interfaces.token_service import ITokenService
 from app.domain.interfaces.uow import IUOW
 
 
 @pytest.mark.asyncio
-async def test_login_success(mock_uow: IUOW, mock_token_service: ITokenService):
+async def test_login_success(
+    mock_uow: IUOW,
+    mock_token_service: ITokenService,
+    mock_password_hasher: IPasswordHasher,
+):
     """Тест успешного логина пользователя."""
     # Arrange
     email = "test@example.com"
     password = "password123"
-    hashed_password = pwd_context.hash("password123")
+    hashed_password = "$2b$12$abc123hashvalue456"
 
     user = User(
         email=email,
@@ -34,7 +38,7 @@ async def test_login_success(mock_uow: IUOW, mock_token_service: ITokenService):
     expires_at = datetime.now(UTC) + timedelta(days=7)
     mock_token_service.get_refresh_token_expires_at.return_value = expires_at
 
-    usecase = LoginUseCase(mock_uow, mock_token_service)
+    usecase = LoginUseCase(mock_uow, mock_token_service, mock_password_hasher)
 
     # Act
     result = await usecase.execute(email=email, password=password)
@@ -44,14 +48,19 @@ async def test_login_success(mock_uow: IUOW, mock_token_service: ITokenService):
     assert result.access_token == "access_token"
     assert result.refresh_token == "refresh_token"
 
-    mock_uow.users.find_by_email.assert_called_once_with(email)
-    mock_token_service.generate_access_token.assert_called_once_with(email)
+    mock_uow.users.find_by_email.assert_called_once_with(email, use_cache=False)
+    mock_password_hasher.verify.assert_awaited_once_with(password, hashed_password)
+    mock_token_service.generate_access_token.assert_called_once_with(email, user=user)
     mock_token_service.generate_refresh_token.assert_called_once()
     mock_uow.auth_sessions.add.assert_called_once()
 
 
 @pytest.mark.asyncio
-async def test_login_user_not_found(mock_uow: IUOW, mock_token_service: ITokenService):
+async def test_login_user_not_found(
+    mock_uow: IUOW,
+    mock_token_service: ITokenService,
+    mock_password_hasher: IPasswordHasher,
+):
     """Тест логина с несуществующим пользователем."""
     # Arrange
     email = "nonexistent@example.com"
@@ -59,33 +68,68 @@ async def test_login_user_not_found(mock_uow: IUOW, mock_token_service: ITokenSe
 
     mock_uow.users.find_by_email.return_value = None
 
-    usecase = LoginUseCase(mock_uow, mock_token_service)
+    usecase = LoginUseCase(mock_uow, mock_token_service, mock_password_hasher)
 
     # Act & Assert
     with pytest.raises(AuthenticationException) as exc_info:
         await usecase.execute(email=email, password=password)
 
     assert "Неверный email или пароль" in str(exc_info.value)
-    mock_uow.users.find_by_email.assert_called_once_with(email)
+    mock_uow.users.find_by_email.assert_called_once_with(email, use_cache=False)
+    mock_password_hasher.verify.assert_not_called()
 
 
 @pytest.mark.asyncio
 async def test_login_wrong_password(
-    mock_uow: IUOW, mock_token_service: ITokenService, mock_user_entity: User
+    mock_uow: IUOW,
+    mock_token_service: ITokenService,
+    mock_password_hasher: IPasswordHasher,
+    mock_user_entity: User,
 ):
     """Тест логина с неверным паролем."""
     # Arrange
     email = "test@example.com"
     password = "wrong_password"
 
-    mock_user_entity.verify_password = MagicMock(return_value=False)
+    mock_password_hasher.verify.return_value = False
     mock_uow.users.find_by_email.return_value = mock_user_entity
 
-    usecase = LoginUseCase(mock_uow, mock_token_service)
+    usecase = LoginUseCase(mock_uow, mock_token_service, mock_password_hasher)
 
     # Act & Assert
     with pytest.raises(AuthenticationException) as exc_info:
         await usecase.execute(email=email, password=password)
 
     assert "Неверный email или пароль" in str(exc_info.value)
-    mock_user_entity.verify_password.assert_called_once_with(password)
+    mock_password_hasher.verify.assert_awaited_once_with(
+        password, mock_user_entity.hashed_password
+    )
+
+
+@pytest.mark.asyncio
+async def test_login_rehashes_outdated_password(
+    mock_uow: IUOW,
+    mock_token_service: ITokenService,
+    mock_password_hasher: IPasswordHasher,
+    mock_user_entity: User,
+):
+    """Тест перехэширования пароля с устаревшей стоимостью при логине."""
+    # Arrange
+    password = "password123"
+    new_hashed_password = "$2b$10$newhashvalue"
+
+    mock_uow.users.find_by_email.return_value = mock_user_entity
+    mock_password_hasher.needs_update.return_value = True
+    mock_password_hasher.hash.return_value = new_hashed_password
+
+    usecase = LoginUseCase(mock_uow, mock_token_service, mock_password_hasher)
+
+    # Act
+    await usecase.execute(email=mock_user_entity.email, password=password)
+
+    # Assert
+    mock_password_hasher.hash.assert_awaited_once_with(password)
+    mock_uow.users.update_password.assert_awaited_once_with(
+        mock_user_entity.email, new_hashed_password
+    )
+    mock_uow.commit.assert_called_once()
@@ -11,7 +11,7 @@ from app.domain.exceptions import RefreshTokenException
 
 
 @pytest.mark.asyncio
-async def test_logout_success(mock_uow):
+async def test_logout_success(mock_uow, count_round_trips):
     """Тест успешного выхода из системы."""
     # Arrange
     refresh_token = UUID("11111111-1111-1111-1111-111111111111")
@@ -26,7 +26,7 @@ async def test_logout_success(mock_uow):
         created_at=datetime.now(UTC),
     )
 
-    mock_uow.auth_sessions.find_by_refresh_token.return_value = session
+    mock_uow.auth_sessions.pop_by_refresh_token.return_value = session
 
     usecase = LogoutUseCase(mock_uow, refresh_token)
 
@@ -34,20 +34,18 @@ async def test_logout_success(mock_uow):
     await usecase.execute()
 
     # Assert
-    mock_uow.auth_sessions.find_by_refresh_token.assert_called_once_with(refresh_token)
-    mock_uow.auth_sessions.delete_by_refresh_token.assert_called_once_with(
-        refresh_token
-    )
+    mock_uow.auth_sessions.pop_by_refresh_token.assert_called_once_with(refresh_token)
+    assert count_round_trips(mock_uow) == 1
     assert mock_uow.commit.call_count == 1
 
 
 @pytest.mark.asyncio
-async def test_logout_token_not_found(mock_uow):
+async def test_logout_token_not_found(mock_uow, count_round_trips):
     """Тест выхода с несуществующим токеном."""
     # Arrange
     refresh_token = UUID("22222222-2222-2222-2222-222222222222")
 
-    mock_uow.auth_sessions.find_by_refresh_token.return_value = None
+    mock_uow.auth_sessions.pop_by_refresh_token.return_value = None
 
     usecase = LogoutUseCase(mock_uow, refresh_token)
 
@@ -56,5 +54,5 @@ async def test_logout_token_not_found(mock_uow):
         await usecase.execute()
 
     assert "Сессия не найдена" in str(exc_info.value)
-    mock_uow.auth_sessions.find_by_refresh_token.assert_called_once_with(refresh_token)
-    mock_uow.auth_sessions.delete_by_refresh_token.assert_not_called()
+    mock_uow.auth_sessions.pop_by_refresh_token.assert_called_once_with(refresh_token)
+    assert count_round_trips(mock_uow) == 1
@@ -0,0 +1,59 @@
+"""Тесты для use case удаления истекших сессий."""
+
+import pytest
+
+from app.application.use_cases.auth.purge_expired_sessions import (
+    PurgeExpiredSessionsUseCase,
+)
+
+
+@pytest.mark.asyncio(loop_scope="function")
+async def test_purge_runs_batches_until_short_batch(mock_uow):
+    """Тест удаления пачками до первой неполной пачки."""
+    # Arrange
+    mock_uow.auth_sessions.delete_expired.side_effect = [100, 100, 42]
+    usecase = PurgeExpiredSessionsUseCase(lambda: mock_uow, batch_size=100)
+
+    # Act
+    purged = await usecase.execute()
+
+    # Assert
+    assert purged == 242
+    assert mock_uow.auth_sessions.delete_expired.await_count == 3
+    # Каждая пачка - отдельная транзакция
+    assert mock_uow.commit.await_count == 3
+
+
+@pytest.mark.asyncio(loop_scope="function")
+async def test_purge_stops_at_max_batches(mock_uow):
+    """Тест ограничения числа пачек за один запуск."""
+    # Arrange
+    mock_uow.auth_sessions.delete_expired.return_value = 100
+    usecase = PurgeExpiredSessionsUseCase(
+        lambda: mock_uow, batch_size=100, max_batches=2
+    )
+
+    # Act
+    purged = await usecase.execute()
+
+    # Assert
+    assert purged == 200
+    assert mock_uow.auth_sessions.delete_expired.await_count == 2
+
+
+@pytest.mark.asyncio(loop_scope="function")
+async def test_purge_pauses_under_load(mock_uow):
+    """Тест откладывания удаления при нагрузке на пул соединений."""
+    # Arrange
+    mock_uow.auth_sessions.delete_expired.return_value = 100
+    busy = iter([False, True])
+    usecase = PurgeExpiredSessionsUseCase(
+        lambda: mock_uow, batch_size=100, is_busy=lambda: next(busy)
+    )
+
+    # Act
+    purged = await usecase.execute()
+
+    # Assert
+    assert purged == 100
+    mock_uow.auth_sessions.delete_expired.assert_awaited_once_with(100)
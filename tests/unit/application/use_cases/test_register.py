@@ -8,7 +8,7 @@ from app.domain.exceptions import ValidationException
 
 
 @pytest.mark.asyncio(loop_scope="function")
-async def test_register_success(mock_uow, mock_user):
+async def test_register_success(mock_uow, count_round_trips):
     """Тест успешной регистрации пользователя."""
     # Arrange
     user_data = User(
@@ -18,11 +18,8 @@ async def test_register_success(mock_uow, mock_user):
         is_verified=False,
     )
 
-    # Пользователь не существует
-    mock_uow.users.find_by_email.return_value = None
-
-    # Успешное создание пользователя
-    mock_uow.users.create_user.return_value = mock_user
+    # Email свободен - пользователь создан
+    mock_uow.users.create_if_not_exists.return_value = user_data.email
 
     usecase = RegisterUserUseCase(mock_uow)
 
@@ -30,15 +27,13 @@ async def test_register_success(mock_uow, mock_user):
     result = await usecase.execute(user_data)
 
     # Assert
-    assert isinstance(result, User)
-    assert result.email == mock_user.email
-
-    mock_uow.users.find_by_email.assert_called_once_with(user_data.email)
-    mock_uow.users.create_user.assert_called_once()
+    assert result == user_data.email
+    mock_uow.users.create_if_not_exists.assert_called_once_with(user=user_data)
+    assert count_round_trips(mock_uow) == 1
 
 
 @pytest.mark.asyncio(loop_scope="function")
-async def test_register_existing_email(mock_uow, mock_user_entity):
+async def test_register_existing_email(mock_uow, count_round_trips):
     """Тест регистрации с уже существующим email."""
     # Arrange
     existing_email = "existing@example.com"
@@ -49,8 +44,8 @@ async def test_register_existing_email(mock_uow, mock_user_entity):
         is_verified=False,
     )
 
-    # Пользователь уже существует
-    mock_uow.users.find_by_email.return_value = mock_user_entity
+    # Пользователь уже существует - INSERT ничего не вставил
+    mock_uow.users.create_if_not_exists.return_value = None
 
     usecase = RegisterUserUseCase(mock_uow)
 
@@ -61,5 +56,5 @@ async def test_register_existing_email(mock_uow, mock_user_entity):
     assert f"Пользователь с email {existing_email} уже существует" in str(
         exc_info.value
     )
-    mock_uow.users.find_by_email.assert_called_once_with(existing_email)
-    mock_uow.users.create_user.assert_not_called()
+    assert count_round_trips(mock_uow) == 1
+    mock_uow.commit.assert_not_called()
@@ -0,0 +1,90 @@
+"""Тесты для параметров запуска HTTP-сервера."""
+
+import os
+
+import pytest
+
+from app.infrastructure.config import server
+from app.infrastructure.config.server import (
+    available_cpus,
+    resolve_http,
+    resolve_loop,
+    uvicorn_options,
+    worker_environment,
+)
+from app.infrastructure.config.settings import Settings
+
+
+@pytest.mark.parametrize(
+    ("cpu_max", "expected"),
+    [("max 100000", 8), ("250000 100000", 3), ("50000 100000", 1), (None, 8)],
+)
+def test_available_cpus_respects_cgroup_quota(tmp_path, monkeypatch, cpu_max, expected):
+    """Тест учета квоты CPU из cgroup v2."""
+    # Arrange
+    monkeypatch.setattr(os, "process_cpu_count", lambda: 8)
+    path = tmp_path / "cpu.max"
+    if cpu_max is not None:
+        path.write_text(f"{cpu_max}\n")
+
+    # Act
+    cpus = available_cpus(path)
+
+    # Assert
+    assert cpus == expected
+
+
+def test_auto_selects_installed_implementations(monkeypatch):
+    """Тест выбора uvloop и httptools, только если они установлены."""
+    # Arrange
+    installed = {"h11", "httptools"}
+    monkeypatch.setattr(
+        server, "find_spec", lambda name: object() if name in installed else None
+    )
+
+    # Act & Assert
+    assert resolve_loop("auto") == "asyncio"
+    assert resolve_http("auto") == "httptools"
+    assert resolve_loop("asyncio") == "asyncio"
+    with pytest.raises(RuntimeError, match="uvloop"):
+        resolve_loop("uvloop")
+
+
+def test_hasher_workers_are_split_between_server_workers(monkeypatch):
+    """Тест деления CPU пула хэширования между воркерами сервера."""
+    # Arrange
+    monkeypatch.setattr(server, "available_cpus", lambda: 8)
+    settings = Settings(ALGORITHM="HS256", PASSWORD_HASHER_WORKERS=None)
+
+    # Act & Assert
+    assert worker_environment(settings, 4) == {"PASSWORD_HASHER_WORKERS": "2"}
+    assert worker_environment(settings, 16) == {"PASSWORD_HASHER_WORKERS": "1"}
+    assert worker_environment(settings, 1) == {}
+    explicit = settings.model_copy(update={"PASSWORD_HASHER_WORKERS": 3})
+    assert worker_environment(explicit, 4) == {}
+
+
+def test_uvicorn_options_map_settings():
+    """Тест передачи настроек SERVER_* в uvicorn."""
+    # Arrange
+    settings = Settings(
+        ALGORITHM="HS256",
+        SERVER_LOOP="asyncio",
+        SERVER_HTTP="h11",
+        SERVER_KEEP_ALIVE_SECONDS=75,
+        SERVER_BACKLOG=4096,
+        SERVER_MAX_REQUESTS=10_000,
+        SERVER_MAX_REQUESTS_JITTER=500,
+    )
+
+    # Act
+    options = uvicorn_options(settings, workers=4)
+
+    # Assert
+    assert options["workers"] == 4
+    assert options["loop"] == "asyncio"
+    assert options["http"] == "h11"
+    assert options["timeout_keep_alive"] == 75
+    assert options["backlog"] == 4096
+    assert options["limit_max_requests"] == 10_000
+    assert options["limit_max_requests_jitter"] == 500
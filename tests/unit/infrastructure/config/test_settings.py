@@ -0,0 +1,109 @@
+"""Тесты для общего снимка настроек и его перечитывания."""
+
+import pytest
+from pydantic import ValidationError
+
+from app.infrastructure.config import settings as settings_module
+from app.infrastructure.config.settings import (
+    Settings,
+    get_settings,
+    on_settings_reload,
+    reload_settings,
+)
+
+
+@pytest.fixture(autouse=True)
+def fresh_snapshot(monkeypatch):
+    """Изолирует снимок настроек и подписчиков перечитывания."""
+    monkeypatch.setenv("ALGORITHM", "HS256")
+    monkeypatch.setattr(settings_module, "_snapshot", None)
+    monkeypatch.setattr(settings_module, "_reload_listeners", [])
+
+
+def test_settings_are_parsed_once_and_frozen():
+    """Тест того, что все вызовы получают один неизменяемый снимок."""
+    # Act
+    settings = get_settings()
+
+    # Assert
+    assert get_settings() is settings
+    with pytest.raises(ValidationError):
+        settings.DEBUG = False
+
+
+def test_reload_applies_only_reloadable_fields(monkeypatch):
+    """Тест применения изменяемых на лету полей и отчета об остальных."""
+    # Arrange
+    before = get_settings()
+    received = []
+    on_settings_reload(received.append)
+    monkeypatch.setenv("RATE_LIMIT_ENABLED", "false")
+    monkeypatch.setenv("DB_POOL_SIZE", str(before.DB_POOL_SIZE + 1))
+
+    # Act
+    result = reload_settings()
+
+    # Assert
+    after = get_settings()
+    assert result.applied == ["RATE_LIMIT_ENABLED"]
+    assert result.restart_required == ["DB_POOL_SIZE"]
+    assert after is not before
+    assert after.RATE_LIMIT_ENABLED is False
+    assert after.DB_POOL_SIZE == before.DB_POOL_SIZE
+    assert received == [after]
+
+
+def test_reload_without_changes_keeps_snapshot():
+    """Тест того, что без изменений снимок и подписчики не трогаются."""
+    # Arrange
+    before = get_settings()
+    received = []
+    on_settings_reload(received.append)
+
+    # Act
+    result = reload_settings()
+
+    # Assert
+    assert result.applied == [] and result.restart_required == []
+    assert get_settings() is before
+    assert received == []
+
+
+def test_invalid_reload_keeps_previous_snapshot(monkeypatch):
+    """Тест сохранения прежнего снимка при ошибке валидации."""
+    # Arrange
+    before = get_settings()
+    monkeypatch.setenv("SERVER_LOOP", "tokio")
+
+    # Act & Assert
+    with pytest.raises(ValidationError):
+        reload_settings()
+    assert get_settings() is before
+
+
+def test_unsubscribed_listener_is_not_called(monkeypatch):
+    """Тест того, что отписанный подписчик не получает новые снимки."""
+    # Arrange
+    get_settings()
+    received = []
+    unsubscribe = on_settings_reload(received.append)
+    unsubscribe()
+    monkeypatch.setenv("RATE_LIMIT_ENABLED", "false")
+
+    # Act
+    reload_settings()
+    unsubscribe()
+
+    # Assert
+    assert received == []
+    assert settings_module._reload_listeners == []
+
+
+def test_password_hash_rounds_below_existing_hashes_are_rejected():
+    """Тест запрета стоимости bcrypt ниже стоимости существующих хэшей."""
+    # Act & Assert
+    with pytest.raises(ValidationError):
+        Settings(PASSWORD_HASH_MIN_ROUNDS=10)
+    with pytest.raises(ValidationError):
+        Settings(PASSWORD_HASH_ROUNDS=11)
+    assert Settings(PASSWORD_HASH_ROUNDS=13).PASSWORD_HASH_ROUNDS == 13
@@ -0,0 +1,256 @@
+"""Тесты для кэширующего репозитория пользователей."""
+
+import asyncio
+from unittest.mock import AsyncMock, MagicMock
+
+import pytest
+
+from app.domain.entities.user import User
+from app.domain.interfaces.user_repo import IUserRepository
+from app.infrastructure.database.repositories.cached_user_repo import (
+    CachedUserRepository,
+    UserCache,
+)
+
+
+class FakeClock:
+    """Управляемые часы для тестов."""
+
+    def __init__(self, now: float = 1000.0):
+        self.now = now
+
+    def __call__(self) -> float:
+        return self.now
+
+
+@pytest.fixture
+def user() -> User:
+    """Пользователь для тестов."""
+    return User(email="test@example.com", hashed_password="hash")
+
+
+@pytest.fixture
+def inner(user) -> MagicMock:
+    """Мок репозитория, которому делегирует кэш."""
+    repository = MagicMock(spec=IUserRepository)
+    repository.find_by_email = AsyncMock(return_value=user)
+    repository.create_user = AsyncMock(return_value=user.email)
+    repository.update_password = AsyncMock()
+    return repository
+
+
+@pytest.mark.asyncio
+async def test_find_by_email_hits_cache_until_ttl(inner, user):
+    """Тест чтения из кэша до истечения TTL."""
+    # Arrange
+    clock = FakeClock()
+    cache = UserCache(ttl=30, clock=clock)
+    repository = CachedUserRepository(inner, cache)
+
+    # Act
+    first = await repository.find_by_email(user.email)
+    second = await repository.find_by_email(user.email)
+    clock.now += 30
+    third = await repository.find_by_email(user.email)
+
+    # Assert
+    assert first == second == third == user
+    assert inner.find_by_email.await_count == 2
+    assert cache.stats()["hit_ratio"] == pytest.approx(1 / 3)
+
+
+@pytest.mark.asyncio
+async def test_missing_user_is_not_cached(inner):
+    """Тест того, что отсутствие пользователя не кэшируется."""
+    # Arrange
+    inner.find_by_email.return_value = None
+    repository = CachedUserRepository(inner, UserCache())
+
+    # Act
+    await repository.find_by_email("missing@example.com")
+    await repository.find_by_email("missing@example.com")
+
+    # Assert
+    assert inner.find_by_email.await_count == 2
+
+
+@pytest.mark.asyncio
+async def test_cache_evicts_least_recently_used(inner):
+    """Тест вытеснения давно не использованных записей."""
+    # Arrange
+    inner.find_by_email.side_effect = lambda email: User(email, "hash")
+    cache = UserCache(max_size=2)
+    repository = CachedUserRepository(inner, cache)
+
+    # Act
+    await repository.find_by_email("a@example.com")
+    await repository.find_by_email("b@example.com")
+    await repository.find_by_email("a@example.com")
+    await repository.find_by_email("c@example.com")
+
+    # Assert
+    assert len(cache) == 2
+    assert cache.get("a@example.com") is not None
+    assert cache.get("b@example.com") is None
+
+
+@pytest.mark.asyncio
+async def test_concurrent_misses_share_one_query(inner, user):
+    """Тест объединения одновременных промахов в один запрос."""
+    # Arrange
+    release = asyncio.Event()
+
+    async def slow_find(email):
+        await release.wait()
+        return user
+
+    inner.find_by_email.side_effect = slow_find
+    repository = CachedUserRepository(inner, UserCache())
+
+    # Act
+    tasks = [
+        asyncio.create_task(repository.find_by_email(user.email)) for _ in range(5)
+    ]
+    await asyncio.sleep(0)
+    release.set()
+    results = await asyncio.gather(*tasks)
+
+    # Assert
+    assert results == [user] * 5
+    inner.find_by_email.assert_awaited_once()
+
+
+@pytest.mark.asyncio
+async def test_waiters_query_themselves_when_leader_fails(inner, user):
+    """Тест повторного запроса ожидающими, если ведущий запрос упал."""
+    # Arrange
+    release = asyncio.Event()
+    calls = 0
+
+    async def flaky_find(email):
+        nonlocal calls
+        calls += 1
+        if calls == 1:
+            await release.wait()
+            raise ConnectionError("connection lost")
+        return user
+
+    inner.find_by_email.side_effect = flaky_find
+    repository = CachedUserRepository(inner, UserCache())
+
+    # Act
+    leader = asyncio.create_task(repository.find_by_email(user.email))
+    follower = asyncio.create_task(repository.find_by_email(user.email))
+    await asyncio.sleep(0)
+    release.set()
+
+    # Assert
+    with pytest.raises(ConnectionError):
+        await leader
+    assert await follower == user
+
+
+@pytest.mark.asyncio
+async def test_writes_invalidate_cached_user(inner, user):
+    """Тест сброса записи кэша при создании и изменении пользователя."""
+    # Arrange
+    cache = UserCache()
+    repository = CachedUserRepository(inner, cache)
+    await repository.find_by_email(user.email)
+
+    # Act
+    await repository.update_password(user.email, "new-hash")
+    after_update = cache.get(user.email)
+    await repository.find_by_email(user.email)
+    await repository.create_user(user)
+
+    # Assert
+    assert after_update is None
+    assert cache.get(user.email) is None
+    inner.update_password.assert_awaited_once_with(user.email, "new-hash")
+
+
+@pytest.mark.asyncio
+async def test_use_cache_false_bypasses_cache(inner, user):
+    """Тест чтения в обход кэша."""
+    # Arrange
+    repository = CachedUserRepository(inner, UserCache())
+    await repository.find_by_email(user.email)
+
+    # Act
+    result = await repository.find_by_email(user.email, use_cache=False)
+
+    # Assert
+    assert result == user
+    assert inner.find_by_email.await_count == 2
+    inner.find_by_email.assert_awaited_with(user.email, use_cache=False)
+
+
+@pytest.mark.asyncio
+async def test_writes_invalidate_again_at_transaction_end(inner, user):
+    """Тест сброса записи, закэшированной конкурентным чтением до commit."""
+    # Arrange
+    cache = UserCache()
+    hooks = []
+    repository = CachedUserRepository(inner, cache, after_transaction=hooks.append)
+    await repository.update_password(user.email, "new-hash")
+    # Конкурентный запрос читает прежнюю зафиксированную строку
+    await CachedUserRepository(inner, cache).find_by_email(user.email)
+
+    # Act
+    stale = cache.get(user.email)
+    for hook in hooks:
+        hook()
+
+    # Assert
+    assert stale == user
+    assert cache.get(user.email) is None
+
+
+@pytest.mark.asyncio
+async def test_load_started_before_invalidation_is_not_cached(inner, user):
+    """Тест того, что загрузка, начатая до сброса, не попадает в кэш."""
+    # Arrange
+    release = asyncio.Event()
+
+    async def slow_find(email):
+        await release.wait()
+        return user
+
+    inner.find_by_email.side_effect = slow_find
+    cache = UserCache()
+    repository = CachedUserRepository(inner, cache)
+
+    # Act
+    reader = asyncio.create_task(repository.find_by_email(user.email))
+    await asyncio.sleep(0)
+    cache.invalidate(user.email)
+    release.set()
+
+    # Assert
+    assert await reader == user
+    assert len(cache) == 0
+
+
+@pytest.mark.asyncio
+async def test_uncommitted_write_is_not_cached(inner, user):
+    """Тест чтения после записи в обход общего кэша до конца транзакции."""
+    # Arrange
+    cache = UserCache()
+    hooks = []
+    repository = CachedUserRepository(inner, cache, after_transaction=hooks.append)
+    await repository.update_password(user.email, "new-hash")
+
+    # Act
+    first = await repository.find_by_email(user.email)
+    second = await repository.find_by_email(user.email)
+    cached_in_transaction = len(cache)
+    for hook in hooks:
+        hook()
+    await repository.find_by_email(user.email)
+
+    # Assert
+    assert first == second == user
+    assert cached_in_transaction == 0
+    assert len(hooks) == 1
+    assert cache.get(user.email) == user
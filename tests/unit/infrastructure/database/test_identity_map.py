@@ -0,0 +1,184 @@
+"""Тесты identity map и повторного использования репозиториев в UOW."""
+
+from datetime import UTC, datetime
+from unittest.mock import AsyncMock, MagicMock
+from uuid import UUID
+
+import pytest
+
+from app.infrastructure.database.repositories.cached_user_repo import UserCache
+from app.infrastructure.database.uow import UOW
+from app.infrastructure.monitoring.metrics import metrics
+
+EMAIL = "a@example.com"
+USER_ROW = (EMAIL, "hash", True, False, datetime.now(UTC), None)
+REFRESH_TOKEN = UUID("11111111-1111-1111-1111-111111111111")
+
+
+@pytest.fixture(autouse=True)
+def reset_metrics():
+    """Сбрасывает метрики между тестами."""
+    metrics.reset()
+    yield
+    metrics.reset()
+
+
+def make_uow(row=USER_ROW, user_cache: UserCache | None = None) -> UOW:
+    """UOW с мок-сессией, на любой запрос возвращающей одну строку."""
+    result = MagicMock()
+    result.one_or_none.return_value = row
+    session = MagicMock()
+    session.execute = AsyncMock(return_value=result)
+    session.commit = AsyncMock()
+    session.close = AsyncMock()
+    return UOW(session, user_cache=user_cache)
+
+
+def test_repositories_are_created_once():
+    """Тест создания репозиториев один раз на UOW."""
+    # Arrange
+    uow = make_uow()
+
+    # Act & Assert
+    assert uow.users is uow.users
+    assert uow.auth_sessions is uow.auth_sessions
+
+
+@pytest.mark.asyncio
+async def test_repeated_lookup_is_served_from_identity_map():
+    """Тест повторного поиска пользователя без запроса к базе."""
+    # Arrange
+    uow = make_uow()
+
+    # Act
+    first = await uow.users.find_by_email(EMAIL)
+    second = await uow.users.find_by_email(EMAIL)
+
+    # Assert
+    assert second is first
+    assert uow.session.execute.await_count == 1
+    assert metrics.get("uow_identity_map_hits", entity="User") == 1
+
+
+@pytest.mark.asyncio
+async def test_use_cache_false_bypasses_identity_map():
+    """Тест чтения в обход identity map и общего кэша пользователей."""
+    # Arrange
+    cache = UserCache()
+    uow = make_uow(user_cache=cache)
+    shared = await uow.users.find_by_email(EMAIL)
+
+    # Act
+    private = await uow.users.find_by_email(EMAIL, use_cache=False)
+
+    # Assert
+    assert cache.get(EMAIL) is shared
+    assert private is not shared
+    assert private == shared
+    assert uow.session.execute.await_count == 2
+
+
+@pytest.mark.asyncio
+async def test_missing_entity_is_remembered():
+    """Тест запоминания отсутствия сессии."""
+    # Arrange
+    uow = make_uow(row=None)
+
+    # Act
+    await uow.auth_sessions.find_by_refresh_token(REFRESH_TOKEN)
+    found = await uow.auth_sessions.find_by_refresh_token(REFRESH_TOKEN)
+
+    # Assert
+    assert found is None
+    assert uow.session.execute.await_count == 1
+
+
+@pytest.mark.asyncio
+async def test_write_invalidates_identity_map():
+    """Тест сброса identity map после записи."""
+    # Arrange
+    uow = make_uow()
+    await uow.users.find_by_email(EMAIL)
+
+    # Act
+    await uow.users.update_password(EMAIL, "new-hash")
+    await uow.users.find_by_email(EMAIL)
+
+    # Assert
+    assert uow.session.execute.await_count == 3
+
+
+@pytest.mark.asyncio
+async def test_auth_session_writes_invalidate_all_sessions():
+    """Тест сброса всех сессий при записи без refresh token."""
+    # Arrange
+    uow = make_uow(row=None)
+    await uow.auth_sessions.find_by_refresh_token(REFRESH_TOKEN)
+
+    # Act
+    await uow.auth_sessions.delete_expired(100)
+    await uow.auth_sessions.find_by_refresh_token(REFRESH_TOKEN)
+
+    # Assert
+    assert uow.session.execute.await_count == 3
+
+
+@pytest.mark.asyncio
+async def test_saved_queries_are_observed_per_uow():
+    """Тест учета сэкономленных запросов при завершении UOW."""
+    # Arrange
+    uow = make_uow()
+
+    # Act
+    async with uow:
+        for _ in range(3):
+            await uow.users.find_by_email(EMAIL)
+    async with make_uow():
+        pass
+
+    # Assert
+    summary = metrics.snapshot()["summaries"]["uow_queries_saved"]
+    assert summary["count"] == 1
+    assert summary["sum"] == 2
+    assert len(uow.identity_map) == 0
+
+
+@pytest.mark.asyncio
+async def test_after_transaction_callbacks_run_once_on_commit_and_rollback():
+    """Тест вызова отложенных функций после commit и после отката."""
+    # Arrange
+    uow = make_uow()
+    uow.session.rollback = AsyncMock()
+    committed, rolled_back = MagicMock(), MagicMock()
+
+    # Act
+    uow.after_transaction(rolled_back)
+    await uow.rollback()
+    uow.after_transaction(committed)
+    await uow.commit()
+    await uow.commit()
+    await uow.rollback()
+
+    # Assert
+    committed.assert_called_once()
+    rolled_back.assert_called_once()
+
+
+@pytest.mark.asyncio
+async def test_rollback_after_write_and_read_leaves_cache_empty():
+    """Тест отката записи, прочитанной в том же UOW: в кэше ее нет."""
+    # Arrange
+    cache = UserCache()
+    uow = make_uow(user_cache=cache)
+    uow.session.rollback = AsyncMock()
+
+    # Act
+    await uow.users.update_password(EMAIL, "new-hash")
+    user = await uow.users.find_by_email(EMAIL)
+    cached_before_rollback = len(cache)
+    await uow.rollback()
+
+    # Assert
+    assert user.email == EMAIL
+    assert cached_before_rollback == 0
+    assert len(cache) == 0
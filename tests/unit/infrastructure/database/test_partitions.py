@@ -0,0 +1,207 @@
+"""Тесты для планирования и обслуживания секций auth_sessions."""
+
+from datetime import UTC, date, datetime
+from unittest.mock import AsyncMock, MagicMock
+
+import pytest
+from sqlalchemy.exc import DBAPIError
+
+from app.infrastructure.database.partitions import (
+    AuthSessionPartitionManager,
+    Partition,
+    plan_partitions,
+)
+from app.infrastructure.monitoring.metrics import metrics
+
+EXPIRED = "auth_sessions_p20261008_20261015"
+# Секции, при которых остается только удалить EXPIRED
+EXISTING = ["auth_sessions_default", EXPIRED, "auth_sessions_p20261015_20261022"]
+
+
+@pytest.fixture(autouse=True)
+def reset_metrics():
+    """Сбрасывает метрики между тестами."""
+    metrics.reset()
+    yield
+    metrics.reset()
+
+
+def make_engine(existing: list[str], attached=True, error=None) -> MagicMock:
+    """Движок с секционированной auth_sessions и секциями existing.
+
+    attached - ответ проверки под блокировкой, error - ошибка DDL.
+    """
+    ddl = []
+    inspect_conn = MagicMock()
+    inspect_conn.scalar = AsyncMock(return_value=True)
+    inspect_conn.scalars = AsyncMock(return_value=MagicMock(all=lambda: existing))
+
+    async def execute(statement, params=None):
+        sql = str(statement)
+        if error is not None and sql.startswith(("ALTER", "CREATE", "DROP")):
+            raise error
+        ddl.append(sql)
+
+    ddl_conn = MagicMock()
+    ddl_conn.execute = AsyncMock(side_effect=execute)
+    ddl_conn.scalar = AsyncMock(return_value=attached)
+
+    engine = MagicMock()
+    engine.ddl = ddl
+    for method, conn in (("connect", inspect_conn), ("begin", ddl_conn)):
+        context = getattr(engine, method).return_value
+        context.__aenter__ = AsyncMock(return_value=conn)
+        context.__aexit__ = AsyncMock(return_value=False)
+    return engine
+
+
+def make_manager(engine) -> AuthSessionPartitionManager:
+    """Менеджер, которому нужно только удалить секцию EXPIRED."""
+    return AuthSessionPartitionManager(
+        engine,
+        interval_days=7,
+        premake_days=1,
+        clock=lambda: datetime(2026, 10, 18, tzinfo=UTC),
+    )
+
+
+def sqlstate_error(sqlstate: str) -> DBAPIError:
+    """Ошибка драйвера с заданным SQLSTATE."""
+    return DBAPIError("DDL", {}, MagicMock(sqlstate=sqlstate))
+
+
+def test_partition_name_round_trip():
+    """Тест восстановления диапазона секции по имени."""
+    # Arrange
+    partition = Partition(date(2026, 10, 15), date(2026, 10, 22))
+
+    # Act
+    parsed = Partition.parse(partition.name)
+
+    # Assert
+    assert partition.name == "auth_sessions_p20261015_20261022"
+    assert parsed == partition
+    assert Partition.parse("auth_sessions_default") is None
+
+
+def test_plan_creates_aligned_partitions_ahead():
+    """Тест создания выровненных секций на premake_days вперед."""
+    # Act
+    to_create, to_drop = plan_partitions(
+        [], date(2026, 10, 18), interval_days=7, premake_days=14
+    )
+
+    # Assert
+    assert [p.name for p in to_create] == [
+        "auth_sessions_p20261015_20261022",
+        "auth_sessions_p20261022_20261029",
+        "auth_sessions_p20261029_20261105",
+    ]
+    assert to_drop == []
+
+
+def test_plan_skips_existing_and_drops_expired():
+    """Тест пропуска существующих секций и удаления истекших."""
+    # Arrange
+    existing = [
+        "auth_sessions_default",
+        "auth_sessions_p20261008_20261015",
+        "auth_sessions_p20261015_20261022",
+        "auth_sessions_p20261022_20261029",
+        "unrelated_table",
+    ]
+
+    # Act
+    to_create, to_drop = plan_partitions(
+        existing, date(2026, 10, 18), interval_days=7, premake_days=14
+    )
+
+    # Assert
+    assert [p.name for p in to_create] == ["auth_sessions_p20261029_20261105"]
+    assert [p.name for p in to_drop] == ["auth_sessions_p20261008_20261015"]
+
+
+def test_plan_keeps_partition_ending_after_today():
+    """Тест того, что секция с еще не истекшими сессиями не удаляется."""
+    # Act
+    _, to_drop = plan_partitions(
+        ["auth_sessions_p20261015_20261022"],
+        date(2026, 10, 21),
+        interval_days=7,
+        premake_days=7,
+    )
+
+    # Assert
+    assert to_drop == []
+
+
+@pytest.mark.asyncio
+async def test_maintain_takes_lock_before_ddl():
+    """Тест выполнения DDL после advisory-блокировки и проверки состояния."""
+    # Arrange
+    engine = make_engine(EXISTING)
+
+    # Act
+    created, dropped = await make_manager(engine).maintain()
+
+    # Assert
+    assert (created, dropped) == ([], [EXPIRED])
+    assert engine.ddl[0].startswith("SET LOCAL lock_timeout")
+    assert "pg_advisory_xact_lock" in engine.ddl[1]
+    assert engine.ddl[2:] == [
+        f"ALTER TABLE auth_sessions DETACH PARTITION {EXPIRED}",
+        f"DROP TABLE {EXPIRED}",
+    ]
+
+
+@pytest.mark.asyncio
+async def test_maintain_skips_partition_handled_by_other_worker():
+    """Тест пропуска секции, которую уже отсоединил другой воркер."""
+    # Arrange
+    engine = make_engine(EXISTING, attached=False)
+
+    # Act
+    _, dropped = await make_manager(engine).maintain()
+
+    # Assert
+    assert dropped == []
+    assert not any(sql.startswith("ALTER") for sql in engine.ddl)
+
+
+@pytest.mark.asyncio
+@pytest.mark.parametrize("sqlstate", ["42P01", "42P07", "23505"])
+async def test_maintain_treats_race_errors_as_done(sqlstate):
+    """Тест того, что ошибки гонки с другим воркером не прерывают обслуживание."""
+    # Arrange
+    engine = make_engine(EXISTING, error=sqlstate_error(sqlstate))
+
+    # Act
+    _, dropped = await make_manager(engine).maintain()
+
+    # Assert
+    assert dropped == []
+
+
+@pytest.mark.asyncio
+async def test_maintain_postpones_ddl_on_lock_timeout():
+    """Тест откладывания операции, если auth_sessions занята."""
+    # Arrange
+    engine = make_engine(EXISTING, error=sqlstate_error("55P03"))
+
+    # Act
+    _, dropped = await make_manager(engine).maintain()
+
+    # Assert
+    assert dropped == []
+    assert metrics.get("auth_sessions_partition_lock_timeouts") == 1
+
+
+@pytest.mark.asyncio
+async def test_maintain_raises_unexpected_errors():
+    """Тест проброса остальных ошибок базы данных."""
+    # Arrange
+    engine = make_engine(EXISTING, error=sqlstate_error("42501"))
+
+    # Act & Assert
+    with pytest.raises(DBAPIError):
+        await make_manager(engine).maintain()
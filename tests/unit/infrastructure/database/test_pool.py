@@ -0,0 +1,185 @@
+"""Тесты для инструментированного пула соединений."""
+
+from types import SimpleNamespace
+from unittest.mock import MagicMock
+
+import pytest
+from sqlalchemy import bindparam, create_engine, exc, literal_column, select
+from sqlalchemy.ext.asyncio import create_async_engine
+from sqlalchemy.pool import NullPool
+from sqlalchemy.util import greenlet_spawn
+
+from app.infrastructure.config.settings import Settings
+from app.infrastructure.database.pool import (
+    SESSION_STATE_STATEMENT,
+    InstrumentedAsyncQueuePool,
+    get_engine_options,
+    get_statement_cache_stats,
+    prewarm_pool,
+    track_connection_hold,
+    track_statement_cache,
+)
+from app.infrastructure.monitoring.metrics import metrics
+from app.infrastructure.monitoring.request_context import (
+    bind_request_scope,
+    unbind_request_scope,
+)
+
+
+@pytest.fixture(autouse=True)
+def reset_metrics():
+    """Сбрасывает метрики между тестами."""
+    metrics.reset()
+    yield
+    metrics.reset()
+
+
+def test_pool_observes_checkout_wait():
+    """Тест замера времени ожидания соединения."""
+    # Arrange
+    pool = InstrumentedAsyncQueuePool(MagicMock, pool_size=1, max_overflow=0)
+
+    # Act
+    connection = pool.connect()
+    connection.close()
+
+    # Assert
+    summary = metrics.snapshot()["summaries"]["db_pool_wait_seconds"]
+    assert summary["count"] == 1
+    assert metrics.get("db_pool_timeouts") == 0
+
+
+@pytest.mark.asyncio
+async def test_pool_counts_timeouts():
+    """Тест учета таймаутов при исчерпании пула."""
+    # Arrange
+    pool = InstrumentedAsyncQueuePool(
+        MagicMock, pool_size=1, max_overflow=0, timeout=0.01
+    )
+    held = pool.connect()
+
+    # Act & Assert
+    with pytest.raises(exc.TimeoutError):
+        await greenlet_spawn(pool.connect)
+    assert metrics.get("db_pool_timeouts") == 1
+    assert metrics.snapshot()["summaries"]["db_pool_wait_seconds"]["count"] == 2
+
+    held.close()
+
+
+@pytest.mark.asyncio
+async def test_pool_observes_connection_hold_per_route():
+    """Тест замера времени удержания соединения с меткой маршрута."""
+    # Arrange
+    pool = InstrumentedAsyncQueuePool(MagicMock, pool_size=1, max_overflow=0)
+    track_connection_hold(pool)
+    route = SimpleNamespace(path="/api/private/users/me")
+
+    # Act
+    token = bind_request_scope({"type": "http", "route": route})
+    try:
+        await greenlet_spawn(lambda: pool.connect().close())
+    finally:
+        unbind_request_scope(token)
+    await greenlet_spawn(lambda: pool.connect().close())
+
+    # Assert
+    summaries = metrics.snapshot()["summaries"]
+    hold = "db_connection_hold_seconds"
+    assert summaries[f"{hold}{{route=/api/private/users/me}}"]["count"] == 1
+    assert summaries[f"{hold}{{route=-}}"]["count"] == 1
+
+
+def test_engine_options_direct_mode():
+    """Тест параметров движка при прямом подключении к PostgreSQL."""
+    # Arrange
+    settings = Settings(ALGORITHM="HS256", DB_POOL_SIZE=20)
+
+    # Act
+    options = get_engine_options(settings)
+
+    # Assert
+    assert options["poolclass"] is InstrumentedAsyncQueuePool
+    assert options["pool_size"] == 20
+    assert options["connect_args"]["statement_cache_size"] == 100
+    assert options["connect_args"]["server_settings"]["jit"] == "off"
+
+
+@pytest.mark.parametrize(
+    ("pool_size", "poolclass"), [(0, NullPool), (2, InstrumentedAsyncQueuePool)]
+)
+def test_engine_options_pgbouncer_mode(pool_size, poolclass):
+    """Тест параметров движка за PgBouncer в режиме transaction pooling."""
+    # Arrange
+    settings = Settings(
+        ALGORITHM="HS256", DB_PGBOUNCER_MODE=True, DB_PGBOUNCER_POOL_SIZE=pool_size
+    )
+
+    # Act
+    options = get_engine_options(settings)
+    connect_args = options["connect_args"]
+    name_func = connect_args["prepared_statement_name_func"]
+
+    # Assert
+    assert options["poolclass"] is poolclass
+    assert connect_args["statement_cache_size"] == 0
+    assert connect_args["prepared_statement_cache_size"] == 0
+    assert connect_args["server_settings"] == {
+        "application_name": settings.DB_APPLICATION_NAME
+    }
+    assert name_func() != name_func()
+
+
+@pytest.mark.parametrize(
+    ("statement", "is_session_state"),
+    [
+        ("SET search_path TO app", True),
+        ("set session statement_timeout = 100", True),
+        ("LISTEN events", True),
+        ("CREATE TEMP TABLE staging (id int)", True),
+        ("CREATE TEMP TABLE staging (id int) ON COMMIT DROP", False),
+        ("SELECT pg_advisory_lock(1)", True),
+        ("SET LOCAL statement_timeout = 100", False),
+        ("SET TRANSACTION ISOLATION LEVEL SERIALIZABLE", False),
+        ("SELECT pg_advisory_xact_lock(1)", False),
+        ("UPDATE users SET is_active = false WHERE email = $1", False),
+    ],
+)
+def test_session_state_statement_detection(statement, is_session_state):
+    """Тест распознавания запросов, зависящих от состояния сессии."""
+    assert bool(SESSION_STATE_STATEMENT.search(statement)) is is_session_state
+
+
+def test_statement_cache_hits_are_counted():
+    """Тест учета попаданий в кэш скомпилированных запросов."""
+    # Arrange
+    engine = SimpleNamespace(sync_engine=create_engine("sqlite://"))
+    track_statement_cache(engine)
+    statement = select(literal_column("1")).where(bindparam("value") > 0)
+
+    # Act
+    with engine.sync_engine.connect() as conn:
+        for value in (1, 2, 3):
+            conn.execute(statement, {"value": value})
+        conn.exec_driver_sql("SELECT 1")
+
+    # Assert
+    assert metrics.get("db_statement_cache", result="miss") == 1
+    assert metrics.get("db_statement_cache", result="hit") == 2
+    assert metrics.get("db_statement_cache", result="no_key") == 1
+    assert get_statement_cache_stats(engine) == {"size": 1, "capacity": 500}
+
+
+@pytest.mark.asyncio
+async def test_prewarm_pool_skips_null_pool():
+    """Тест того, что без постоянных соединений пул не прогревается."""
+    # Arrange
+    engine = create_async_engine(
+        "postgresql+asyncpg://localhost/db", poolclass=NullPool
+    )
+
+    # Act
+    opened = await prewarm_pool(engine)
+
+    # Assert
+    assert opened == 0
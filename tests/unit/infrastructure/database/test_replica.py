@@ -0,0 +1,165 @@
+"""Тесты для маршрутизации чтения на реплику."""
+
+from unittest.mock import AsyncMock, MagicMock
+
+import pytest
+
+from app.domain.exceptions import ServiceUnavailableException
+from app.infrastructure.database.replica import (
+    PRIMARY_PINNED,
+    PrimarySession,
+    ReplicaRouter,
+)
+from app.infrastructure.database.uow import UOW
+from app.infrastructure.monitoring.metrics import metrics
+
+
+class FakeClock:
+    """Управляемые часы для тестов."""
+
+    def __init__(self, now: float = 1000.0):
+        self.now = now
+
+    def __call__(self) -> float:
+        return self.now
+
+
+@pytest.fixture(autouse=True)
+def reset_metrics():
+    """Сбрасывает метрики между тестами."""
+    metrics.reset()
+    yield
+    metrics.reset()
+
+
+def make_router(lag=0.0, **kwargs) -> ReplicaRouter:
+    """Создает маршрутизатор с подмененным замером отставания."""
+    router = ReplicaRouter(MagicMock(), max_lag=5.0, **kwargs)
+    router._measure_lag = AsyncMock(return_value=lag)
+    return router
+
+
+@pytest.mark.asyncio
+async def test_router_returns_replica_session_when_healthy():
+    """Тест выдачи сессии реплики, пока реплика не отстает."""
+    # Arrange
+    router = make_router(lag=0.5)
+
+    # Act
+    session = await router.session()
+
+    # Assert
+    assert session is not None
+    assert metrics.get("db_replica_available") == 1
+    assert metrics.get("db_replica_lag_seconds") == 0.5
+
+
+@pytest.mark.asyncio
+async def test_router_falls_back_to_primary_when_lagging():
+    """Тест перехода на primary при большом отставании реплики."""
+    # Arrange
+    router = make_router(lag=30.0)
+
+    # Act
+    session = await router.session()
+
+    # Assert
+    assert session is None
+    assert metrics.get("db_replica_fallbacks") == 1
+
+
+@pytest.mark.asyncio
+async def test_router_falls_back_to_primary_when_down():
+    """Тест перехода на primary, если реплика не отвечает."""
+    # Arrange
+    router = make_router()
+    router._measure_lag.side_effect = OSError("connection refused")
+
+    # Act
+    session = await router.session()
+
+    # Assert
+    assert session is None
+    assert metrics.get("db_replica_available") == 0
+
+
+@pytest.mark.asyncio
+async def test_router_without_fallback_raises():
+    """Тест ответа 503, если fallback на primary отключен."""
+    # Arrange
+    router = make_router(lag=30.0, fallback=False)
+
+    # Act & Assert
+    with pytest.raises(ServiceUnavailableException):
+        await router.session()
+
+
+@pytest.mark.asyncio
+async def test_router_checks_replica_once_per_interval():
+    """Тест того, что состояние реплики проверяется не чаще интервала."""
+    # Arrange
+    clock = FakeClock()
+    router = make_router(check_interval=5.0, clock=clock)
+
+    # Act
+    await router.session()
+    clock.now += 4
+    await router.session()
+    clock.now += 2
+    await router.session()
+
+    # Assert
+    assert router._measure_lag.await_count == 2
+
+
+@pytest.mark.asyncio
+async def test_uow_reads_from_replica_until_first_write():
+    """Тест read-your-writes: после записи чтение идет на primary."""
+    # Arrange
+    primary = MagicMock(info={})
+    replica_session = MagicMock()
+    replica = MagicMock(spec=ReplicaRouter)
+    replica.session = AsyncMock(return_value=replica_session)
+    uow = UOW(primary, replica)
+
+    # Act
+    before_write = await uow.read_session()
+    primary.info[PRIMARY_PINNED] = True
+    after_write = await uow.read_session()
+
+    # Assert
+    assert before_write is replica_session
+    assert after_write is primary
+    assert metrics.get("db_reads", target="replica") == 1
+    assert metrics.get("db_reads", target="primary") == 1
+
+
+@pytest.mark.asyncio
+async def test_uow_without_replica_reads_from_primary():
+    """Тест чтения с primary, если реплика не настроена."""
+    # Arrange
+    primary = MagicMock(info={})
+    uow = UOW(primary)
+
+    # Act
+    session = await uow.read_session()
+
+    # Assert
+    assert session is primary
+
+
+def test_primary_session_pinned_after_write():
+    """Тест пометки сессии primary после изменяющего запроса."""
+    # Arrange
+    session = PrimarySession()
+    select_state = MagicMock(is_select=True, session=session)
+    write_state = MagicMock(is_select=False, session=session)
+
+    # Act
+    session.dispatch.do_orm_execute(select_state)
+    pinned_after_select = session.info.get(PRIMARY_PINNED, False)
+    session.dispatch.do_orm_execute(write_state)
+
+    # Assert
+    assert pinned_after_select is False
+    assert session.info[PRIMARY_PINNED] is True
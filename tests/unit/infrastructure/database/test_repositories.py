@@ -0,0 +1,190 @@
+"""Тесты однозапросных методов SQL-репозиториев."""
+
+from datetime import UTC, datetime, timedelta
+from unittest.mock import AsyncMock, MagicMock
+from uuid import UUID
+
+import pytest
+from sqlalchemy.dialects import postgresql
+
+from app.domain.entities.auth import AuthSession
+from app.domain.entities.user import User
+from app.infrastructure.database.repositories.auth_session_repo import (
+    AuthSessionRepository,
+)
+from app.infrastructure.database.repositories.user_repo import UserRepository
+
+REFRESH_TOKEN = UUID("11111111-1111-1111-1111-111111111111")
+NEW_REFRESH_TOKEN = UUID("22222222-2222-2222-2222-222222222222")
+
+
+def make_session(result: MagicMock) -> MagicMock:
+    """Мок сессии, возвращающий заданный результат запроса."""
+    session = MagicMock()
+    session.execute = AsyncMock(return_value=result)
+    return session
+
+
+def compiled_sql(session: MagicMock) -> str:
+    """SQL единственного выполненного запроса в диалекте PostgreSQL."""
+    session.execute.assert_awaited_once()
+    statement, _ = session.execute.await_args.args
+    return " ".join(str(statement.compile(dialect=postgresql.dialect())).split())
+
+
+@pytest.mark.asyncio
+async def test_create_if_not_exists_single_statement():
+    """Тест создания пользователя одним INSERT ... ON CONFLICT DO NOTHING."""
+    # Arrange
+    result = MagicMock()
+    result.scalar_one_or_none.return_value = None
+    session = make_session(result)
+    repository = UserRepository(session)
+
+    # Act
+    email = await repository.create_if_not_exists(User("a@example.com", "hash"))
+
+    # Assert
+    assert email is None
+    sql = compiled_sql(session)
+    assert sql.startswith("INSERT INTO users")
+    assert "ON CONFLICT (email) DO NOTHING RETURNING email" in sql
+
+
+@pytest.mark.asyncio
+async def test_find_by_email_maps_row_without_orm():
+    """Тест сборки пользователя из строки Core-запроса по столбцам."""
+    # Arrange
+    row = ("a@example.com", "hash", True, False, datetime.now(UTC), None)
+    result = MagicMock()
+    result.one_or_none.return_value = row
+    session = make_session(result)
+    repository = UserRepository(session)
+
+    # Act
+    user = await repository.find_by_email("a@example.com")
+
+    # Assert
+    assert user == User(*row)
+    sql = compiled_sql(session)
+    assert sql.startswith(
+        "SELECT users.email, users.hashed_password, users.is_active, "
+        "users.is_verified, users.created_at, users.updated_at FROM users"
+    )
+
+
+@pytest.mark.asyncio
+async def test_pop_by_refresh_token_single_statement():
+    """Тест удаления сессии одним DELETE ... RETURNING."""
+    # Arrange
+    row = {
+        "uuid": UUID("00000000-0000-0000-0000-000000000000"),
+        "refresh_token": REFRESH_TOKEN,
+        "expires_at": datetime.now(UTC),
+        "user_email": "a@example.com",
+        "created_at": datetime.now(UTC),
+        "updated_at": None,
+    }
+    result = MagicMock()
+    result.one_or_none.return_value = tuple(row.values())
+    session = make_session(result)
+    repository = AuthSessionRepository(session)
+
+    # Act
+    auth_session = await repository.pop_by_refresh_token(REFRESH_TOKEN)
+
+    # Assert
+    assert auth_session == AuthSession(**row)
+    sql = compiled_sql(session)
+    assert sql.startswith("DELETE FROM auth_sessions WHERE")
+    assert "RETURNING auth_sessions.uuid" in sql
+
+
+@pytest.mark.asyncio
+async def test_rotate_refresh_token_single_statement():
+    """Тест ротации токена одним UPDATE ... FROM users ... RETURNING."""
+    # Arrange
+    row = {
+        "email": "a@example.com",
+        "hashed_password": "hash",
+        "is_active": True,
+        "is_verified": False,
+        "created_at": datetime.now(UTC),
+        "updated_at": None,
+    }
+    result = MagicMock()
+    result.one_or_none.return_value = tuple(row.values())
+    session = make_session(result)
+    repository = AuthSessionRepository(session)
+
+    # Act
+    user = await repository.rotate_refresh_token(
+        REFRESH_TOKEN, NEW_REFRESH_TOKEN, datetime.now(UTC) + timedelta(days=7)
+    )
+
+    # Assert
+    assert user == User(**row)
+    sql = compiled_sql(session)
+    assert sql.startswith("UPDATE auth_sessions SET refresh_token=")
+    assert "FROM users WHERE" in sql
+    assert "auth_sessions.expires_at > now()" in sql
+    assert "auth_sessions.user_email = users.email" in sql
+    assert "RETURNING users.email, users.hashed_password" in sql
+
+
+@pytest.mark.asyncio
+async def test_rotate_refresh_token_returns_none_for_unknown_token():
+    """Тест ротации несуществующего или истекшего токена."""
+    # Arrange
+    result = MagicMock()
+    result.one_or_none.return_value = None
+    repository = AuthSessionRepository(make_session(result))
+
+    # Act
+    user = await repository.rotate_refresh_token(
+        REFRESH_TOKEN, NEW_REFRESH_TOKEN, datetime.now(UTC)
+    )
+
+    # Assert
+    assert user is None
+
+
+@pytest.mark.asyncio
+async def test_delete_expired_deletes_bounded_batch_by_ctid():
+    """Тест удаления пачки истекших сессий по (tableoid, ctid)."""
+    # Arrange
+    result = MagicMock(rowcount=500)
+    session = make_session(result)
+    repository = AuthSessionRepository(session)
+
+    # Act
+    deleted = await repository.delete_expired(500)
+
+    # Assert
+    assert deleted == 500
+    sql = compiled_sql(session)
+    assert sql.startswith(
+        "DELETE FROM auth_sessions WHERE (tableoid, ctid) IN (SELECT tableoid, ctid"
+    )
+    assert "auth_sessions.expires_at < now()" in sql
+    assert "LIMIT %(batch_size)s FOR UPDATE SKIP LOCKED" in sql
+
+
+@pytest.mark.asyncio
+async def test_statements_are_built_once():
+    """Тест повторного использования заранее собранных запросов."""
+    # Arrange
+    result = MagicMock()
+    result.one_or_none.return_value = None
+    session = make_session(result)
+    repository = UserRepository(session)
+
+    # Act
+    await repository.find_by_email("a@example.com")
+    await repository.find_by_email("b@example.com")
+
+    # Assert
+    first, second = session.execute.await_args_list
+    assert first.args[0] is second.args[0]
+    assert first.args[1] == {"email": "a@example.com"}
+    assert second.args[1] == {"email": "b@example.com"}
@@ -0,0 +1,140 @@
+"""Тесты для проверки версии схемы базы данных при старте."""
+
+from unittest.mock import AsyncMock, MagicMock
+
+import pytest
+from alembic.script import ScriptDirectory
+from pydantic import ValidationError
+from sqlalchemy.exc import ProgrammingError
+
+from app.infrastructure.config.settings import Settings
+from app.infrastructure.database.schema import (
+    MIGRATIONS_DIR,
+    SchemaVersionError,
+    check_schema_version,
+    code_heads,
+)
+from app.infrastructure.monitoring.metrics import metrics
+
+MIGRATION = """
+revision = {revision!r}
+down_revision = {down_revision!r}
+branch_labels = None
+"""
+
+
+@pytest.fixture(autouse=True)
+def reset_metrics():
+    """Сбрасывает метрики между тестами."""
+    metrics.reset()
+    yield
+    metrics.reset()
+
+
+def make_engine(revisions=None, error=None) -> MagicMock:
+    """Создает движок, возвращающий заданные ревизии из alembic_version."""
+    result = MagicMock()
+    result.all.return_value = revisions or []
+    conn = MagicMock()
+    conn.scalars = AsyncMock(return_value=result, side_effect=error)
+    engine = MagicMock()
+    engine.connect.return_value.__aenter__ = AsyncMock(return_value=conn)
+    engine.connect.return_value.__aexit__ = AsyncMock(return_value=False)
+    return engine
+
+
+def test_code_heads_match_alembic():
+    """Тест совпадения головных ревизий с вычисленными alembic."""
+    # Arrange
+    script = ScriptDirectory(str(MIGRATIONS_DIR.parent))
+
+    # Act
+    heads = code_heads()
+
+    # Assert
+    assert heads == frozenset(script.get_heads())
+
+
+def test_code_heads_handle_branches_and_merges(tmp_path):
+    """Тест вычисления голов для ветвлений и слияний ревизий."""
+    # Arrange
+    migrations = {
+        "a": None,
+        "b": "a",
+        "c": "a",
+        "d": ("b", "c"),
+        "e": "d",
+        "f": "d",
+    }
+    for revision, down_revision in migrations.items():
+        (tmp_path / f"{revision}_migration.py").write_text(
+            MIGRATION.format(revision=revision, down_revision=down_revision)
+        )
+    (tmp_path / "__init__.py").write_text("")
+
+    # Act
+    heads = code_heads(tmp_path)
+
+    # Assert
+    assert heads == {"e", "f"}
+
+
+@pytest.mark.asyncio
+async def test_check_passes_on_current_schema():
+    """Тест успешной проверки, когда база на головной ревизии."""
+    # Arrange
+    engine = make_engine(revisions=list(code_heads()))
+
+    # Act
+    status = await check_schema_version(engine, "fail")
+
+    # Assert
+    assert status.is_current
+    summary = metrics.snapshot()["summaries"]["startup_schema_check_seconds"]
+    assert summary["count"] == 1
+
+
+@pytest.mark.asyncio
+async def test_check_fails_on_outdated_schema():
+    """Тест остановки старта, если миграции не применены."""
+    # Arrange
+    engine = make_engine(revisions=["d6bc8fec8cb8"])
+
+    # Act & Assert
+    with pytest.raises(SchemaVersionError, match="d6bc8fec8cb8"):
+        await check_schema_version(engine, "fail")
+
+
+@pytest.mark.asyncio
+async def test_check_treats_missing_version_table_as_empty():
+    """Тест расхождения, если таблицы alembic_version нет."""
+    # Arrange
+    engine = make_engine(error=ProgrammingError("SELECT", {}, Exception()))
+
+    # Act
+    status = await check_schema_version(engine, "warn")
+
+    # Assert
+    assert status.database == frozenset()
+    assert not status.is_current
+
+
+@pytest.mark.asyncio
+async def test_check_off_does_not_query_database():
+    """Тест отключенной проверки."""
+    # Arrange
+    engine = make_engine()
+
+    # Act
+    status = await check_schema_version(engine, "off")
+
+    # Assert
+    assert status is None
+    engine.connect.assert_not_called()
+
+
+def test_create_all_is_rejected_in_production():
+    """Тест запрета create_all в production."""
+    # Act & Assert
+    with pytest.raises(ValidationError, match="DB_CREATE_ALL"):
+        Settings(ALGORITHM="HS256", ENVIRONMENT="production", DB_CREATE_ALL=True)
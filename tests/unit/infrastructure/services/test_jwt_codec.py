@@ -0,0 +1,90 @@
+"""Тесты соответствия быстрого кодека HS256 библиотеке pyjwt."""
+
+import time
+from datetime import UTC, datetime, timedelta
+
+import jwt
+import pytest
+
+from app.infrastructure.services.jwt_codec import HS256Codec
+
+SECRET = "conformance-secret-key-with-32-bytes!"
+
+
+@pytest.fixture
+def codec() -> HS256Codec:
+    """Создает кодек с тестовым ключом."""
+    return HS256Codec(SECRET)
+
+
+def _future() -> int:
+    return int(time.time()) + 600
+
+
+def _past() -> int:
+    return int(time.time()) - 600
+
+
+PAYLOADS = [
+    {"sub": "test@example.com", "exp": datetime.now(UTC) + timedelta(minutes=5)},
+    {"sub": "юникод@example.com", "exp": _future(), "is_active": True},
+    {"sub": "test@example.com", "iat": int(time.time()), "jti": "abc"},
+    {"sub": "test@example.com", "nested": {"list": [1, 2.5, None, "x"]}},
+]
+
+
+@pytest.mark.parametrize("payload", PAYLOADS)
+def test_encode_matches_pyjwt(codec: HS256Codec, payload: dict):
+    """Тест: токены кодека побайтно совпадают с jwt.encode."""
+    assert codec.encode(payload) == jwt.encode(payload, SECRET, algorithm="HS256")
+
+
+@pytest.mark.parametrize("payload", PAYLOADS)
+def test_decode_matches_pyjwt(codec: HS256Codec, payload: dict):
+    """Тест: кодек и pyjwt одинаково декодируют корректные токены."""
+    token = jwt.encode(payload, SECRET, algorithm="HS256")
+    assert codec.decode(token) == jwt.decode(token, SECRET, algorithms=["HS256"])
+
+
+def _tampered_signature() -> str:
+    token = jwt.encode({"sub": "a"}, SECRET, algorithm="HS256")
+    return token[:-2] + ("AA" if not token.endswith("AA") else "BB")
+
+
+INVALID_TOKENS = {
+    "expired": lambda: jwt.encode({"exp": _past()}, SECRET, algorithm="HS256"),
+    "exp_now": lambda: jwt.encode({"exp": int(time.time())}, SECRET, algorithm="HS256"),
+    "exp_not_int": lambda: jwt.encode({"exp": "soon"}, SECRET, algorithm="HS256"),
+    "nbf_future": lambda: jwt.encode({"nbf": _future()}, SECRET, algorithm="HS256"),
+    "iat_future": lambda: jwt.encode({"iat": _future()}, SECRET, algorithm="HS256"),
+    "iat_not_int": lambda: jwt.encode({"iat": "now"}, SECRET, algorithm="HS256"),
+    "aud_unexpected": lambda: jwt.encode({"aud": "svc"}, SECRET, algorithm="HS256"),
+    "sub_not_str": lambda: jwt.encode({"sub": 1}, SECRET, algorithm="HS256"),
+    "jti_not_str": lambda: jwt.encode({"jti": 1}, SECRET, algorithm="HS256"),
+    "wrong_key": lambda: jwt.encode({"sub": "a"}, "other-key", algorithm="HS256"),
+    "tampered_signature": _tampered_signature,
+    "other_algorithm": lambda: jwt.encode({"sub": "a"}, SECRET, algorithm="HS512"),
+    "not_enough_segments": lambda: "abc.def",
+    "garbage": lambda: "not a token",
+    "payload_not_object": lambda: jwt.api_jws.encode(b"[1,2]", SECRET, "HS256"),
+}
+
+
+@pytest.mark.parametrize("case", sorted(INVALID_TOKENS))
+def test_decode_errors_match_pyjwt(codec: HS256Codec, case: str):
+    """Тест: кодек выбрасывает те же исключения, что и pyjwt."""
+    token = INVALID_TOKENS[case]()
+
+    with pytest.raises(jwt.PyJWTError) as expected:
+        jwt.decode(token, SECRET, algorithms=["HS256"])
+    with pytest.raises(jwt.PyJWTError) as actual:
+        codec.decode(token)
+
+    assert type(actual.value) is type(expected.value)
+    assert str(actual.value) == str(expected.value)
+
+
+def test_decode_falls_back_for_custom_header(codec: HS256Codec):
+    """Тест: токены с дополнительными полями заголовка проверяются через pyjwt."""
+    token = jwt.encode({"sub": "a"}, SECRET, algorithm="HS256", headers={"kid": "1"})
+    assert codec.decode(token) == {"sub": "a"}
@@ -0,0 +1,109 @@
+"""Тесты для асимметричной подписи JWT с ротацией ключей."""
+
+import jwt
+import pytest
+from cryptography.hazmat.primitives import serialization
+from cryptography.hazmat.primitives.asymmetric import ec, ed25519
+
+from app.infrastructure.services.jwt_keys import JWTKeyRing
+from app.infrastructure.services.token_service import TokenService
+
+
+def _write_key_pair(directory, kid: str, algorithm: str) -> tuple[str, str]:
+    """Генерирует пару ключей и возвращает пути к PEM-файлам."""
+    if algorithm == "EdDSA":
+        private_key = ed25519.Ed25519PrivateKey.generate()
+    else:
+        private_key = ec.generate_private_key(ec.SECP256R1())
+
+    private_path = directory / f"{kid}.pem"
+    public_path = directory / f"{kid}.pub.pem"
+    private_path.write_bytes(
+        private_key.private_bytes(
+            serialization.Encoding.PEM,
+            serialization.PrivateFormat.PKCS8,
+            serialization.NoEncryption(),
+        )
+    )
+    public_path.write_bytes(
+        private_key.public_key().public_bytes(
+            serialization.Encoding.PEM,
+            serialization.PublicFormat.SubjectPublicKeyInfo,
+        )
+    )
+    return str(private_path), str(public_path)
+
+
+@pytest.mark.parametrize("algorithm", ["EdDSA", "ES256"])
+def test_asymmetric_token_roundtrip(tmp_path, algorithm):
+    """Тест подписи токена активным ключом и проверки по kid."""
+    # Arrange
+    private_path, _ = _write_key_pair(tmp_path, "k1", algorithm)
+    key_ring = JWTKeyRing.from_files(algorithm, {"k1": private_path}, {}, "k1")
+    service = TokenService("secret", algorithm, key_ring=key_ring)
+
+    # Act
+    token = service.generate_access_token("test@example.com")
+    claims = service.decode_access_token(token)
+
+    # Assert
+    assert jwt.get_unverified_header(token)["kid"] == "k1"
+    assert claims["sub"] == "test@example.com"
+    assert [key["kid"] for key in key_ring.jwks["keys"]] == ["k1"]
+
+
+def test_key_rotation_keeps_old_tokens_valid(tmp_path):
+    """Тест ротации: токены старого ключа проверяются после смены активного."""
+    # Arrange
+    old_private, old_public = _write_key_pair(tmp_path, "old", "EdDSA")
+    new_private, _ = _write_key_pair(tmp_path, "new", "EdDSA")
+    old_service = TokenService(
+        "secret",
+        "EdDSA",
+        key_ring=JWTKeyRing.from_files("EdDSA", {"old": old_private}, {}, "old"),
+    )
+    rotated_ring = JWTKeyRing.from_files(
+        "EdDSA", {"new": new_private}, {"old": old_public}, "new"
+    )
+    new_service = TokenService("secret", "EdDSA", key_ring=rotated_ring)
+
+    # Act
+    old_token = old_service.generate_access_token("test@example.com")
+
+    # Assert
+    assert new_service.decode_access_token(old_token)["sub"] == "test@example.com"
+    assert {key["kid"] for key in rotated_ring.jwks["keys"]} == {"new", "old"}
+
+
+def test_unknown_kid_is_rejected(tmp_path):
+    """Тест отклонения токена с неизвестным kid."""
+    # Arrange
+    private_a, _ = _write_key_pair(tmp_path, "a", "EdDSA")
+    private_b, _ = _write_key_pair(tmp_path, "b", "EdDSA")
+    service_a = TokenService(
+        "secret",
+        "EdDSA",
+        key_ring=JWTKeyRing.from_files("EdDSA", {"a": private_a}, {}, "a"),
+    )
+    service_b = TokenService(
+        "secret",
+        "EdDSA",
+        key_ring=JWTKeyRing.from_files("EdDSA", {"b": private_b}, {}, "b"),
+    )
+
+    # Act & Assert
+    with pytest.raises(jwt.InvalidKeyError):
+        service_b.decode_access_token(service_a.generate_access_token("a@example.com"))
+
+
+def test_symmetric_algorithm_has_empty_jwks():
+    """Тест: для HS256 JWKS пустой, а набор ключей не используется."""
+    # Arrange
+    key_ring = JWTKeyRing.from_files("HS256", {}, {}, None)
+
+    # Act
+    service = TokenService("secret", "HS256", key_ring=key_ring)
+
+    # Assert
+    assert key_ring.jwks == {"keys": []}
+    assert service.key_ring is None
@@ -0,0 +1,121 @@
+"""Тесты для сервиса хэширования паролей."""
+
+import asyncio
+
+import pytest
+
+from app.domain.exceptions import ServiceUnavailableException
+from app.infrastructure.services.password_hasher import PasswordHasher
+
+HASH_12 = "$2b$12$G3dK8zD2S3zr54VYpu8RqejzRVkVKo8tCmeCDp3399dxYHA0KBjAG"
+
+
+@pytest.fixture
+def password_hasher():
+    """Создает сервис хэширования с одним процессом."""
+    hasher = PasswordHasher(max_workers=1, max_queue=4)
+    yield hasher
+    hasher.shutdown()
+
+
+@pytest.mark.asyncio
+async def test_hash_and_verify(password_hasher: PasswordHasher):
+    """Тест хэширования и проверки пароля в пуле процессов."""
+    # Act
+    hashed_password = await password_hasher.hash("password123")
+
+    # Assert
+    assert hashed_password != "password123"
+    assert await password_hasher.verify("password123", hashed_password)
+    assert not await password_hasher.verify("wrong_password", hashed_password)
+    assert password_hasher.pending == 0
+
+
+@pytest.mark.asyncio
+async def test_hash_queue_overflow():
+    """Тест отклонения задачи при переполнении очереди."""
+    # Arrange
+    hasher = PasswordHasher(max_workers=1, max_queue=0)
+
+    # Act & Assert
+    try:
+        with pytest.raises(ServiceUnavailableException):
+            await hasher.hash("password123")
+    finally:
+        hasher.shutdown()
+
+
+@pytest.mark.asyncio
+async def test_calibrate_respects_budget(password_hasher: PasswordHasher):
+    """Тест калибровки: при нулевом бюджете выбирается минимальная стоимость."""
+    # Act
+    rounds = await password_hasher.calibrate(budget_ms=0, min_rounds=4, max_rounds=6)
+    hashed_password = await password_hasher.hash("password123")
+
+    # Assert
+    assert rounds == 4
+    assert password_hasher.rounds == 4
+    assert hashed_password.startswith("$2b$04$")
+    assert not password_hasher.needs_update(hashed_password)
+    assert not password_hasher.needs_update(hashed_password.replace("$04$", "$12$"))
+
+
+def test_needs_update_only_raises_cost(password_hasher: PasswordHasher):
+    """Тест того, что перехэширование не понижает стоимость bcrypt."""
+    # Arrange
+    password_hasher.set_rounds(12)
+
+    # Act & Assert
+    assert password_hasher.rounds == 12
+    assert not password_hasher.needs_update(HASH_12)
+    assert not password_hasher.needs_update(HASH_12.replace("$12$", "$13$"))
+    assert password_hasher.needs_update(HASH_12.replace("$12$", "$10$"))
+
+
+@pytest.mark.asyncio
+async def test_hash_many(password_hasher: PasswordHasher):
+    """Тест хэширования пачки паролей частями."""
+    # Arrange
+    await password_hasher.calibrate(budget_ms=0, min_rounds=4, max_rounds=4)
+    passwords = [f"password-{n}" for n in range(5)]
+
+    # Act
+    hashes = await password_hasher.hash_many(passwords, chunk_size=2)
+
+    # Assert
+    assert len(hashes) == 5
+    assert all(h.startswith("$2b$04$") for h in hashes)
+    assert await password_hasher.verify("password-4", hashes[4])
+    assert password_hasher.pending == 0
+
+
+@pytest.mark.asyncio
+async def test_hash_many_leaves_worker_for_interactive_calls():
+    """Тест общего для всех импортов лимита процессов с резервом под вход."""
+    # Arrange
+    hasher = PasswordHasher(max_workers=3)
+    running = peak = 0
+
+    async def fake_run(func, *args):
+        nonlocal running, peak
+        running += 1
+        peak = max(peak, running)
+        await asyncio.sleep(0.01)
+        running -= 1
+        return args[0]
+
+    hasher._run = fake_run
+    passwords = [f"password-{n}" for n in range(8)]
+
+    # Act
+    try:
+        results = await asyncio.gather(
+            hasher.hash_many(passwords, chunk_size=1),
+            hasher.hash_many(passwords, chunk_size=1),
+        )
+    finally:
+        hasher.shutdown()
+
+    # Assert
+    assert results == [passwords, passwords]
+    assert peak == 2
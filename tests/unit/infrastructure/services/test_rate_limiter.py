@@ -0,0 +1,102 @@
+"""Тесты для ограничителя частоты запросов."""
+
+import pytest
+
+from app.domain.exceptions import RateLimitException
+from app.infrastructure.services.rate_limiter import (
+    InMemoryRateLimitBackend,
+    RateLimiter,
+)
+
+
+class FakeClock:
+    """Управляемые часы для тестов."""
+
+    def __init__(self, now: float = 1000.0):
+        self.now = now
+
+    def __call__(self) -> float:
+        return self.now
+
+
+@pytest.mark.asyncio
+async def test_backend_rejects_over_limit():
+    """Тест отклонения запросов сверх лимита в пределах окна."""
+    # Arrange
+    clock = FakeClock()
+    backend = InMemoryRateLimitBackend(clock=clock)
+
+    # Act
+    results = [await backend.hit("key", limit=3, window=60) for _ in range(4)]
+
+    # Assert
+    assert results[:3] == [0, 0, 0]
+    assert results[3] > 0
+
+
+@pytest.mark.asyncio
+async def test_backend_sliding_window_and_sweep():
+    """Тест сдвига окна и удаления устаревших ключей."""
+    # Arrange
+    clock = FakeClock(now=1200.0)
+    backend = InMemoryRateLimitBackend(sweep_interval=10, clock=clock)
+    for _ in range(2):
+        await backend.hit("key", limit=2, window=60)
+
+    # Act & Assert: в середине следующего окна учитывается половина прошлого
+    clock.now += 90
+    assert await backend.hit("key", limit=2, window=60) == 0
+    assert await backend.hit("key", limit=2, window=60) > 0
+
+    # Через два окна ключ удаляется чисткой
+    clock.now += 180
+    await backend.hit("other", limit=2, window=60)
+    assert len(backend) == 1
+
+
+@pytest.mark.asyncio
+async def test_rate_limiter_limits_by_email():
+    """Тест ограничения по email независимо от IP."""
+    # Arrange
+    limiter = RateLimiter(
+        InMemoryRateLimitBackend(),
+        rules={"login:ip": "100/60", "login:email": "2/60"},
+    )
+
+    # Act & Assert
+    await limiter.check("login", ip="10.0.0.1", email="User@example.com")
+    await limiter.check("login", ip="10.0.0.2", email="user@example.com")
+    with pytest.raises(RateLimitException) as exc_info:
+        await limiter.check("login", ip="10.0.0.3", email="user@example.com")
+
+    assert exc_info.value.retry_after > 0
+    await limiter.check("login", ip="10.0.0.3", email="other@example.com")
+
+
+@pytest.mark.asyncio
+async def test_rate_limiter_disabled():
+    """Тест отключенного ограничителя."""
+    # Arrange
+    limiter = RateLimiter(
+        InMemoryRateLimitBackend(), rules={"login:ip": "1/60"}, enabled=False
+    )
+
+    # Act & Assert
+    for _ in range(3):
+        await limiter.check("login", ip="10.0.0.1")
+
+
+@pytest.mark.asyncio
+async def test_limiter_configure_replaces_rules():
+    """Тест замены правил после перечитывания настроек."""
+    # Arrange
+    limiter = RateLimiter(InMemoryRateLimitBackend(), {"login:ip": "1/60"})
+    await limiter.check("login", ip="1.2.3.4")
+
+    # Act
+    limiter.configure({"login:ip": "1/60"}, enabled=False)
+
+    # Assert
+    await limiter.check("login", ip="1.2.3.4")
+    limiter.configure({"login:ip": "5/60"})
+    await limiter.check("login", ip="1.2.3.4")
@@ -0,0 +1,69 @@
+"""Тесты для фоновой задачи удаления истекших сессий."""
+
+import asyncio
+from unittest.mock import AsyncMock
+
+import pytest
+
+from app.infrastructure.monitoring.metrics import metrics
+from app.infrastructure.services.session_reaper import SessionReaper
+
+
+@pytest.fixture(autouse=True)
+def reset_metrics():
+    """Сбрасывает метрики между тестами."""
+    metrics.reset()
+    yield
+    metrics.reset()
+
+
+@pytest.mark.asyncio
+async def test_run_once_reports_purged_rows():
+    """Тест публикации числа удаленных строк."""
+    # Arrange
+    reaper = SessionReaper(AsyncMock(return_value=42))
+
+    # Act
+    await reaper.run_once()
+    await reaper.run_once()
+
+    # Assert
+    assert metrics.get("auth_sessions_purged") == 84
+    assert metrics.get("auth_sessions_purged_last_run") == 42
+    assert metrics.snapshot()["summaries"]["session_reaper_run_seconds"]["count"] == 2
+
+
+def test_next_delay_is_jittered():
+    """Тест случайного сдвига интервала между запусками."""
+    # Arrange
+    reaper = SessionReaper(AsyncMock(), interval=300, jitter=60, rng=lambda a, b: b)
+
+    # Act & Assert
+    assert reaper.next_delay() == 360
+
+
+@pytest.mark.asyncio
+async def test_background_loop_survives_errors():
+    """Тест продолжения работы после ошибки запуска."""
+    # Arrange
+    calls = 0
+
+    async def purge_once():
+        nonlocal calls
+        calls += 1
+        if calls == 1:
+            raise RuntimeError("db is down")
+        return 1
+
+    purge = AsyncMock(side_effect=purge_once)
+    reaper = SessionReaper(purge, interval=0, jitter=0)
+
+    # Act
+    reaper.start()
+    for _ in range(10):
+        await asyncio.sleep(0)
+    await reaper.stop()
+
+    # Assert
+    assert purge.await_count >= 2
+    assert metrics.get("session_reaper_errors") == 1
@@ -0,0 +1,63 @@
+"""Тесты для LRU-кэша проверенных access-токенов."""
+
+from app.infrastructure.services.token_cache import LRUTokenCache
+
+
+class FakeClock:
+    """Управляемые часы для тестов."""
+
+    def __init__(self, now: float = 1000.0):
+        self.now = now
+
+    def __call__(self) -> float:
+        return self.now
+
+
+def test_cache_hit_until_expiration():
+    """Тест попадания в кэш до истечения срока токена."""
+    # Arrange
+    clock = FakeClock()
+    cache = LRUTokenCache(max_size=10, clock=clock)
+    claims = {"sub": "test@example.com", "exp": 1060}
+
+    # Act
+    cache.put("token", claims)
+    hit = cache.get("token")
+    clock.now = 1060
+    expired = cache.get("token")
+
+    # Assert
+    assert hit == claims
+    assert expired is None
+    assert (cache.hits, cache.misses) == (1, 1)
+    assert len(cache) == 0
+
+
+def test_cache_evicts_least_recently_used():
+    """Тест вытеснения давно не использованных записей."""
+    # Arrange
+    cache = LRUTokenCache(max_size=2, clock=FakeClock())
+    for token in ("a", "b"):
+        cache.put(token, {"sub": token, "exp": 2000})
+
+    # Act
+    cache.get("a")
+    cache.put("c", {"sub": "c", "exp": 2000})
+
+    # Assert
+    assert cache.get("b") is None
+    assert cache.get("a") is not None
+    assert cache.get("c") is not None
+    assert cache.evictions == 1
+
+
+def test_cache_skips_tokens_without_exp():
+    """Тест: токены без exp не кэшируются."""
+    # Arrange
+    cache = LRUTokenCache(max_size=10, clock=FakeClock())
+
+    # Act
+    cache.put("token", {"sub": "test@example.com"})
+
+    # Assert
+    assert cache.get("token") is None
@@ -0,0 +1,39 @@
+"""Тесты для сервиса работы с токенами."""
+
+from app.infrastructure.services.token_service import TokenService
+
+
+def test_access_token_roundtrip(mock_user):
+    """Тест генерации и декодирования access token."""
+    # Arrange
+    service = TokenService("secret")
+
+    # Act
+    claims = service.decode_access_token(
+        service.generate_access_token(mock_user.email, user=mock_user)
+    )
+
+    # Assert
+    assert claims["sub"] == mock_user.email
+    assert "is_active" not in claims
+    assert service.user_from_claims(claims) is None
+
+
+def test_access_token_embeds_user_claims(mock_user):
+    """Тест встраивания данных пользователя в access token."""
+    # Arrange
+    service = TokenService("secret", embed_user_claims=True)
+
+    # Act
+    claims = service.decode_access_token(
+        service.generate_access_token(mock_user.email, user=mock_user)
+    )
+    user = service.user_from_claims(claims)
+
+    # Assert
+    assert user.email == mock_user.email
+    assert user.is_active == mock_user.is_active
+    assert user.is_verified == mock_user.is_verified
+    assert user.created_at == mock_user.created_at
+    assert user.updated_at == mock_user.updated_at
+    assert user.hashed_password == ""
@@ -0,0 +1,85 @@
+"""Тесты для потокового разбора файлов импорта пользователей."""
+
+import pytest
+
+from app.infrastructure.services.user_import_parser import iter_lines, parse_users
+
+
+async def chunks(*items: bytes):
+    """Асинхронный поток байтов."""
+    for item in items:
+        yield item
+
+
+async def collect(iterator) -> list:
+    """Собирает асинхронный итератор в список."""
+    return [item async for item in iterator]
+
+
+@pytest.mark.asyncio
+async def test_iter_lines_across_chunk_boundaries():
+    """Тест разбиения на строки при разрыве строки и символа между чанками."""
+    # Arrange
+    data = "email\r\nпользователь@example.com\nlast".encode()
+
+    # Act
+    lines = await collect(iter_lines(chunks(data[:9], data[9:16], data[16:])))
+
+    # Assert
+    assert lines == ["email", "пользователь@example.com", "last"]
+
+
+@pytest.mark.asyncio
+async def test_parse_csv():
+    """Тест разбора CSV с заголовком и необязательными столбцами."""
+    # Arrange
+    data = (
+        b"email,password,is_verified\n"
+        b"a@example.com,password-a,true\n"
+        b"\n"
+        b"b@example.com,password-b\n"
+        b"c@example.com,password-c,maybe\n"
+    )
+
+    # Act
+    rows = await collect(parse_users(chunks(data), "csv"))
+
+    # Assert
+    assert [(row.line, row.email, row.is_verified) for row in rows[:1]] == [
+        (2, "a@example.com", True)
+    ]
+    assert rows[0].password == "password-a"
+    assert rows[1].error == "ожидалось 3 столбцов, получено 2"
+    assert "логическое значение" in rows[2].error
+
+
+@pytest.mark.asyncio
+async def test_parse_csv_requires_password_column():
+    """Тест отказа при заголовке без столбца пароля."""
+    # Act
+    rows = await collect(parse_users(chunks(b"email\na@example.com\n"), "csv"))
+
+    # Assert
+    assert len(rows) == 1
+    assert rows[0].error is not None
+
+
+@pytest.mark.asyncio
+async def test_parse_ndjson():
+    """Тест разбора NDJSON с некорректными строками."""
+    # Arrange
+    data = (
+        b'{"email": "a@example.com", "hashed_password": "hash", "is_active": false}\n'
+        b"not json\n"
+        b"[1, 2]\n"
+    )
+
+    # Act
+    rows = await collect(parse_users(chunks(data), "ndjson"))
+
+    # Assert
+    assert rows[0].email == "a@example.com"
+    assert rows[0].hashed_password == "hash"
+    assert rows[0].is_active is False
+    assert rows[1].error.startswith("некорректный JSON")
+    assert rows[2].error == "ожидался JSON-объект"
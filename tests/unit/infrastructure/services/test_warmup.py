@@ -0,0 +1,118 @@
+"""Тесты для прогрева воркера после старта."""
+
+from unittest.mock import AsyncMock, MagicMock
+
+import pytest
+
+from app.infrastructure.monitoring.metrics import metrics
+from app.infrastructure.services.token_service import TokenService
+from app.infrastructure.services.warmup import (
+    WARMUP_EMAIL,
+    WARMUP_TOKEN,
+    StartupWarmup,
+    prime_repository_statements,
+    prime_token_service,
+)
+
+
+@pytest.fixture(autouse=True)
+def reset_metrics():
+    """Сбрасывает метрики между тестами."""
+    metrics.reset()
+    yield
+    metrics.reset()
+
+
+@pytest.mark.asyncio
+async def test_warmup_runs_steps_and_becomes_ready():
+    """Тест выполнения синхронных и асинхронных шагов и готовности."""
+    # Arrange
+    warmup = StartupWarmup()
+    sync_step = MagicMock()
+    async_step = AsyncMock()
+    warmup.add("sync", sync_step)
+    warmup.add("async", async_step)
+
+    # Act
+    assert not warmup.ready
+    warmup.start()
+    await warmup.wait()
+
+    # Assert
+    assert warmup.ready
+    sync_step.assert_called_once()
+    async_step.assert_awaited_once()
+    assert set(warmup.timings) == {"sync", "async"}
+    summaries = metrics.snapshot()["summaries"]
+    assert summaries["startup_warmup_seconds{step=async}"]["count"] == 1
+    assert metrics.get("startup_warmup_total_seconds") > 0
+
+
+@pytest.mark.asyncio
+async def test_failed_step_does_not_block_readiness():
+    """Тест того, что ошибка шага не мешает остальным шагам и готовности."""
+    # Arrange
+    warmup = StartupWarmup()
+    next_step = MagicMock()
+    warmup.add("broken", MagicMock(side_effect=RuntimeError("boom")))
+    warmup.add("next", next_step)
+
+    # Act
+    await warmup.run()
+
+    # Assert
+    assert warmup.ready
+    next_step.assert_called_once()
+    assert metrics.get("startup_warmup_errors", step="broken") == 1
+
+
+@pytest.mark.asyncio
+async def test_disabled_warmup_is_ready_without_steps():
+    """Тест отключенного прогрева."""
+    # Arrange
+    warmup = StartupWarmup(enabled=False)
+    step = MagicMock()
+    warmup.add("step", step)
+
+    # Act
+    await warmup.run()
+
+    # Assert
+    assert warmup.ready
+    step.assert_not_called()
+
+
+@pytest.mark.asyncio
+async def test_prime_repository_statements_rolls_back():
+    """Тест выполнения запросов по несуществующим ключам с откатом."""
+    # Arrange
+    uow = MagicMock(
+        users=AsyncMock(),
+        auth_sessions=AsyncMock(),
+        rollback=AsyncMock(),
+        release=AsyncMock(),
+    )
+    uow.auth_sessions.pop_by_refresh_token.side_effect = RuntimeError("db")
+
+    # Act
+    with pytest.raises(RuntimeError):
+        await prime_repository_statements(lambda: uow)
+
+    # Assert
+    uow.users.find_by_email.assert_awaited_once_with(WARMUP_EMAIL)
+    uow.auth_sessions.find_by_refresh_token.assert_awaited_once_with(WARMUP_TOKEN)
+    uow.rollback.assert_awaited_once()
+    uow.release.assert_awaited_once()
+
+
+def test_prime_token_service_round_trip():
+    """Тест выпуска и проверки токена при прогреве."""
+    # Arrange
+    token_service = MagicMock(wraps=TokenService("secret", embed_user_claims=True))
+
+    # Act
+    prime_token_service(token_service)
+
+    # Assert
+    token_service.generate_access_token.assert_called_once()
+    token_service.decode_access_token.assert_called_once()
@@ -0,0 +1,87 @@
+"""Тесты для эндпоинта импорта пользователей администратором."""
+
+import asyncio
+import json
+from unittest.mock import AsyncMock, MagicMock
+
+import httpx
+import pytest
+from dishka import Provider, Scope, make_async_container
+from dishka.integrations.fastapi import setup_dishka
+from fastapi import FastAPI
+
+from app.application.use_cases.users.import_users import ImportUsersUseCase
+from app.domain.entities.user import User
+from app.infrastructure.config.settings import Settings
+from app.presentation.api.private.admin import router
+
+ADMIN = "admin@example.com"
+HASH = "$2b$04$" + "a" * 53
+ROWS = 20
+
+
+def make_app(loader: MagicMock) -> FastAPI:
+    """Приложение с роутером администратора и импортом в мок загрузчика."""
+    provider = Provider(scope=Scope.APP)
+    provider.provide(
+        lambda: Settings(ALGORITHM="HS256", ADMIN_EMAILS=[ADMIN]), provides=Settings
+    )
+    provider.provide(
+        lambda: User(email=ADMIN, hashed_password=""),
+        provides=User,
+        scope=Scope.REQUEST,
+    )
+    provider.provide(
+        lambda: ImportUsersUseCase(
+            loader, MagicMock(hash_many=AsyncMock(return_value=[])), batch_size=7
+        ),
+        provides=ImportUsersUseCase,
+        scope=Scope.REQUEST,
+    )
+    app = FastAPI()
+    setup_dishka(make_async_container(provider), app)
+    app.include_router(router, prefix="/admin")
+    return app
+
+
+@pytest.mark.asyncio
+async def test_import_reads_whole_body_sent_in_chunks():
+    """Тест импорта тела, пришедшего несколькими сообщениями ASGI."""
+    # Arrange
+    loader = MagicMock(load=AsyncMock(return_value=[]))
+    lines = [
+        json.dumps({"email": f"user{n}@example.com", "hashed_password": HASH})
+        for n in range(ROWS)
+    ]
+    body = ("\n".join(lines) + "\n").encode()
+
+    async def chunks():
+        # Границы частей не совпадают с границами строк
+        for start in range(0, len(body), 37):
+            yield body[start : start + 37]
+
+    transport = httpx.ASGITransport(app=make_app(loader))
+
+    # Act
+    async with httpx.AsyncClient(transport=transport, base_url="http://test") as c:
+        # Потерянная часть тела оставила бы разбор ждать вечно
+        response = await asyncio.wait_for(
+            c.post(
+                "/admin/users/import",
+                content=chunks(),
+                headers={"content-type": "application/x-ndjson"},
+            ),
+            timeout=5,
+        )
+
+    # Assert
+    assert response.status_code == 200
+    report = json.loads(response.text.splitlines()[-1])
+    assert report["done"] is True
+    assert (report["processed"], report["imported"], report["invalid"]) == (
+        ROWS,
+        ROWS,
+        0,
+    )
+    loaded = [user.email for call in loader.load.await_args_list for user in call[0][0]]
+    assert loaded == [f"user{n}@example.com" for n in range(ROWS)]
@@ -0,0 +1,57 @@
+"""Тесты для эндпоинта /metrics."""
+
+import pytest
+from dishka import Provider, Scope, make_async_container
+from dishka.integrations.fastapi import setup_dishka
+from fastapi import FastAPI
+from fastapi.testclient import TestClient
+
+from app.domain.entities.user import User
+from app.infrastructure.config.settings import Settings
+from app.presentation.exception_handlers import register_exception_handlers
+from app.presentation.metrics import register_metrics_endpoint
+
+ADMIN = "admin@example.com"
+
+
+def make_client(mode: str, email: str = ADMIN) -> TestClient:
+    """Создает приложение с /metrics и текущим пользователем email."""
+    provider = Provider()
+    provider.provide(
+        lambda: Settings(ALGORITHM="HS256", ADMIN_EMAILS=[ADMIN]),
+        provides=Settings,
+        scope=Scope.APP,
+    )
+    provider.provide(
+        lambda: User(email=email, hashed_password=""),
+        provides=User,
+        scope=Scope.REQUEST,
+    )
+    app = FastAPI()
+    setup_dishka(make_async_container(provider), app)
+    register_exception_handlers(app)
+    register_metrics_endpoint(app, mode)
+    return TestClient(app)
+
+
+@pytest.mark.parametrize(
+    ("mode", "email", "expected"),
+    [
+        ("admin", ADMIN, 200),
+        ("admin", "user@example.com", 403),
+        ("public", "user@example.com", 200),
+        ("off", ADMIN, 404),
+    ],
+)
+def test_metrics_access_follows_mode(mode, email, expected):
+    """Тест доступа к /metrics в режимах admin, public и off."""
+    # Arrange
+    client = make_client(mode, email)
+
+    # Act
+    response = client.get("/metrics")
+
+    # Assert
+    assert response.status_code == expected
+    if expected == 200:
+        assert "counters" in response.json()
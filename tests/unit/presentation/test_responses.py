@@ -0,0 +1,57 @@
+"""Тесты для быстрой сериализации JSON-ответов."""
+
+from dataclasses import asdict
+from datetime import UTC, datetime, timedelta, timezone
+from uuid import uuid4
+
+import pytest
+from fastapi.encoders import jsonable_encoder
+from fastapi.responses import JSONResponse
+
+from app.domain.entities.auth import Token
+from app.domain.entities.user import User
+from app.presentation.responses import FastJSONResponse
+from app.presentation.schemas.auth import TokenResponse, dump_token_response
+from app.presentation.schemas.user import UserResponse, dump_user_response
+
+
+@pytest.mark.parametrize(
+    "created_at",
+    [
+        datetime(2026, 10, 18, 12, 0, tzinfo=UTC),
+        datetime(2026, 10, 18, 12, 0, 0, 123, tzinfo=UTC),
+        datetime(2026, 10, 18, 12, 0, tzinfo=timezone(timedelta(hours=3))),
+        datetime(2026, 10, 18, 12, 0),
+        None,
+    ],
+)
+def test_user_response_matches_pydantic_serialization(created_at):
+    """Тест побайтного совпадения /me с сериализацией через UserResponse."""
+    # Arrange
+    user = User(
+        email="пользователь@example.com",
+        hashed_password="hash",
+        created_at=created_at,
+        updated_at=datetime(2026, 10, 19, tzinfo=UTC),
+    )
+    expected = JSONResponse(jsonable_encoder(UserResponse(**asdict(user)))).body
+
+    # Act
+    body = FastJSONResponse(dump_user_response(user)).body
+
+    # Assert
+    assert body == expected
+    assert dump_user_response(user).keys() == UserResponse.model_fields.keys()
+
+
+def test_token_response_matches_pydantic_serialization():
+    """Тест побайтного совпадения /login и /refresh с TokenResponse."""
+    # Arrange
+    token = Token(access_token="header.payload.signature", refresh_token=uuid4())
+    expected = JSONResponse(TokenResponse(**asdict(token)).model_dump(mode="json")).body
+
+    # Act
+    body = FastJSONResponse(dump_token_response(token)).body
+
+    # Assert
+    assert body == expected